@@ -0,0 +1,88 @@
+# benchmarks/bench_keying.py
+"""
+Compara el borrado de fondo vectorizado (utils.helpers.key_background) con el
+bucle get_at/set_at que se usaba antes, en los tamaños de sprite de settings.py.
+
+Uso:
+    python -m benchmarks.bench_keying [--repeat N]
+"""
+import os
+import sys
+import time
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from settings import (
+    PLAYER_SIZE, UPGRADE_ICON_SIZE,
+    ZOMBIE_COMMON_SIZE, ZOMBIE_FAST_SIZE, ZOMBIE_TANK_SIZE, ZOMBIE_BOSS_SIZE,
+)
+from utils.helpers import load_image_safe, key_background
+
+# (nombre, imagen, tamaño)
+CASES = [
+    ("bullet", "weapons/bullet.png", 24),
+    ("cursor", "ui/cursor_game.png", 32),
+    ("impact", "weapons/impact.png", 50),
+    ("zombie_fast", "zombie/common/common_frente.png", ZOMBIE_FAST_SIZE),
+    ("upgrade", "upgrades/balas.png", UPGRADE_ICON_SIZE),
+    ("player", "player/player_frente.png", PLAYER_SIZE),
+    ("zombie_common", "zombie/common/common_frente.png", ZOMBIE_COMMON_SIZE),
+    ("zombie_tank", "zombie/common/common_frente.png", ZOMBIE_TANK_SIZE),
+    ("zombie_boss", "zombie/common/common_frente.png", ZOMBIE_BOSS_SIZE),
+]
+
+
+def legacy_key(image, threshold=200, alpha_cutoff=0):
+    """Implementación anterior (píxel a píxel), conservada como referencia."""
+    image = image.copy()
+    clean = pygame.Surface(image.get_size(), pygame.SRCALPHA)
+    image.lock()
+    for x in range(image.get_width()):
+        for y in range(image.get_height()):
+            r, g, b, a = image.get_at((x, y))
+            if (r + g + b) / 3 > threshold or a < alpha_cutoff:
+                image.set_at((x, y), (0, 0, 0, 0))
+    image.unlock()
+    clean.blit(image, (0, 0))
+    return clean
+
+
+def _best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    print(f"{'sprite':<15}{'size':>9}{'legacy ms':>12}{'numpy ms':>11}{'speedup':>10}  same")
+    for name, path, size in CASES:
+        src = load_image_safe(path)
+        if src is None:
+            continue
+        img = pygame.transform.scale(src, (size, size))
+
+        t_old = _best_of(lambda: legacy_key(img), args.repeat)
+        t_new = _best_of(lambda: key_background(img), args.repeat)
+
+        same = pygame.image.tobytes(legacy_key(img), "RGBA") == pygame.image.tobytes(key_background(img), "RGBA")
+        print(f"{name:<15}{size:>4}x{size:<4}{t_old * 1000:>12.2f}{t_new * 1000:>11.3f}{t_old / t_new:>9.1f}x  {same}")
+
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,328 @@
+# benchmarks/scenarios.py
+"""
+Escenarios de rendimiento para Game.update, Game.draw, HUD.draw y MiniMap.draw.
+
+Cada escenario carga los recursos como la pantalla de carga (Game.load_resources),
+prepara un estado con las clases reales del juego (modo headless),
+mide cada fase por frame (media, p95, p99 en ms), mide la memoria asignada por
+fase con tracemalloc en una pasada aparte y guarda todo en JSON para comparar
+revisiones.
+
+Cada frame es un Game.update y un Game.draw, como en el juego: las fases salen
+de las etapas del profiler (core/profiler.py) y no se solapan. "draw" es el
+mundo y los menús; el HUD y el minimapa (que Game.draw dibuja dentro) van
+aparte en "hud" y "minimap".
+
+Uso:
+    python -m benchmarks.scenarios                      # todos los escenarios
+    python -m benchmarks.scenarios -s wave_1 -s corpses_200 --frames 600
+    python -m benchmarks.scenarios --out bench.json
+    python -m benchmarks.scenarios --compare old.json new.json
+"""
+import os
+import io
+import sys
+import json
+import math
+import random
+import platform
+import argparse
+import datetime
+import contextlib
+import subprocess
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import numpy as np
+from settings import SIM_TICK_RATE, UPGRADE_FALL_SPEED
+from core.profiler import UPDATE_STAGES, DRAW_STAGES, STAGES
+
+DT = 1.0 / SIM_TICK_RATE
+PHASES = ("update", "draw", "hud", "minimap")
+
+# Fase del benchmark de cada etapa del profiler
+STAGE_PHASE = {stage: "update" for stage in UPDATE_STAGES}
+STAGE_PHASE.update({stage: "draw" for stage in DRAW_STAGES})
+STAGE_PHASE.update(hud="hud", minimap="minimap")
+PHASE_COLUMNS = {p: [i for i, stage in enumerate(STAGES) if STAGE_PHASE[stage] == p] for p in PHASES}
+
+
+# ===================================================
+# PREPARACIÓN DE ESCENARIOS
+# ===================================================
+
+def _ring_positions(center, count, min_r, max_r, rng):
+    cx, cy = center
+    for _ in range(count):
+        a = rng.uniform(0, 2 * math.pi)
+        r = rng.uniform(min_r, max_r)
+        yield (cx + math.cos(a) * r, cy + math.sin(a) * r)
+
+
+def _spawn_zombies(game, count, ztype=None, near=False, min_r=300, max_r=2000):
+    """Crea zombies con el nivel/rareza del Spawner para la ola actual."""
+    from entities.zombie import Zombie
+    rng = random.Random(1234)
+    spawner = game.spawner
+    center = (game.player.pos.x, game.player.pos.y)
+    positions = _ring_positions(center, count, min_r, max_r if near else 2800, rng)
+    for pos in positions:
+        z = Zombie(pos, ztype=ztype or spawner._choose_type(),
+                   level=spawner._choose_level_for_wave(), rarity=spawner.choose_rarity())
+        game.zombies.add(z)
+
+
+def setup_wave_1(game):
+    game.spawner.start_next_wave()
+
+
+def setup_wave_30_horde(game):
+    game.spawner.current_wave = 29
+    game.spawner.start_next_wave()
+    _spawn_zombies(game, 500)
+
+
+def setup_firing_into_crowd(game):
+    from core.input import AutoAimInput
+    _spawn_zombies(game, 200, ztype="tank", near=True, min_r=200, max_r=700)
+    weapon = game.player.weapon
+    weapon.apply_fire_rate_bonus(1200)  # se limita a 1200 RPM
+    game.input = AutoAimInput()
+
+
+def setup_boss_death(game):
+    from entities.zombie import Zombie
+    from core.upgrade import Upgrade
+    boss = Zombie((game.player.pos.x + 250, game.player.pos.y), ztype="boss", level=10)
+    game.zombies.add(boss)
+    game.draw()  # sincroniza rect/dirección del jefe antes de morir
+    boss.take_damage(float("inf"), game)
+    rng = random.Random(99)
+    while len(game.upgrades) < 10:
+        u = Upgrade.acquire(Upgrade.select_random_upgrade(), boss.rect.center)
+        u.start_fall(rng.uniform(0, 2 * math.pi), UPGRADE_FALL_SPEED * 0.7, 60)
+        game.upgrades.add(u)
+
+
+def setup_corpses(game):
+    _spawn_zombies(game, 200, ztype="common", near=True, min_r=50, max_r=600)
+    for z in list(game.zombies):
+        z.take_damage(float("inf"), game)
+
+
+SCENARIOS = {
+    "wave_1": ("Primera ola desde el inicio", setup_wave_1),
+    "wave_30_horde_500": ("Ola 30 con 500 zombies", setup_wave_30_horde),
+    "firing_1200rpm_crowd": ("1200 RPM disparando a una multitud", setup_firing_into_crowd),
+    "boss_death_10_drops": ("Muerte de jefe con 10 mejoras cayendo", setup_boss_death),
+    "corpses_200": ("200 cadáveres desvaneciéndose", setup_corpses),
+}
+
+
+# ===================================================
+# MEDICIÓN
+# ===================================================
+
+def _keep_alive(game):
+    """Evita que el escenario termine: vida y munición al máximo."""
+    player = game.player
+    player.health = player.max_health
+    player.weapon.current_ammo = player.weapon.max_ammo
+    player.weapon.is_reloading = False
+
+
+class _AllocLaps:
+    """
+    Sustituye al profiler del juego en la pasada de tracemalloc: cada lap()
+    cierra un tramo, anota su pico y empieza el siguiente. Por fase se guarda
+    el pico sobre la memoria que había al empezar su primer tramo.
+    """
+
+    enabled = True
+
+    def __init__(self, allocs):
+        self.allocs = allocs
+        self._base = {}
+        self._peak = {}
+        self._segment_base = 0
+
+    def begin_frame(self):
+        self._base.clear()
+        self._peak.clear()
+        tracemalloc.reset_peak()
+        self._segment_base = tracemalloc.get_traced_memory()[0]
+
+    def lap(self, stage, count=0):
+        current, peak = tracemalloc.get_traced_memory()
+        phase = STAGE_PHASE[stage]
+        self._base.setdefault(phase, self._segment_base)
+        self._peak[phase] = max(self._peak.get(phase, 0), peak)
+        tracemalloc.reset_peak()
+        self._segment_base = current
+
+    def end_frame(self):
+        for phase, base in self._base.items():
+            self.allocs[phase].append(self._peak[phase] - base)
+
+
+def _frame(game, timers=None):
+    inp = game.input
+    if hasattr(inp, "advance"):
+        inp.advance(game)
+    game.handle_events()
+    _keep_alive(game)
+
+    # Un update y un draw por frame; los tiempos por fase los da el profiler
+    prof = game.profiler
+    prof.begin_frame()
+    game.update(DT)
+    game.draw()
+    prof.end_frame()
+
+    if timers is not None:
+        row = prof.times[(prof.frames - 1) % prof.capacity]
+        for phase, columns in PHASE_COLUMNS.items():
+            timers[phase].append(float(row[columns].sum()))
+
+
+def _summary(samples_s, alloc_bytes):
+    ms = np.asarray(samples_s) * 1000.0
+    return {
+        "mean_ms": float(ms.mean()),
+        "p95_ms": float(np.percentile(ms, 95)),
+        "p99_ms": float(np.percentile(ms, 99)),
+        "max_ms": float(ms.max()),
+        "alloc_peak_kb_mean": float(np.mean(alloc_bytes) / 1024.0) if alloc_bytes else 0.0,
+    }
+
+
+def run_scenario(name, frames=300, warmup=30, alloc_frames=60, seed=1):
+    from core.game import Game
+    from core.input import ScriptedInput
+    from core.pool import pool_stats, reset_pool_stats
+
+    _, setup = SCENARIOS[name]
+    with contextlib.redirect_stdout(io.StringIO()):
+        game = Game(headless=True, input_source=ScriptedInput(), seed=seed)
+        # Como en el juego: pantalla de carga antes de la partida (nada se decodifica midiendo)
+        game.load_resources()
+        setup(game)
+        game.profiler.enabled = True
+
+        timers = {p: [] for p in PHASES}
+        allocs = {p: [] for p in PHASES}
+        for _ in range(warmup):
+            _frame(game, timers={p: [] for p in PHASES})
+        counts_start = {"zombies": len(game.zombies), "bullets": len(game.bullets), "upgrades": len(game.upgrades)}
+        reset_pool_stats()
+        for _ in range(frames):
+            _frame(game, timers=timers)
+
+        profiler = game.profiler
+        game.profiler = _AllocLaps(allocs)
+        tracemalloc.start()
+        try:
+            for _ in range(alloc_frames):
+                _frame(game)
+        finally:
+            tracemalloc.stop()
+            game.profiler = profiler
+        pools = pool_stats()
+        game.release_pooled()
+
+    return {
+        "description": SCENARIOS[name][0],
+        "frames": frames,
+        "entities_at_start": counts_start,
+        "phases": {p: _summary(timers[p], allocs[p]) for p in PHASES},
+        "pools": pools,
+    }
+
+
+def _meta():
+    try:
+        rev = subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        rev = "unknown"
+    return {
+        "revision": rev,
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+    }
+
+
+# ===================================================
+# SALIDA
+# ===================================================
+
+def print_report(result):
+    print(f"revision {result['meta']['revision']}")
+    print(f"{'scenario':<24}{'phase':<9}{'mean':>8}{'p95':>8}{'p99':>8}{'alloc kB':>10}")
+    for name, data in result["scenarios"].items():
+        for phase, s in data["phases"].items():
+            print(f"{name:<24}{phase:<9}{s['mean_ms']:>8.3f}{s['p95_ms']:>8.3f}{s['p99_ms']:>8.3f}{s['alloc_peak_kb_mean']:>10.1f}")
+
+
+def compare(path_a, path_b):
+    with open(path_a) as f:
+        a = json.load(f)
+    with open(path_b) as f:
+        b = json.load(f)
+    print(f"A = {a['meta']['revision']}   B = {b['meta']['revision']}")
+    print(f"{'scenario':<24}{'phase':<9}{'A p95':>9}{'B p95':>9}{'Δ%':>8}{'A mean':>9}{'B mean':>9}{'Δ%':>8}")
+    for name, data in a["scenarios"].items():
+        other = b["scenarios"].get(name)
+        if not other:
+            continue
+        for phase, sa in data["phases"].items():
+            sb = other["phases"].get(phase)
+            if not sb:
+                continue
+            dp = (sb["p95_ms"] / sa["p95_ms"] - 1) * 100 if sa["p95_ms"] else 0.0
+            dm = (sb["mean_ms"] / sa["mean_ms"] - 1) * 100 if sa["mean_ms"] else 0.0
+            print(f"{name:<24}{phase:<9}{sa['p95_ms']:>9.3f}{sb['p95_ms']:>9.3f}{dp:>+8.1f}"
+                  f"{sa['mean_ms']:>9.3f}{sb['mean_ms']:>9.3f}{dm:>+8.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks por escenario del bucle de juego")
+    parser.add_argument("-s", "--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="Escenario a ejecutar (repetible). Por defecto todos.")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--warmup", type=int, default=30)
+    parser.add_argument("--alloc-frames", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--out", default=None, help="Ruta del JSON de resultados")
+    parser.add_argument("--compare", nargs=2, metavar=("A.json", "B.json"))
+    parser.add_argument("--list", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (desc, _) in SCENARIOS.items():
+            print(f"{name:<24}{desc}")
+        return 0
+    if args.compare:
+        compare(*args.compare)
+        return 0
+
+    result = {"meta": _meta(), "scenarios": {}}
+    for name in args.scenario or list(SCENARIOS):
+        result["scenarios"][name] = run_scenario(name, args.frames, args.warmup, args.alloc_frames, args.seed)
+    print_report(result)
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(result, f, indent=2)
+        print(f"[INFO] Resultados guardados en {args.out}")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+# core/animation.py
+"""
+Animación de zombies con un atlas de fotogramas por arquetipo.
+
+Todos los fotogramas de un arquetipo (assets/images/zombie/<arquetipo>/) se
+escalan, se limpian y se pegan en una sola superficie por tamaño, que vive en
+el registro de sprites como cualquier otra entrada (y por tanto se hornea en
+el paquete de core/assetpack.py). Los clips de ZOMBIE_ANIM_CLIPS son listas de
+subsuperficies de ese atlas: no copian píxeles y un blit de una subsuperficie
+cuesta lo mismo que el de una superficie suelta.
+
+Los zombies no guardan estado de animación: el fotograma es
+floor((reloj + fase) * fps) del clip, con la fase fija de cada zombie para que
+la horda no camine al paso. Horde.sync_visible lo calcula con NumPy para todos
+los visibles de golpe (frame_indices) y cada sprite solo indexa su tabla de
+clips.
+"""
+import os
+import math
+import numpy as np
+import pygame
+from settings import ZOMBIE_ANIM_CLIPS
+from utils.helpers import sprite_registry, load_image_safe, clean_image_background
+
+# Los cuatro primeros clips siguen los códigos de dirección de core/horde.py (front, back, left, right)
+WALK_CLIPS = ("walk_front", "walk_back", "walk_left", "walk_right")
+CLIP_NAMES = WALK_CLIPS + tuple(name for name in ZOMBIE_ANIM_CLIPS if name not in WALK_CLIPS)
+CLIP_CODES = {name: code for code, name in enumerate(CLIP_NAMES)}
+CLIP_ATTACK = CLIP_CODES.get("attack", CLIP_CODES["walk_front"])
+CLIP_DEATH = CLIP_CODES.get("death")
+
+# Tablas por código de clip (indexables con arrays de códigos)
+CLIP_FPS = np.array([ZOMBIE_ANIM_CLIPS[n]["fps"] for n in CLIP_NAMES], dtype=np.float64)
+CLIP_LEN = np.array([len(ZOMBIE_ANIM_CLIPS[n]["frames"]) for n in CLIP_NAMES], dtype=np.int64)
+CLIP_LOOP = np.array([ZOMBIE_ANIM_CLIPS[n]["loop"] for n in CLIP_NAMES], dtype=bool)
+
+
+def _layout():
+    """Celdas únicas (archivo, volteado) del atlas y, por clip, el índice de celda de cada fotograma."""
+    cells, index, clips = [], {}, []
+    for name in CLIP_NAMES:
+        clip = ZOMBIE_ANIM_CLIPS[name]
+        row = []
+        for frame in clip["frames"]:
+            cell = (frame, bool(clip["flip"]))
+            if cell not in index:
+                index[cell] = len(cells)
+                cells.append(cell)
+            row.append(index[cell])
+        clips.append(tuple(row))
+    return tuple(cells), tuple(clips)
+
+
+CELLS, CLIP_CELLS = _layout()
+ATLAS_COLUMNS = math.ceil(math.sqrt(len(CELLS)))
+
+
+def frame_indices(clips, clock, phase):
+    """
+    Índice de fotograma dentro de su clip para arrays de códigos de clip y
+    fases (segundos) con el reloj `clock`. Los clips sin bucle se quedan en el
+    último fotograma.
+    """
+    n = np.floor((clock + phase) * CLIP_FPS[clips]).astype(np.int64)
+    length = CLIP_LEN[clips]
+    return np.where(CLIP_LOOP[clips], n % length, np.minimum(n, length - 1))
+
+
+class AnimationSet:
+    """Atlas de un arquetipo a un tamaño y sus clips (tuplas de subsuperficies, por código de clip)."""
+
+    def __init__(self, archetype, size):
+        self.archetype = archetype
+        self.size = tuple(size)
+        # La disposición va en la clave: un atlas con otros clips (p.ej. de un paquete viejo) no se reutiliza
+        self.key = ("atlas", archetype, self.size, CELLS)
+        w, h = self.size
+        self.rects = [pygame.Rect((k % ATLAS_COLUMNS) * w, (k // ATLAS_COLUMNS) * h, w, h)
+                      for k in range(len(CELLS))]
+        self.atlas = sprite_registry.get(self.key, self._build)
+        self.clips = ()
+        if self.atlas is not None:
+            frames = [self.atlas.subsurface(rect) for rect in self.rects]
+            self.clips = tuple(tuple(frames[c] for c in cells) for cells in CLIP_CELLS)
+
+    def _build(self):
+        w, h = self.size
+        rows = -(-len(CELLS) // ATLAS_COLUMNS)
+        atlas = pygame.Surface((ATLAS_COLUMNS * w, rows * h), pygame.SRCALPHA)
+        for (name, flip), rect in zip(CELLS, self.rects):
+            image = load_image_safe(os.path.join("zombie", self.archetype, name))
+            if image is None:
+                return None
+            image = clean_image_background(pygame.transform.scale(image, self.size))
+            if flip:
+                image = pygame.transform.flip(image, True, False)
+            # Atlas vacío (0,0,0,0): con MAX se copian los píxeles tal cual, sin mezclar el alpha
+            atlas.blit(image, rect, special_flags=pygame.BLEND_RGBA_MAX)
+        return atlas
+
+    def clip(self, name):
+        return self.clips[CLIP_CODES[name]]
+
+    def frame_at(self, name, clock, phase=0.0):
+        """Fotograma del clip `name` en el instante `clock` (para sprites sueltos, fuera de la horda)."""
+        code = CLIP_CODES[name]
+        return self.clips[code][int(frame_indices(np.array([code]), clock, phase)[0])]
+
+    def shared_frame(self, name, index=0):
+        """
+        Fotograma pedido a través del registro: para builders de otras entradas
+        (p.ej. las rotaciones del cadáver), que así heredan los orígenes del atlas.
+        """
+        atlas = sprite_registry.get(self.key, self._build)
+        if atlas is None:
+            return None
+        return atlas.subsurface(self.rects[CLIP_CELLS[CLIP_CODES[name]][index]])
+
+
+_sets = {}  # (arquetipo, tamaño) -> AnimationSet
+
+
+def get_animation(archetype, size):
+    """AnimationSet compartido de un arquetipo y tamaño, o None si faltan fotogramas."""
+    key = (archetype, tuple(size))
+    anim = _sets.get(key)
+    if anim is None:
+        anim = AnimationSet(archetype, size)
+        if anim.atlas is None:
+            return None
+        _sets[key] = anim
+    return anim
@@ -0,0 +1,328 @@
+# core/assetpack.py
+"""
+Paquete de recursos horneado: píxeles finales y PCM en un solo archivo.
+
+`python -m core.assetpack` arranca el juego en headless, construye todo lo que
+se usa (sprites escalados, limpiados, volteados y rotados de cada tipo, tiles
+y objetos de todos los biomas, menús, sonidos) y escribe en ASSET_PACK_PATH:
+
+    b"ZSPK" | versión u32 | tamaño del índice u64 | índice JSON | datos
+
+El índice lista las entradas del registro de sprites (clave con repr), las
+imágenes originales (las que se usan tal cual, como menús y cursores, y las que
+el horneado no ha derivado en ninguna entrada) y los sonidos, cada una con las
+imágenes de origen de las que sale y su (mtime_ns, tamaño). Los píxeles se
+guardan en BGRA, el formato de convert_alpha(). También guarda la huella
+(fingerprint()) del código y los ajustes que deciden esos píxeles: si no
+coincide con la del árbol actual, el paquete entero se ignora.
+
+En el juego, open_pack() abre el archivo con mmap (copia privada: no se
+escribe nunca) y crea las superficies con pygame.image.frombuffer sobre el
+propio mapa, sin copiar ni decodificar. Las entradas cuyo origen ha cambiado
+se ignoran y se construyen como siempre; al volver a hornear solo se procesan
+esas, el resto se reutiliza del paquete anterior.
+"""
+import os
+import ast
+import sys
+import mmap
+import json
+import time
+import hashlib
+import struct
+import argparse
+
+import pygame
+
+from settings import ASSETS_IMAGES, ASSETS_SOUNDS, ASSET_PACK_PATH, ASSET_STREAMED_SOUNDS
+from utils.helpers import (
+    sprite_registry, image_cache, cache_image, cache_sound, load_sound, is_sound_cached, load_image_safe,
+)
+
+PACK_MAGIC = b"ZSPK"
+PACK_VERSION = 2
+_HEADER = struct.Struct("<4sIQ")
+_ALIGN = 64
+
+# Código y ajustes que deciden los píxeles horneados (claves, tamaños, limpieza, rotaciones, clips)
+_FINGERPRINT_SOURCES = (
+    "settings.py", "utils/helpers.py", "core/assetpack.py", "core/animation.py", "core/terrain.py",
+    "core/worldgen.py", "core/decals.py", "core/impact.py", "core/upgrade.py",
+    "entities/zombie.py", "entities/player.py", "entities/bullet.py",
+)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_pack = None       # AssetPack abierto (mantiene vivo el mmap al que apuntan las superficies)
+_opened = False    # open_pack() ya se llamó en este proceso (con paquete o sin él)
+_covered = set()   # imágenes de origen cuyas entradas horneadas están al día
+
+
+def covers(path):
+    """True si todo lo derivado de la imagen `path` (relativa a ASSETS_IMAGES) viene del paquete."""
+    return os.path.normpath(path) in _covered
+
+
+def fingerprint():
+    """Huella de _FINGERPRINT_SOURCES: cambia con cualquier cambio de código o ajustes que afecte a los píxeles."""
+    h = hashlib.sha1(str(PACK_VERSION).encode("ascii"))
+    for rel in _FINGERPRINT_SOURCES:
+        try:
+            with open(os.path.join(_ROOT, rel), "rb") as f:
+                h.update(f.read())
+        except OSError:
+            h.update(b"-")
+    return h.hexdigest()
+
+
+def _source_file(src):
+    """Ruta en disco de un origen del índice: sonidos con ruta completa, imágenes relativas a ASSETS_IMAGES."""
+    if src.startswith(os.path.normpath(ASSETS_SOUNDS) + os.sep):
+        return src
+    return os.path.join(ASSETS_IMAGES, src)
+
+
+def _stamp(full):
+    try:
+        st = os.stat(full)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _display_masks():
+    return pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha().get_masks()
+
+
+class AssetPack:
+    """Paquete abierto con mmap; install() pasa a las cachés las entradas al día."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, version, index_len = _HEADER.unpack_from(self._map, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            raise ValueError(f"{path} no es un paquete de recursos v{PACK_VERSION}")
+        start = _HEADER.size
+        self.index = json.loads(bytes(self._map[start:start + index_len]).decode("utf-8"))
+        if self.index.get("fingerprint") != fingerprint():
+            raise ValueError("horneado con otro código o ajustes (python -m core.assetpack para rehornear)")
+        self._data = start + index_len + (-(start + index_len) % _ALIGN)
+        self._view = memoryview(self._map)
+
+    def _fresh(self, sources, stamps):
+        return all(stamps.get(s) == self.index["sources"].get(s) for s in sources)
+
+    def _surface(self, frame, masks):
+        offset, w, h, alpha, surface_alpha = frame
+        start = self._data + offset
+        surf = pygame.image.frombuffer(self._view[start:start + w * h * 4], (w, h), "BGRA")
+        if not alpha:
+            surf = surf.convert()        # opaca (tiles de terreno): copia al formato de pantalla
+        elif surf.get_masks() != masks:
+            surf = surf.convert_alpha()  # pantalla con otro orden de canales: ya no es cero copias
+        if surface_alpha is not None and surface_alpha != 255:
+            surf.set_alpha(surface_alpha)
+        return surf
+
+    def install(self):
+        """Pasa al registro, image_cache y sonidos las entradas al día. Devuelve (instaladas, obsoletas)."""
+        index = self.index
+        stamps = {src: _stamp(_source_file(src)) for src in index["sources"]}
+        masks = _display_masks()
+        installed = stale = 0
+        covered, dirty = set(), set()
+
+        for entry in index["sprites"]:
+            sources = entry["sources"]
+            if not self._fresh(sources, stamps):
+                stale += 1
+                dirty.update(sources)
+                continue
+            frames = [self._surface(f, masks) for f in entry["frames"]]
+            sprite_registry.put(ast.literal_eval(entry["key"]), frames if entry["list"] else frames[0], sources)
+            covered.update(sources)
+            installed += 1
+
+        for entry in index["images"]:
+            if not self._fresh([entry["path"]], stamps):
+                stale += 1
+                dirty.add(entry["path"])
+                continue
+            cache_image(entry["path"], self._surface(entry["frame"], masks))
+            installed += 1
+
+        if pygame.mixer.get_init() and list(pygame.mixer.get_init()) == index["mixer"]:
+            for entry in index["sounds"]:
+                if not self._fresh([entry["path"]], stamps):
+                    stale += 1
+                    continue
+                start = self._data + entry["offset"]
+                cache_sound(entry["path"], pygame.mixer.Sound(buffer=self._view[start:start + entry["length"]]))
+                installed += 1
+
+        _covered.update(covered - dirty)
+        return installed, stale
+
+
+def open_pack(path=ASSET_PACK_PATH):
+    """
+    Abre e instala el paquete si existe. Solo la primera llamada del proceso
+    hace algo (bake() abre el suyo antes de que Game() pida el de por defecto);
+    las siguientes devuelven lo mismo: el AssetPack o None.
+    """
+    global _pack, _opened
+    if _opened:
+        return _pack
+    _opened = True
+    if not os.path.exists(path):
+        return None
+    start = time.perf_counter()
+    try:
+        pack = AssetPack(path)
+        installed, stale = pack.install()
+    except Exception as e:
+        print(f"[WARN] Paquete de recursos {path} ignorado: {e}")
+        return None
+    _pack = pack
+    print(f"[INFO] Paquete de recursos: {installed} entradas en {(time.perf_counter() - start) * 1000:.1f} ms"
+          + (f", {stale} obsoletas (python -m core.assetpack para rehornear)" if stale else ""))
+    return pack
+
+
+# ==========================================================
+# Horneado
+# ==========================================================
+def _frame(surface, blobs, offset, seen):
+    """Añade los píxeles de `surface` a los datos; los que ya estaban (p.ej. pasos de alpha) se comparten."""
+    alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+    data = pygame.image.tobytes(surface, "BGRA")
+    w, h = surface.get_size()
+    digest = hashlib.sha1(data).digest()
+    at = seen.get(digest)
+    if at is None:
+        at = seen[digest] = offset
+        blobs.append(data + bytes(-len(data) % _ALIGN))
+        offset += len(blobs[-1])
+    return [at, w, h, alpha, surface.get_alpha()], offset
+
+
+def _warm_all():
+    """Construye todo lo que el juego pide al registro durante una partida."""
+    from core.game import Game
+    from core.assets import gameplay_warmers
+    from core.worldgen import WorldGenerator
+    from ui.lose_menu import LoseMenu
+    from settings import WORLD_BIOMES
+
+    game = Game(headless=True, seed=0)
+    for warm in gameplay_warmers():
+        warm()
+    for biome in WORLD_BIOMES:
+        WorldGenerator(0, biome, game.world_width, game.world_height).preload()
+    LoseMenu(game.screen, game.screen_width, game.screen_height)
+    for name in sorted(os.listdir(ASSETS_SOUNDS)):
+        if name not in ASSET_STREAMED_SOUNDS:
+            load_sound(name)
+    return game
+
+
+def bake(path=ASSET_PACK_PATH):
+    """Hornea el paquete (reutilizando lo que siga al día del anterior) y devuelve un resumen."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.mixer.pre_init(44100, -16, 2, 512)
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    start = time.perf_counter()
+    reused = open_pack(path)
+    misses = sprite_registry.misses
+    _warm_all()
+    built = sprite_registry.misses - misses
+
+    blobs, offset, seen = [], 0, {}
+    sprites, images, sounds, sources = [], [], [], set()
+    used = set()
+    for key, surface, srcs in sprite_registry.items():
+        if surface is None:
+            continue
+        surfaces = surface if isinstance(surface, (list, tuple)) else [surface]
+        frames = []
+        for s in surfaces:
+            frame, offset = _frame(s, blobs, offset, seen)
+            frames.append(frame)
+        sprites.append({"key": repr(key), "list": isinstance(surface, (list, tuple)),
+                        "sources": sorted(srcs), "frames": frames})
+        used.update(srcs)
+    # Originales que no salen de ninguna entrada del registro: los que se usan tal cual (menús,
+    # cursores) y los que nada derivó al hornear, que así tampoco se decodifican en partida
+    from core.assets import build_manifest
+    originals = {key: surface for key, surface, _ in image_cache.items() if surface is not None}
+    for src in sorted({os.path.normpath(a.path) for a in build_manifest() if a.kind == "image"} | set(originals)):
+        if src in used:
+            continue
+        surface = originals.get(src) or load_image_safe(src)
+        if surface is None:
+            continue
+        frame, offset = _frame(surface, blobs, offset, seen)
+        images.append({"path": src, "frame": frame})
+        used.add(src)
+    sources.update(used)
+    for name in sorted(os.listdir(ASSETS_SOUNDS)):
+        full = os.path.normpath(os.path.join(ASSETS_SOUNDS, name))
+        if not is_sound_cached(full):
+            continue
+        raw = load_sound(name).get_raw()
+        blobs.append(raw + bytes(-len(raw) % _ALIGN))
+        sounds.append({"path": full, "offset": offset, "length": len(raw)})
+        offset += len(blobs[-1])
+        sources.add(full)
+
+    stamps = {src: _stamp(_source_file(src)) for src in sorted(sources)}
+    index = json.dumps({
+        "version": PACK_VERSION,
+        "fingerprint": fingerprint(),
+        "mixer": list(pygame.mixer.get_init() or ()) or None,
+        "sources": stamps,
+        "sprites": sprites,
+        "images": images,
+        "sounds": sounds,
+    }, separators=(",", ":")).encode("utf-8")
+
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(index)))
+        f.write(index)
+        f.write(bytes(-(_HEADER.size + len(index)) % _ALIGN))
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp, path)
+    return {
+        "path": path,
+        "sprites": len(sprites),
+        "images": len(images),
+        "sounds": len(sounds),
+        "rebuilt": built,
+        "reused_pack": reused is not None,
+        "mb": os.path.getsize(path) / (1024 * 1024),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hornea los recursos del juego en un paquete con mmap")
+    parser.add_argument("--path", default=ASSET_PACK_PATH, help="Archivo del paquete")
+    args = parser.parse_args(argv)
+    stats = bake(args.path)
+    for key, value in stats.items():
+        print(f"{key:>12}: {value:.3f}" if isinstance(value, float) else f"{key:>12}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    # Ejecutar desde el módulo importado: core.game usa ese, y el paquete abierto es estado del módulo
+    from core.assetpack import main as _main
+    sys.exit(_main())
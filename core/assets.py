@@ -0,0 +1,153 @@
+# core/assets.py
+"""
+Carga de recursos en segundo plano para la pantalla de carga.
+
+El manifiesto es todo lo que hay en assets/images, assets/sounds y
+assets/fonts (menos la música de ASSET_STREAMED_SOUNDS, que pygame.mixer.music
+lee en streaming). Los archivos se decodifican en un pool de hilos
+(pygame.image.load, mixer.Sound y la lectura de los TTF sueltan el GIL en la
+parte pesada); convert_alpha() necesita la pantalla y se hace en el hilo
+principal a medida que terminan. El resultado va a las cachés de
+utils/helpers (image_cache, sonidos, fuentes), así que load_image_safe,
+load_sound y get_font ya no tocan el disco durante la partida. Lo que ya trae
+el paquete horneado (core/assetpack.py) no se vuelve a decodificar.
+
+Después se ejecutan los "warmers" (gameplay_warmers): funciones del hilo
+principal que construyen lo derivado (atlas de cada tipo de zombie, sprites
+del jugador, rotaciones de la bala, impactos, iconos de mejoras) para que
+nada se escale ni se limpie a mitad de oleada. core/assetpack.py hornea con la
+misma lista.
+"""
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import pygame
+from settings import ASSETS_IMAGES, ASSETS_SOUNDS, ASSETS_FONTS, ASSET_LOADER_THREADS, ASSET_STREAMED_SOUNDS
+from core.assetpack import covers
+from utils.helpers import (
+    cache_image, cache_sound, cache_font_file, is_image_cached, is_sound_cached, is_font_file_cached,
+)
+
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".bmp")
+SOUND_EXTS = (".mp3", ".ogg", ".wav")
+FONT_EXTS = (".ttf", ".otf")
+
+# kind: "image" | "sound" | "font"; path: relativa a ASSETS_IMAGES para imágenes, completa para el resto
+Asset = namedtuple("Asset", "kind path full size")
+
+
+def build_manifest():
+    """Lista de Asset de todo lo cargable bajo las carpetas de recursos, en orden estable."""
+    manifest = []
+    for kind, root, exts in (("image", ASSETS_IMAGES, IMAGE_EXTS),
+                             ("sound", ASSETS_SOUNDS, SOUND_EXTS),
+                             ("font", ASSETS_FONTS, FONT_EXTS)):
+        for folder, _, files in sorted(os.walk(root)):
+            for name in sorted(files):
+                if not name.lower().endswith(exts):
+                    continue
+                if kind == "sound" and name in ASSET_STREAMED_SOUNDS:
+                    continue
+                full = os.path.join(folder, name)
+                path = os.path.relpath(full, root) if kind == "image" else full
+                manifest.append(Asset(kind, path, full, os.path.getsize(full)))
+    return manifest
+
+
+def gameplay_warmers():
+    """Lo que la partida pide al registro de sprites, en funciones para AssetLoader.run(warmers=...)."""
+    from entities.zombie import Zombie
+    from entities.player import Player
+    from entities.bullet import Bullet
+    from core.impact import Impact
+    from core.upgrade import Upgrade
+    return (Zombie.preload, Player.preload, Bullet.preload, Impact.preload, Upgrade.preload)
+
+
+def _is_cached(asset):
+    if asset.kind == "image":
+        return is_image_cached(asset.path) or covers(asset.path)
+    if asset.kind == "sound":
+        return is_sound_cached(asset.full)
+    return is_font_file_cached(asset.full)
+
+
+def _decode(asset):
+    """Parte que corre en el pool: leer y decodificar, sin tocar la pantalla."""
+    if asset.kind == "image":
+        return pygame.image.load(asset.full)
+    if asset.kind == "sound":
+        return pygame.mixer.Sound(asset.full)
+    with open(asset.full, "rb") as f:
+        return f.read()
+
+
+class AssetLoader:
+    """
+    Carga el manifiesto con progreso real. `progress(fraction, detail)` se
+    llama en el hilo principal según los bytes terminados; los warmers cuentan
+    como un archivo de tamaño medio cada uno.
+    """
+
+    def __init__(self, manifest=None, threads=ASSET_LOADER_THREADS):
+        self.manifest = build_manifest() if manifest is None else manifest
+        self.threads = max(1, min(threads, os.cpu_count() or 1))
+
+    def run(self, progress=None, warmers=()):
+        start = time.perf_counter()
+        audio = bool(pygame.mixer.get_init())
+        pending = [a for a in self.manifest
+                   if not _is_cached(a) and (audio or a.kind != "sound")]
+        unit = sum(a.size for a in self.manifest) / max(1, len(self.manifest))
+        total = sum(a.size for a in pending) + unit * len(warmers)
+        items = len(pending) + len(warmers)
+        done_bytes, done_items, failed = 0, 0, 0
+
+        def report():
+            if progress is not None:
+                progress(done_bytes / total if total else 1.0,
+                         f"{done_items}/{items}  {done_bytes / (1024 * 1024):.1f} MB")
+
+        report()
+        if pending:
+            with ThreadPoolExecutor(max_workers=self.threads) as pool:
+                jobs = {pool.submit(_decode, a): a for a in pending}
+                for job in as_completed(jobs):
+                    asset = jobs[job]
+                    try:
+                        self._store(asset, job.result())
+                    except Exception as e:
+                        print(f"[ERROR] Falló al cargar {asset.full}: {e}")
+                        failed += 1
+                    done_bytes += asset.size
+                    done_items += 1
+                    report()
+
+        for warm in warmers:
+            warm()
+            done_bytes += unit
+            done_items += 1
+            report()
+
+        elapsed = time.perf_counter() - start
+        stats = {
+            "files": len(pending),
+            "skipped": len(self.manifest) - len(pending),
+            "failed": failed,
+            "mb": sum(a.size for a in pending) / (1024 * 1024),
+            "seconds": elapsed,
+        }
+        print(f"[INFO] Recursos: {stats['files']} archivos ({stats['mb']:.1f} MB) en {elapsed:.2f} s, "
+              f"{stats['skipped']} ya en caché, {failed} con error")
+        return stats
+
+    @staticmethod
+    def _store(asset, data):
+        """Parte del hilo principal: convertir a formato de pantalla y guardar en la caché."""
+        if asset.kind == "image":
+            cache_image(asset.path, data.convert_alpha())
+        elif asset.kind == "sound":
+            cache_sound(asset.full, data)
+        else:
+            cache_font_file(asset.full, data)
@@ -0,0 +1,158 @@
+# core/audio.py
+import math
+import numpy as np
+import pygame
+from settings import (
+    AUDIO_ZOMBIE_VOICES, AUDIO_ONESHOT_CHANNELS, AUDIO_UPDATE_INTERVAL,
+    AUDIO_MAX_DISTANCE, AUDIO_MIN_GAIN, AUDIO_HORDE_BED_GAIN, AUDIO_ONESHOTS,
+)
+from utils.helpers import load_sound
+
+
+class AudioManager:
+    """
+    Audio posicional con número de voces acotado.
+
+    - Solo los AUDIO_ZOMBIE_VOICES zombies más audibles tienen canal propio, con
+      paneo estéreo según su posición respecto al centro de la cámara.
+    - El resto de zombies audibles se suman en un único canal de "horda" cuyo
+      volumen escala con la intensidad total.
+    - Los efectos puntuales (disparo, impacto) usan un pool de canales reservado
+      y tienen un intervalo mínimo entre reproducciones.
+    Así el coste de audio no depende de cuántos zombies haya vivos. Sin mixer
+    (p.ej. modo headless) todas las llamadas son no-op.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.enabled = bool(pygame.mixer.get_init())
+        self.voices = {}  # zombie -> Channel
+        self.free_voices = []
+        self.oneshot_channels = []
+        self._next_oneshot = 0
+        self._last_played = {}
+        self._timer = 0.0
+        self.loop_sound = None
+        self.oneshots = {}
+        self.bed = None
+        if not self.enabled:
+            return
+
+        total = AUDIO_ZOMBIE_VOICES + 1 + AUDIO_ONESHOT_CHANNELS
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total)
+
+        self.free_voices = [pygame.mixer.Channel(i) for i in range(AUDIO_ZOMBIE_VOICES)]
+        self.bed = pygame.mixer.Channel(AUDIO_ZOMBIE_VOICES)
+        self.oneshot_channels = [pygame.mixer.Channel(i) for i in range(AUDIO_ZOMBIE_VOICES + 1, total)]
+
+        self.loop_sound = load_sound("zombie_common.mp3", volume=1.0)
+        for name, (path, volume, _, _) in AUDIO_ONESHOTS.items():
+            self.oneshots[name] = load_sound(path, volume=volume)
+
+        if self.loop_sound:
+            self.bed.play(self.loop_sound, loops=-1)
+            self.bed.set_volume(0.0)
+
+    # ==========================================================
+    # Efectos puntuales
+    # ==========================================================
+    def play_oneshot(self, name):
+        """Reproduce un efecto respetando su intervalo mínimo (en tiempo de juego)."""
+        if not self.enabled:
+            return False
+        sound = self.oneshots.get(name)
+        if sound is None:
+            return False
+        _, _, maxtime_ms, min_interval = AUDIO_ONESHOTS[name]
+        now = self.game.time
+        if now - self._last_played.get(name, float("-inf")) < min_interval:
+            return False
+        self._last_played[name] = now
+
+        ch = self.oneshot_channels[self._next_oneshot]
+        self._next_oneshot = (self._next_oneshot + 1) % len(self.oneshot_channels)
+        ch.play(sound, maxtime=maxtime_ms)
+        return True
+
+    # ==========================================================
+    # Emisores de la horda
+    # ==========================================================
+    def update(self, dt):
+        if not self.enabled or self.loop_sound is None:
+            return
+        self._timer -= dt
+        if self._timer > 0:
+            return
+        self._timer = AUDIO_UPDATE_INTERVAL
+
+        horde = self.game.horde
+        n = horde.count
+        if n == 0:
+            self._release_all()
+            self.bed.set_volume(0.0)
+            return
+
+        ratio = np.clip(1.0 - horde.distance[:n] / AUDIO_MAX_DISTANCE, 0.0, 1.0)
+        gain = np.where(horde.alive[:n], ratio * ratio, 0.0)
+        audible = np.flatnonzero(gain > AUDIO_MIN_GAIN)
+        k = AUDIO_ZOMBIE_VOICES
+        if audible.size > k:
+            top = audible[np.argpartition(-gain[audible], k - 1)[:k]]
+        else:
+            top = audible
+
+        sprites = horde.sprites
+        wanted = {sprites[i]: i for i in top.tolist()}
+        for z in [z for z in self.voices if z not in wanted]:
+            ch = self.voices.pop(z)
+            ch.stop()
+            self.free_voices.append(ch)
+
+        center_x = self.game.camera.offset.x + self.game.screen_width / 2
+        half_w = max(1.0, self.game.screen_width / 2)
+        for z, i in wanted.items():
+            ch = self.voices.get(z)
+            if ch is None:
+                if not self.free_voices:
+                    continue
+                ch = self.free_voices.pop()
+                ch.play(self.loop_sound, loops=-1)
+                self.voices[z] = ch
+            # Paneo de potencia constante: pan -1 (izquierda) .. 1 (derecha)
+            pan = max(-1.0, min(1.0, (horde.pos[i, 0] - center_x) / half_w))
+            angle = (pan + 1.0) * math.pi / 4
+            g = float(gain[i])
+            ch.set_volume(g * math.cos(angle), g * math.sin(angle))
+
+        # Cama de horda: intensidad del resto de zombies audibles
+        rest = float(gain[audible].sum() - gain[top].sum())
+        self.bed.set_volume(min(1.0, rest * AUDIO_HORDE_BED_GAIN))
+
+    def _release_all(self):
+        for ch in self.voices.values():
+            ch.stop()
+            self.free_voices.append(ch)
+        self.voices.clear()
+
+    # ==========================================================
+    # Pausa / reinicio
+    # ==========================================================
+    def pause(self):
+        if self.enabled:
+            pygame.mixer.pause()
+
+    def resume(self):
+        if self.enabled:
+            pygame.mixer.unpause()
+
+    def reset(self):
+        if not self.enabled:
+            return
+        self._release_all()
+        self._last_played.clear()
+        self._timer = 0.0
+        if self.bed:
+            self.bed.set_volume(0.0)
+        pygame.mixer.unpause()
@@ -4,11 +4,13 @@ import pygame
 class Camera:
     def __init__(self, width, height):
         self.offset = pygame.Vector2(0, 0)
+        self.prev_offset = pygame.Vector2(0, 0)  # offset del tick anterior (interpolación)
         self.width = width
         self.height = height
 
     def update(self, target, screen_width, screen_height):
         """Centrar cámara en el jugador"""
+        self.prev_offset.update(self.offset)
         self.offset.x = target.pos.x - screen_width / 2
         self.offset.y = target.pos.y - screen_height / 2
 
@@ -16,6 +18,12 @@ class Camera:
         self.offset.x = max(0, min(self.offset.x, self.width - screen_width))
         self.offset.y = max(0, min(self.offset.y, self.height - screen_height))
 
+    def view_offset(self, alpha=1.0):
+        """Offset entero para dibujar, interpolado entre el tick anterior y el actual."""
+        x = self.prev_offset.x + (self.offset.x - self.prev_offset.x) * alpha
+        y = self.prev_offset.y + (self.offset.y - self.prev_offset.y) * alpha
+        return int(x), int(y)
+
     def apply(self, rect):
         """Aplica el desplazamiento de cámara"""
         return rect.move(-self.offset.x, -self.offset.y)
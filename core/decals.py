@@ -0,0 +1,105 @@
+# core/decals.py
+from collections import OrderedDict
+import pygame
+from settings import DECAL_CHUNK_SIZE, DECAL_MAX_MB, CORPSE_FADE_TIME, CORPSE_ALPHA_STEPS
+from utils.helpers import get_alpha_steps
+
+
+class DecalLayer:
+    """
+    Capa de suelo con los cadáveres.
+
+    Un cadáver nuevo aparece con pasos de alpha precalculados durante
+    CORPSE_FADE_TIME y después se "hornea" una sola vez en los chunks de suelo
+    que toca; a partir de ahí no es un sprite ni cuesta nada por frame. Los
+    chunks son superficies de DECAL_CHUNK_SIZE px; si se supera DECAL_MAX_MB se
+    descartan los que llevan más tiempo sin recibir cadáveres.
+    """
+
+    def __init__(self, chunk_size=DECAL_CHUNK_SIZE, max_mb=DECAL_MAX_MB):
+        self.chunk_size = chunk_size
+        self.max_chunks = max(1, int(max_mb * 1024 * 1024) // (chunk_size * chunk_size * 4))
+        self.chunks = OrderedDict()  # (cx, cy) -> Surface; orden = antigüedad del último horneado
+        self.fading = []  # [frames, x, y, timer] con (x, y) esquina superior izquierda en el mundo
+        self.baked = 0
+        self.evicted = 0
+
+    # ==========================================================
+    # Cadáveres
+    # ==========================================================
+    @staticmethod
+    def corpse_steps(key, builder):
+        """Pasos de alpha compartidos del cadáver `key` (Zombie.preload los construye por adelantado)."""
+        return get_alpha_steps(key, builder, CORPSE_ALPHA_STEPS)
+
+    def add_corpse(self, key, image, center):
+        """Registra un cadáver; `key` identifica `image` para compartir sus pasos de alpha."""
+        frames = self.corpse_steps(key, lambda: image)
+        w, h = image.get_size()
+        self.fading.append([frames, center[0] - w // 2, center[1] - h // 2, 0.0])
+
+    def update(self, dt):
+        if not self.fading:
+            return
+        still = []
+        for corpse in self.fading:
+            corpse[3] += dt
+            if corpse[3] >= CORPSE_FADE_TIME:
+                self._bake(corpse[0][0], corpse[1], corpse[2])
+            else:
+                still.append(corpse)
+        self.fading = still
+
+    def _frame(self, corpse):
+        """Paso de alpha para un cadáver que está apareciendo (de transparente a opaco)."""
+        frames, timer = corpse[0], corpse[3]
+        step = int((1.0 - timer / CORPSE_FADE_TIME) * CORPSE_ALPHA_STEPS)
+        return frames[max(0, min(CORPSE_ALPHA_STEPS - 1, step))]
+
+    # ==========================================================
+    # Chunks
+    # ==========================================================
+    def _bake(self, image, x, y):
+        cs = self.chunk_size
+        w, h = image.get_size()
+        for cx in range(x // cs, (x + w - 1) // cs + 1):
+            for cy in range(y // cs, (y + h - 1) // cs + 1):
+                chunk = self.chunks.get((cx, cy))
+                if chunk is None:
+                    chunk = pygame.Surface((cs, cs), pygame.SRCALPHA)
+                    self.chunks[(cx, cy)] = chunk
+                else:
+                    self.chunks.move_to_end((cx, cy))
+                chunk.blit(image, (x - cx * cs, y - cy * cs))
+        self.baked += 1
+        while len(self.chunks) > self.max_chunks:
+            self.chunks.popitem(last=False)
+            self.evicted += 1
+
+    def draw(self, surface, view_x, view_y, view_w, view_h):
+        cs = self.chunk_size
+        ox, oy = int(view_x), int(view_y)
+        chunks = self.chunks
+        for cx in range(ox // cs, (ox + view_w) // cs + 1):
+            for cy in range(oy // cs, (oy + view_h) // cs + 1):
+                chunk = chunks.get((cx, cy))
+                if chunk is not None:
+                    surface.blit(chunk, (cx * cs - ox, cy * cs - oy))
+
+        for corpse in self.fading:
+            x, y = corpse[1] - ox, corpse[2] - oy
+            if -cs < x < view_w and -cs < y < view_h:
+                surface.blit(self._frame(corpse), (x, y))
+
+    def clear(self):
+        self.chunks.clear()
+        self.fading = []
+
+    def stats(self):
+        return {
+            "chunks": len(self.chunks),
+            "max_chunks": self.max_chunks,
+            "fading": len(self.fading),
+            "baked": self.baked,
+            "evicted": self.evicted,
+        }
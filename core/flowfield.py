@@ -0,0 +1,203 @@
+# core/flowfield.py
+"""
+Campo de flujo compartido hacia el jugador.
+
+Una sola búsqueda de caminos para toda la horda: distancia por la rejilla
+(8 vecinas, coste 1 o √2, sin cortar esquinas de obstáculos) desde la celda del
+jugador a todas las celdas de una ventana de FLOW_RADIUS celdas a su
+alrededor, y para cada celda la dirección hacia su mejor vecina. Se recalcula
+solo cuando el jugador cambia de celda o cambian los obstáculos
+(invalidate()); cada zombie lee su dirección con un índice (sample()), así que
+el coste no depende del tamaño de la horda. prefetch() prepara por
+adelantado, con un presupuesto por tick, los obstáculos de las celdas a las
+que se va a extender la ventana, para que el recálculo no tenga que generarlos.
+
+La distancia se integra con NumPy por relajación: en cada pasada cada celda se
+queda con el mínimo de (vecina + coste) en las 8 direcciones, hasta que nada
+cambia. Arranca con la longitud de la línea recta en las celdas a la vista, de
+modo que las pasadas solo dependen de lo largas que sean las sombras de los
+obstáculos. Si la ventana no tiene obstáculos no se calcula nada.
+
+Las celdas con línea de visión hasta el jugador (y las que no tienen camino)
+quedan como "directas": ahí se persigue en línea recta, que es más suave que
+seguir las 8 direcciones de la rejilla.
+"""
+import numpy as np
+from settings import FLOW_CELL_SIZE, FLOW_RADIUS, FLOW_PREFETCH_MARGIN, FLOW_PREFETCH_PER_TICK
+
+_DIRS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+_UNIT = np.array(_DIRS, dtype=float) / np.hypot(*np.array(_DIRS, dtype=float).T)[:, None]
+_SQRT2 = 2 ** 0.5
+
+
+class FlowField:
+    """
+    `obstacles(x0, y0, nx, ny, cell)` devuelve un array bool (nx, ny) con las
+    celdas de `cell` px que no se pueden cruzar (WorldGenerator.blocked).
+    `prefetch(x0, y0, nx, ny, cell, budget)` (opcional,
+    WorldGenerator.prefetch_blocked) los prepara por partes y devuelve cuántos
+    faltaban.
+    `valid` es False mientras no haga falta rodear nada: los zombies usan
+    entonces la persecución directa.
+    """
+
+    def __init__(self, world_width, world_height, obstacles, cell_size=FLOW_CELL_SIZE, radius=FLOW_RADIUS,
+                 prefetch=None):
+        self.obstacles = obstacles
+        self.obstacle_prefetch = prefetch
+        self.cell_size = cell_size
+        self.radius = radius
+        self.cols = -(-int(world_width) // cell_size)
+        self.rows = -(-int(world_height) // cell_size)
+        self.valid = False
+        self.origin = (0, 0)   # celda de la esquina superior izquierda de la ventana
+        self.ux = self.uy = self.direct = self.dist = None
+        self.version = 0       # sube con invalidate()
+        self._key = None       # (celda del jugador, versión) del último cálculo
+        self._ready = None     # celda del jugador con la ventana ampliada ya preparada
+        self.builds = 0
+        self.passes = 0
+
+    def invalidate(self):
+        """Los obstáculos han cambiado: recalcular en el próximo update()."""
+        self.version += 1
+
+    def _cell(self, x, y):
+        cs = self.cell_size
+        return min(max(int(x // cs), 0), self.cols - 1), min(max(int(y // cs), 0), self.rows - 1)
+
+    def update(self, x, y):
+        """Recalcula si el jugador (x, y) ha cambiado de celda. Devuelve True si recalculó."""
+        cell = self._cell(x, y)
+        if (cell, self.version) == self._key:
+            return False
+        self._key = (cell, self.version)
+        self._build(*cell)
+        return True
+
+    def prefetch(self, x, y, budget=FLOW_PREFETCH_PER_TICK):
+        """
+        Prepara hasta `budget` chunks de obstáculos de la ventana alrededor de
+        (x, y) ampliada en FLOW_PREFETCH_MARGIN celdas. No hace nada si la
+        ventana de esa celda ya estaba completa.
+        """
+        cell = self._cell(x, y)
+        if self.obstacle_prefetch is None or cell == self._ready:
+            return
+        r = self.radius + FLOW_PREFETCH_MARGIN
+        x0, y0 = max(0, cell[0] - r), max(0, cell[1] - r)
+        nx, ny = min(self.cols, cell[0] + r + 1) - x0, min(self.rows, cell[1] + r + 1) - y0
+        if self.obstacle_prefetch(x0, y0, nx, ny, self.cell_size, budget) <= budget:
+            self._ready = cell
+
+    # ==========================================================
+    # Cálculo
+    # ==========================================================
+    def _build(self, tx, ty):
+        r = self.radius
+        x0, y0 = max(0, tx - r), max(0, ty - r)
+        nx, ny = min(self.cols, tx + r + 1) - x0, min(self.rows, ty + r + 1) - y0
+        sx, sy = tx - x0, ty - y0
+        blocked = self.obstacles(x0, y0, nx, ny, self.cell_size)
+        blocked[sx, sy] = False  # el jugador puede estar sobre un obstáculo: se llega igual
+        self.builds += 1
+        self.origin = (x0, y0)
+        if not blocked.any():
+            self.valid = False
+            return
+
+        # Borde de una celda bloqueada: cada dirección es un slice, sin casos especiales
+        free = np.zeros((nx + 2, ny + 2), dtype=bool)
+        free[1:-1, 1:-1] = ~blocked
+        inner = (slice(1, -1), slice(1, -1))
+        moves = []  # (vecina, coste del paso: inf si no se puede)
+        for dx, dy in _DIRS:
+            nb = (slice(1 + dx, nx + 1 + dx), slice(1 + dy, ny + 1 + dy))
+            can = free[inner] & free[nb]
+            if dx and dy:
+                can &= free[1 + dx:nx + 1 + dx, 1:-1] & free[1:-1, 1 + dy:ny + 1 + dy]
+            moves.append((nb, np.where(can, _SQRT2 if dx and dy else 1.0, np.inf)))
+
+        # Las celdas a la vista ya tienen un camino recto: la relajación solo corrige las sombras
+        visible, length = self._visible(~blocked, sx, sy)
+        dist = np.full((nx + 2, ny + 2), np.inf)
+        core = dist[inner]
+        core[visible] = length[visible]
+        for passes in range(1, 2 * (nx + ny) + 1):
+            before = core.copy()
+            for nb, cost in moves:
+                np.minimum(core, dist[nb] + cost, out=core)
+            if np.array_equal(core, before):
+                break
+        self.passes += passes
+
+        cand = np.stack([dist[nb] + cost for nb, cost in moves])
+        best = cand.argmin(axis=0)
+        self.ux, self.uy = _UNIT[best, 0], _UNIT[best, 1]
+        self.dist = core
+        self.direct = ~np.isfinite(core) | visible
+        self.valid = True
+
+    def _visible(self, free, sx, sy):
+        """
+        Línea de visión aproximada desde el jugador, por anillos: una celda se ve
+        si está libre y se ve la vecina que hay un paso más cerca en la recta.
+        Devuelve también la longitud de esa cadena de celdas, que es un camino
+        real y sirve de cota superior para arrancar la relajación.
+        """
+        nx, ny = free.shape
+        gx, gy = np.meshgrid(np.arange(nx) - sx, np.arange(ny) - sy, indexing="ij")
+        ring = np.maximum(np.abs(gx), np.abs(gy))
+        m = np.maximum(ring, 1)
+        stepx, stepy = np.rint(gx / m).astype(np.int64), np.rint(gy / m).astype(np.int64)
+        parent = ((sx + gx - stepx) * ny + (sy + gy - stepy)).ravel()
+        cost = np.where((stepx != 0) & (stepy != 0), _SQRT2, 1.0).ravel()
+        # Sin cortar esquinas: en un paso diagonal también tienen que estar libres las dos ortogonales
+        ix, iy = sx + gx, sy + gy
+        vis = free & free[ix - stepx, iy] & free[ix, iy - stepy]
+        length = np.zeros((nx, ny))
+        order = np.argsort(ring, axis=None, kind="stable")
+        bounds = np.searchsorted(ring.ravel()[order], np.arange(1, int(ring.max()) + 2))
+        flat_vis, flat_len = vis.ravel(), length.ravel()
+        for a, b in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+            cells = order[a:b]
+            up = parent[cells]
+            flat_vis[cells] &= flat_vis[up]
+            flat_len[cells] = flat_len[up] + cost[cells]
+        return vis, length
+
+    # ==========================================================
+    # Consulta
+    # ==========================================================
+    def sample(self, x, y):
+        """
+        Dirección del campo en posiciones del mundo (arrays). Devuelve (ux, uy,
+        use): `use` marca las posiciones que deben seguir el campo; el resto
+        persigue en línea recta.
+        """
+        ux, uy = np.zeros(np.shape(x)), np.zeros(np.shape(x))
+        use = np.zeros(np.shape(x), dtype=bool)
+        if not self.valid:
+            return ux, uy, use
+        nx, ny = self.direct.shape
+        ix = (np.floor_divide(x, self.cell_size) - self.origin[0]).astype(np.int64)
+        iy = (np.floor_divide(y, self.cell_size) - self.origin[1]).astype(np.int64)
+        inside = (ix >= 0) & (ix < nx) & (iy >= 0) & (iy < ny)
+        cx, cy = ix[inside], iy[inside]
+        use[inside] = ~self.direct[cx, cy]
+        ux[inside], uy[inside] = self.ux[cx, cy], self.uy[cx, cy]
+        return ux, uy, use
+
+    def direction_at(self, x, y):
+        """Dirección (ux, uy) del campo en un punto, o None si ahí se persigue en línea recta."""
+        if not self.valid:
+            return None
+        ix = int(x // self.cell_size) - self.origin[0]
+        iy = int(y // self.cell_size) - self.origin[1]
+        nx, ny = self.direct.shape
+        if not (0 <= ix < nx and 0 <= iy < ny) or self.direct[ix, iy]:
+            return None
+        return float(self.ux[ix, iy]), float(self.uy[ix, iy])
+
+    def stats(self):
+        return {"valid": self.valid, "builds": self.builds, "passes": self.passes}
@@ -1,11 +1,28 @@
 # core/game.py
+import os
 import pygame
-import random
 import sys
+import time
 from settings import *
 from entities.player import Player
 from entities.zombie import Zombie
 from core.camera import Camera
+from core.spatial_hash import SpatialHash
+from core.horde import Horde, ZombieGroup
+from core.decals import DecalLayer
+from core.terrain import TerrainLayer
+from core.worldgen import WorldGenerator
+from core.flowfield import FlowField
+from core.assets import AssetLoader, gameplay_warmers
+from core.assetpack import open_pack
+from core.render import blit_list, visible_blits, interp_delta
+from core.audio import AudioManager
+from entities.bullet import Bullet
+from core.impact import Impact
+from core.upgrade import Upgrade
+from core.input import LiveInput
+from core.rng import rng, seed_streams
+from core.profiler import FrameProfiler, ProfilerOverlay
 from entities.spawner import Spawner
 from ui.hud import HUD
 from ui.pause_menu import PauseMenu
@@ -18,27 +35,56 @@ from ui.loading_screen import LoadingScreen
 class Game:
     """Clase principal del juego."""
 
-    def __init__(self):
+    def __init__(self, headless=False, input_source=None, seed=None, screen_size=None, record=None):
+        """
+        headless: sin ventana real ni audio (drivers SDL "dummy"), pensado para
+                  medir la simulación en máquinas sin pantalla (ver core/headless.py).
+        input_source: fuente de teclado/ratón (por defecto LiveInput).
+        seed: semilla de los flujos aleatorios (core/rng.py); None = al azar.
+        screen_size: tamaño de la ventana virtual en headless (por defecto SCREEN_WIDTH x SCREEN_HEIGHT).
+        record: grabar la partida (core/replay.py); por defecto REPLAY_RECORD fuera de headless.
+        """
+        self.headless = headless
+        self.input = input_source if input_source is not None else LiveInput()
+        self.seed = seed_streams(seed)
+        self.recorder = None
+
+        if headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
         pygame.init()
-        try:
-            pygame.mixer.pre_init(44100, -16, 2, 512)
-            if not pygame.mixer.get_init():
-                pygame.mixer.init()
-            pygame.mixer.set_num_channels(64)
-        except Exception:
-            pass
-
-        # Pantalla fullscreen
-        self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-        info = pygame.display.Info()
-        self.screen_width, self.screen_height = info.current_w, info.current_h
+        if not headless:
+            try:
+                pygame.mixer.pre_init(44100, -16, 2, 512)
+                if not pygame.mixer.get_init():
+                    pygame.mixer.init()
+                pygame.mixer.set_num_channels(64)
+            except Exception:
+                pass
+
+        # Pantalla fullscreen (o ventana virtual en headless)
+        if headless:
+            self.screen = pygame.display.set_mode(screen_size or (SCREEN_WIDTH, SCREEN_HEIGHT))
+        else:
+            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        self.screen_width, self.screen_height = self.screen.get_size()
         pygame.display.set_caption("Zombie Survival: Endless Apocalypse")
 
+        # Paquete de recursos horneado: sprites y sonidos finales sin decodificar nada
+        if ASSET_PACK:
+            open_pack()
+
         # Reloj / Fuente
         self.clock = pygame.time.Clock()
         self.font = load_font("PressStart2P-Regular.ttf", 18)
 
+        # Profiler por fases (F3 overlay, F4 volcado CSV); sin coste apreciable si está oculto
+        self.profiler = FrameProfiler()
+        self.profiler_overlay = ProfilerOverlay(self.profiler, load_font("PressStart2P-Regular.ttf", 9),
+                                                budget_ms=1000.0 / FPS)
+
         # Estado
+        self.time = 0.0  # Reloj de juego (segundos simulados, sustituye a time.time())
         self.running = True
         self.paused = False
         self.return_to_main_menu = False
@@ -60,11 +106,23 @@ class Game:
         self.current_cursor = self.cursor_game
         self.cursor_offset = pygame.Vector2(16, 16)
 
+        # Pools de balas/impactos/mejoras (la imagen compartida se carga aquí, no al disparar)
+        for pooled in (Bullet, Impact, Upgrade):
+            pooled.pool.prewarm()
+
+        # Audio posicional con voces limitadas (no-op sin mixer)
+        self.audio = AudioManager(self)
+
         # Inicializar estado del juego
         self.initialize_game_state()
 
+        # Grabación de la partida desde el estado inicial
+        if record if record is not None else (REPLAY_RECORD and not headless):
+            self.start_recording()
+
         # Música ambiente
-        load_music("ambient.mp3", volume=0.6, loop=-1)
+        if not headless:
+            load_music("ambient.mp3", volume=0.6, loop=-1)
 
     # ============================================================
     def initialize_game_state(self):
@@ -74,10 +132,19 @@ class Game:
         self.player = Player((self.world_width / 2, self.world_height / 2))
 
         # Entidades
-        self.zombies = pygame.sprite.Group()
+        self.horde = Horde()
+        self.zombies = ZombieGroup(self.horde)
+        self.visible_zombies = []
+        self.view_offset = (0, 0)  # offset entero de cámara del último draw (interpolado)
         self.bullets = pygame.sprite.Group()
         self.upgrades = pygame.sprite.Group()
         self.effects = pygame.sprite.Group()
+        self.decals = DecalLayer()
+        self._build_world()
+
+        # Índices espaciales (se reconstruyen cada tick)
+        self.zombie_grid = SpatialHash()
+        self.upgrade_grid = SpatialHash()
 
         # Cámara y HUD
         self.camera = Camera(self.world_width, self.world_height)
@@ -92,12 +159,26 @@ class Game:
             pos = self._spawn_initial_far(min_distance)
             self.zombies.add(Zombie(pos, "common", rarity="common"))
 
+    # ============================================================
+    def _build_world(self):
+        """Mundo procedural del bioma actual (el terreno no se genera hasta que la cámara lo ve)."""
+        self.world = WorldGenerator(self.seed, WORLD_BIOME, self.world_width, self.world_height)
+        self.world.preload()
+        self.terrain = TerrainLayer(self.world.tiles, self.world_width, self.world_height,
+                                    decorate=self.world.decorate)
+        # Campo de flujo hacia el jugador; el primer cálculo (obstáculos incluidos) se hace aquí y no en partida
+        self.flow = None
+        if FLOW_FIELD:
+            self.flow = FlowField(self.world_width, self.world_height, self.world.blocked,
+                                  prefetch=self.world.prefetch_blocked)
+            self.flow.update(self.player.pos.x, self.player.pos.y)
+
     # ============================================================
     def _spawn_initial_far(self, min_distance):
         """Genera posiciones iniciales lejos del jugador."""
         for _ in range(40):
-            x = random.randint(0, self.world_width)
-            y = random.randint(0, self.world_height)
+            x = rng("world").randint(0, self.world_width)
+            y = rng("world").randint(0, self.world_height)
             pos = pygame.Vector2(x, y)
             if pos.distance_to(self.player.pos) >= min_distance:
                 return pos
@@ -105,53 +186,82 @@ class Game:
 
     # ============================================================
     def run(self):
+        """
+        Bucle principal: simulación a paso fijo (SIM_TICK_RATE) con acumulador y
+        dibujo a FPS interpolando entre los dos últimos ticks.
+        """
         print("[INFO] Iniciando el juego...")
+        step = 1.0 / SIM_TICK_RATE
+        accumulator = 0.0
         while self.running:
-            dt = self.clock.tick(FPS) / 1000
+            frame_dt = self.clock.tick(FPS) / 1000
+            self.profiler.begin_frame()
             self.handle_events()
+            self.profiler.lap("input")
 
             if self.return_to_main_menu:
+                self.stop_recording()
                 return
 
-            if not self.paused:
-                self.update(dt)
-
-            self.draw()
+            if self.paused:
+                accumulator = 0.0
+                alpha = 1.0
+            else:
+                accumulator += frame_dt
+                steps = 0
+                while accumulator >= step and steps < SIM_MAX_CATCHUP_STEPS:
+                    self.update(step)
+                    accumulator -= step
+                    steps += 1
+                if steps == SIM_MAX_CATCHUP_STEPS and accumulator >= step:
+                    accumulator = step * 0.999  # tirón largo: se descarta el retraso restante
+                alpha = accumulator / step
+
+            self.draw(alpha)
+            self.profiler.end_frame()
+        self.stop_recording()
         pygame.quit()
         sys.exit()
 
     # ============================================================
     def handle_events(self):
-        keys = pygame.key.get_pressed()
+        keys = self.input.get_pressed()
         self.ui_manager.visible = keys[pygame.K_e]
+        events = self.input.events()
+        if self.recorder is not None:
+            self.recorder.record_frame(keys, self.input.get_mouse_pos(), events)
 
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
 
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
+                if event.key == getattr(pygame, f"K_{PROFILER_TOGGLE_KEY}"):
+                    self.profiler_overlay.toggle()
+                elif event.key == getattr(pygame, f"K_{PROFILER_DUMP_KEY}"):
+                    self.dump_profile()
+                elif event.key == pygame.K_ESCAPE:
                     self.paused = not self.paused
                     self.current_cursor = self.cursor_menu if self.paused else self.cursor_game
-
-                    for z in self.zombies:
-                        try:
-                            z.pause_sound() if self.paused else z.resume_sound()
-                        except Exception:
-                            pass
+                    self.audio.pause() if self.paused else self.audio.resume()
 
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                mouse_pos = self.input.get_mouse_pos()
                 if self.lose_menu:
-                    self.lose_menu.handle_click(pygame.mouse.get_pos(), self)
+                    self.lose_menu.handle_click(mouse_pos, self)
                 elif self.paused:
-                    self.pause_menu.handle_click(pygame.mouse.get_pos(), self)
+                    self.pause_menu.handle_click(mouse_pos, self)
                 else:
-                    self.player.shoot(pygame.mouse.get_pos(), self)
+                    self.player.shoot(mouse_pos, self)
 
     # ============================================================
     def update(self, dt):
+        prof = self.profiler
+        self.time += dt
+
         # Actualizar player
         self.player.update(dt, self)
+        prof.lap("player", 1)
 
         # Si muere → menú de muerte
         if self.player.health <= 0 and self.lose_menu is None:
@@ -162,61 +272,121 @@ class Game:
         # Actualizar entidades
         for b in list(self.bullets):
             b.update(dt, self)
-
-        for z in list(self.zombies):
-            z.update(dt, self)
+        prof.lap("bullets", len(self.bullets))
+
+        # Horda: movimiento, dirección y contacto en un solo paso vectorizado
+        if self.flow is not None:
+            self.flow.update(self.player.pos.x, self.player.pos.y)
+            self.flow.prefetch(self.player.pos.x, self.player.pos.y)
+            prof.lap("flow", self.flow.builds)
+        contact_dps = self.horde.step(dt, self.player, self._player_radius(), self.flow)
+        if contact_dps > 0:
+            self.player.take_damage(contact_dps * dt)
+        prof.lap("horde", self.horde.count)
+
+        # Audio: reparto de voces según la distancia calculada en step()
+        self.audio.update(dt)
+        prof.lap("audio", len(self.audio.voices))
+
+        # Cadáveres apareciendo (los ya horneados no cuestan nada)
+        self.decals.update(dt)
+        prof.lap("corpses", len(self.decals.fading))
 
         for u in list(self.upgrades):
             u.update(dt)
+        prof.lap("upgrades", len(self.upgrades))
 
         for e in list(self.effects):
             e.update(dt)
+        prof.lap("effects", len(self.effects))
+
+        # Reindexar posiciones para colisiones (las balas del próximo tick usan este índice)
+        self._rebuild_grids()
 
         # Colisiones upgrades
-        picked = pygame.sprite.spritecollide(self.player, self.upgrades, dokill=True)
-        for up in picked:
-            print(f"[INFO] Player picked up upgrade '{up.type}'")
-            self.player.apply_upgrade(up.type)
+        px, py = self.player.rect.center
+        for up in self.upgrade_grid.query_radius(px, py, self._player_radius()):
+            if up.alive() and self.player.rect.colliderect(up.rect):
+                up.kill()
+                print(f"[INFO] Player picked up upgrade '{up.type}'")
+                self.player.apply_upgrade(up.type)
+        prof.lap("grids", self.zombie_grid.count + self.upgrade_grid.count)
 
         # Cámara
         self.camera.update(self.player, self.screen_width, self.screen_height)
 
         # ==== SPAWNER REAL ====
         self.spawner.update(dt)
+        prof.lap("spawner", len(self.zombies))
+
+        if self.recorder is not None:
+            self.recorder.record_tick(self, dt)
 
     # ============================================================
-    def draw(self):
-        # Fondo del mundo
-        self.screen.fill((30, 30, 30))
+    def _player_radius(self):
+        """Radio de colisión del jugador (igual que pygame.sprite.collide_circle sin .radius)."""
+        w, h = self.player.rect.size
+        return 0.5 * (w * w + h * h) ** 0.5
+
+    def _rebuild_grids(self):
+        horde = self.horde
+        alive = horde.alive_indices()
+        self.zombie_grid.rebuild_arrays(
+            [horde.sprites[i] for i in alive.tolist()],
+            horde.pos[alive, 0], horde.pos[alive, 1], horde.radius[alive],
+        )
+        self.upgrade_grid.rebuild(
+            self.upgrades,
+            lambda u: (u.rect.centerx, u.rect.centery, 0.5 * (u.rect.width ** 2 + u.rect.height ** 2) ** 0.5),
+        )
+
+    # ============================================================
+    def draw(self, alpha=1.0):
+        """
+        Dibuja el estado actual. `alpha` (0..1) es la fracción de tick acumulada:
+        jugador, zombies, balas y cámara se dibujan interpolados entre el tick
+        anterior y el actual (1.0 = estado actual, sin interpolar).
+        """
+        prof = self.profiler
+        screen = self.screen
+        view_w, view_h = self.screen_width, self.screen_height
+        # Desplazamiento entero de cámara común a todas las capas (también lo usa el HUD)
+        ox, oy = self.view_offset = self.camera.view_offset(alpha)
+
+        # Fondo del mundo: terreno por chunks (cubre toda la pantalla, sustituye al fill)
+        self.terrain.draw(screen, ox, oy, view_w, view_h)
+        self.world.trim(ox + view_w / 2, oy + view_h / 2)
 
         # Marco del mundo
-        pygame.draw.rect(
-            self.screen,
-            (60, 60, 60),
-            self.camera.apply(pygame.Rect(0, 0, self.world_width, self.world_height)),
-            4
-        )
+        pygame.draw.rect(screen, (60, 60, 60), (-ox, -oy, self.world_width, self.world_height), 4)
+        self.decals.draw(screen, ox, oy, view_w, view_h)
+        prof.lap("background")
 
-        # Zombies
-        for z in self.zombies:
-            self.screen.blit(z.image, self.camera.apply(z.rect))
+        # Zombies (la horda solo sincroniza rect/imagen de los visibles)
+        self.visible_zombies = self.horde.sync_visible(ox, oy, view_w, view_h, alpha)
+        screen.blits(blit_list(self.visible_zombies, ox, oy), False)
+        prof.lap("zombies", len(self.visible_zombies))
 
-        # Balas
-        for b in self.bullets:
-            self.screen.blit(b.image, self.camera.apply(b.rect))
+        # Balas, upgrades y efectos: solo lo que toca la vista, un blits() por capa
+        batch = visible_blits(self.bullets, ox, oy, view_w, view_h, alpha)
+        screen.blits(batch, False)
+        prof.lap("bullets_draw", len(batch))
 
-        # Upgrades
-        for u in self.upgrades:
-            self.screen.blit(u.image, self.camera.apply(u.rect))
+        batch = visible_blits(self.upgrades, ox, oy, view_w, view_h)
+        screen.blits(batch, False)
+        prof.lap("upgrades_draw", len(batch))
 
-        # Efectos
-        for e in self.effects:
-            self.screen.blit(e.image, self.camera.apply(e.rect))
+        batch = visible_blits(self.effects, ox, oy, view_w, view_h)
+        screen.blits(batch, False)
+        prof.lap("effects_draw", len(batch))
 
         # Player
-        self.screen.blit(self.player.image, self.camera.apply(self.player.rect))
+        r = self.player.rect
+        dx, dy = interp_delta(self.player.prev_pos, self.player.pos, alpha)
+        screen.blit(self.player.image, (r.x + dx - ox, r.y + dy - oy))
+        prof.lap("player_draw", 1)
 
-        # HUD
+        # HUD (mide "hud" y "minimap" por dentro)
         self.hud.draw(self.screen, self.player, self.spawner)
 
         # Menús
@@ -232,60 +402,94 @@ class Game:
 
         # Cursor
         if self.current_cursor:
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = self.input.get_mouse_pos()
             cursor_rect = self.current_cursor.get_rect(center=mouse_pos)
             self.screen.blit(self.current_cursor, cursor_rect.topleft)
+        prof.lap("menus")
+
+        # Overlay del profiler
+        self.profiler_overlay.draw(self.screen)
+        prof.lap("overlay")
 
         pygame.display.flip()
+        prof.lap("flip")
+
+    # ============================================================
+    def dump_profile(self, path=None):
+        """
+        Vuelca el buffer del profiler a CSV (por defecto frame_profile_<fecha>.csv).
+        Vale también con el overlay ya oculto; None si aún no se ha medido ningún frame.
+        """
+        if self.profiler.frames == 0:
+            print(f"[WARN] Perfil vacío: pulsa {PROFILER_TOGGLE_KEY} para medir antes de volcarlo")
+            return None
+        if path is None:
+            path = time.strftime("frame_profile_%Y%m%d_%H%M%S.csv")
+        self.profiler.dump_csv(path)
+        print(f"[INFO] Perfil de frames guardado en {path}")
+        return path
+
+    # ============================================================
+    def start_recording(self, god_mode=False):
+        """Empieza a grabar entrada y checksums (ver core/replay.py)."""
+        from core.replay import InputRecorder
+        self.recorder = InputRecorder(self, god_mode=god_mode)
+
+    def stop_recording(self, path=None):
+        """Guarda la grabación en curso (si la hay) y devuelve su ruta."""
+        recorder, self.recorder = self.recorder, None
+        if recorder is None:
+            return None
+        try:
+            return recorder.save(path)
+        except OSError as e:
+            print(f"[ERROR] No se pudo guardar la grabación: {e}")
+            return None
 
     # ============================================================
     def reset_game(self):
-        """Reinicia el juego completamente."""
+        """
+        Reinicia el juego completamente (nueva semilla y, si se grababa, nueva grabación).
+        El estado de la simulación se crea de nuevo en el mismo orden que en
+        __init__, horda incluida: una partida tras reiniciar es la misma que la
+        de un Game(seed=...) recién creado y su grabación se reproduce igual.
+        """
+        recording = self.recorder is not None
+        self.stop_recording()
+        self.release_pooled()
+        self.audio.reset()
+
+        self.seed = seed_streams()
+        self.time = 0.0
         self.lose_menu = None
         self.paused = False
         self.return_to_main_menu = False
         self.current_cursor = self.cursor_game
 
-        # Reset entidades
-        self.player = Player((self.world_width / 2, self.world_height / 2))
-        self.zombies.empty()
-        self.bullets.empty()
-        self.upgrades.empty()
-        self.effects.empty()
-
-        # Reset HUD / cámara
-        self.hud = HUD(self.font)
-        self.camera = Camera(self.world_width, self.world_height)
-        self.pause_menu = PauseMenu(self.screen, self.screen_width, self.screen_height)
-        self.ui_manager = UIManager(self.player)
-
-        # Reset Spawner
+        # Spawner, jugador, horda, mundo, índices, cámara, HUD y zombies iniciales
         self.spawner = Spawner(self)
+        self.initialize_game_state()
 
-        # Zombies iniciales lejos (rareza común)
-        min_distance = max(600, int((self.world_width + self.world_height) / 10))
-        for _ in range(8):
-            pos = self._spawn_initial_far(min_distance)
-            self.zombies.add(Zombie(pos, "common", rarity="common"))
+        if recording:
+            self.start_recording()
+
+    def release_pooled(self):
+        """kill() en vez de empty(): devuelve balas, mejoras e impactos a sus pools."""
+        for group in (self.bullets, self.upgrades, self.effects):
+            for sprite in group.sprites():
+                sprite.kill()
 
     # ============================================================
     def load_resources(self):
-        """Pantalla de carga bloqueante."""
+        """Pantalla de carga bloqueante con el progreso real de core/assets.AssetLoader."""
         if pygame.mixer.get_init() and pygame.mixer.music.get_busy():
             pygame.mixer.music.pause()
 
         self.loading_screen.draw()
         pygame.display.flip()
 
-        resources = [
-            "textures", "player", "zombies", "bullets",
-            "upgrades", "effects", "hud", "sounds", "map"
-        ]
-
-        total = len(resources)
-        for i, r in enumerate(resources, 1):
-            pygame.time.delay(200)
-            self.loading_screen.update_progress(i / total)
+        # Todo lo de assets/ decodificado en hilos + sprites derivados de la partida; lo ya cargado se salta
+        AssetLoader().run(self.loading_screen.update_progress, warmers=gameplay_warmers())
 
         if pygame.mixer.get_init():
             pygame.mixer.music.unpause()
\ No newline at end of file
@@ -0,0 +1,127 @@
+# core/headless.py
+"""
+Simulación sin ventana ni audio para medir el coste de Game.update.
+
+Uso:
+    python -m core.headless --ticks 3600
+    python -m core.headless --waves 10 --god
+"""
+import os
+import io
+import sys
+import time
+import argparse
+import contextlib
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from settings import SIM_TICK_RATE
+
+
+def run_headless(ticks=None, waves=None, dt=1.0 / SIM_TICK_RATE, input_source=None, seed=None,
+                 god_mode=False, draw=False, quiet=True, game=None, profile_csv=None, record=None):
+    """
+    Ejecuta Game.update con paso fijo `dt` tan rápido como permita la CPU.
+
+    Se detiene tras `ticks` ticks, al completar `waves` oleadas o cuando muere el
+    jugador. `god_mode` mantiene la vida y la munición de reserva al máximo para
+    poder llegar a oleadas altas. Con `profile_csv` se activa el profiler por fases
+    y al final se vuelca su buffer a ese CSV. Con `record` se graba la sesión en
+    esa ruta para reproducirla con core/replay.py. Devuelve un dict con las métricas.
+    """
+    from core.game import Game
+    from core.input import AutoAimInput
+    from core.pool import pool_stats, reset_pool_stats
+
+    if ticks is None and waves is None:
+        raise ValueError("Indica ticks o waves")
+    out = io.StringIO() if quiet else sys.stdout
+    with contextlib.redirect_stdout(out):
+        if game is None:
+            game = Game(headless=True, input_source=input_source or AutoAimInput(), seed=seed)
+        if record:
+            game.start_recording(god_mode=god_mode)
+        inp = game.input
+        prof = game.profiler
+        prof.enabled = profile_csv is not None
+        reset_pool_stats()
+
+        tick = 0
+        update_time = 0.0
+        start = time.perf_counter()
+        while game.running:
+            if ticks is not None and tick >= ticks:
+                break
+            if waves is not None and game.spawner.current_wave > waves:
+                break
+            if game.lose_menu is not None:
+                break
+
+            prof.begin_frame()
+            if hasattr(inp, "advance"):
+                inp.advance(game)
+            game.handle_events()
+            prof.lap("input")
+            if god_mode:
+                game.player.health = game.player.max_health
+                game.player.weapon.reserve_ammo = max(game.player.weapon.reserve_ammo, game.player.weapon.max_ammo)
+
+            t0 = time.perf_counter()
+            if not game.paused:
+                game.update(dt)
+            update_time += time.perf_counter() - t0
+            if draw:
+                game.draw()
+            prof.end_frame()
+            tick += 1
+        elapsed = time.perf_counter() - start
+        if record:
+            game.stop_recording(record)
+        if profile_csv:
+            game.dump_profile(profile_csv)
+
+    return {
+        "ticks": tick,
+        "seed": game.seed,
+        "dt": dt,
+        "sim_seconds": game.time,
+        "elapsed_s": elapsed,
+        "ticks_per_second": tick / elapsed if elapsed > 0 else float("inf"),
+        "update_ms_mean": update_time / max(1, tick) * 1000,
+        "wave": game.spawner.current_wave,
+        "zombies": len(game.zombies),
+        "score": game.player.score,
+        "player_alive": game.lose_menu is None,
+        "pools": pool_stats(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulación headless de Zombie Survival")
+    parser.add_argument("--ticks", type=int, default=None, help="Número de ticks a simular")
+    parser.add_argument("--waves", type=int, default=None, help="Oleadas a completar")
+    parser.add_argument("--dt", type=float, default=1.0 / SIM_TICK_RATE, help="Paso fijo en segundos")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--god", action="store_true", help="Vida y munición infinitas")
+    parser.add_argument("--draw", action="store_true", help="Incluir Game.draw en cada tick")
+    parser.add_argument("--profile-csv", default=None, help="Volcar tiempos por fase a este CSV")
+    parser.add_argument("--record", default=None, help="Grabar la sesión en esta ruta (.json.gz)")
+    parser.add_argument("--verbose", action="store_true", help="No silenciar los prints del juego")
+    args = parser.parse_args(argv)
+    if args.ticks is None and args.waves is None:
+        args.ticks = 60 * SIM_TICK_RATE
+
+    stats = run_headless(ticks=args.ticks, waves=args.waves, dt=args.dt, seed=args.seed,
+                         god_mode=args.god, draw=args.draw, quiet=not args.verbose,
+                         profile_csv=args.profile_csv, record=args.record)
+    pools = stats.pop("pools")
+    for key, value in stats.items():
+        print(f"{key:>18}: {value:.3f}" if isinstance(value, float) else f"{key:>18}: {value}")
+    for name, p in pools.items():
+        print(f"{'pool ' + name:>18}: hits {p['hits']} misses {p['misses']} high-water {p['high_water']}/{p['size']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
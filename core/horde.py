@@ -0,0 +1,363 @@
+# core/horde.py
+import numpy as np
+import pygame
+from settings import (
+    CROWD_SEPARATION, CROWD_PERSONAL_SPACE, CROWD_SEPARATION_WEIGHT, CROWD_PUSH_LIMIT,
+    CROWD_CELL_SIZE, CROWD_MAX_PAIRS,
+)
+from core.animation import CLIP_ATTACK, frame_indices
+
+# Códigos de dirección (mismo criterio que Zombie._set_dir)
+DIR_FRONT, DIR_BACK, DIR_LEFT, DIR_RIGHT = 0, 1, 2, 3
+DIR_NAMES = ("front", "back", "left", "right")
+DIR_CODES = {name: code for code, name in enumerate(DIR_NAMES)}
+
+# Fases de animación repartidas por la razón áurea: deterministas y sin tocar los flujos de core/rng.py
+_PHASE_STEP = 0.6180339887
+
+
+class Horde:
+    """
+    Simulación por lotes de la horda (struct-of-arrays).
+
+    Posiciones, velocidades, radios, daño, dirección y distancia al jugador de todos los zombies viven
+    en arrays NumPy contiguos; `step()` los avanza hacia el jugador en una sola
+    operación vectorizada. Los sprites solo reciben rect/imagen en
+    `sync_visible()`, es decir, únicamente los que se van a dibujar.
+    Con CROWD_SEPARATION los vecinos se buscan en una rejilla por cubos (ver
+    `_separation()`) y cada zombie se aparta de los que invaden su espacio.
+    Las estadísticas (tipo, nivel, rareza) se siguen calculando en Zombie.__init__
+    y se copian aquí al registrarse el zombie.
+    La animación (core/animation.py) sale del reloj de la horda, la fase de
+    cada zombie y si está en contacto con el jugador (clip de ataque).
+    """
+
+    def __init__(self, capacity=256):
+        self.count = 0
+        self.sprites = []
+        self.ticks = 0
+        self.clock = 0.0      # segundos simulados (reloj de las animaciones)
+        self.spawned = 0      # zombies registrados en total (reparto de fases)
+        self.crowd_pairs = 0  # pares evaluados en el último tick (estadística)
+        self._alloc(capacity)
+
+    def _alloc(self, capacity):
+        old = getattr(self, "pos", None)
+        n = self.count
+        self.capacity = capacity
+
+        def grow(arr, shape, dtype):
+            new = np.zeros(shape, dtype=dtype)
+            if arr is not None:
+                new[:n] = arr[:n]
+            return new
+
+        self.pos = grow(old, (capacity, 2), np.float64)
+        self.prev_pos = grow(getattr(self, "prev_pos", None), (capacity, 2), np.float64)
+        self.speed = grow(getattr(self, "speed", None), capacity, np.float64)
+        self.radius = grow(getattr(self, "radius", None), capacity, np.float64)
+        self.half_size = grow(getattr(self, "half_size", None), capacity, np.float64)
+        self.damage = grow(getattr(self, "damage", None), capacity, np.float64)
+        self.dir = grow(getattr(self, "dir", None), capacity, np.int8)
+        self.alive = grow(getattr(self, "alive", None), capacity, np.bool_)
+        self.distance = grow(getattr(self, "distance", None), capacity, np.float64)
+        self.attacking = grow(getattr(self, "attacking", None), capacity, np.bool_)
+        self.anim_phase = grow(getattr(self, "anim_phase", None), capacity, np.float64)
+
+    # ==========================================================
+    # Registro de zombies
+    # ==========================================================
+    def add(self, zombie):
+        if self.count == self.capacity:
+            self._alloc(self.capacity * 2)
+        i = self.count
+        pos = zombie.pos
+        self.pos[i] = (pos.x, pos.y)
+        self.prev_pos[i] = (pos.x, pos.y)
+        self.speed[i] = zombie.speed
+        self.radius[i] = zombie.radius
+        self.half_size[i] = max(zombie.rect.width, zombie.rect.height) / 2
+        self.damage[i] = zombie.damage
+        self.dir[i] = DIR_CODES.get(zombie.direction, DIR_FRONT)
+        self.alive[i] = not zombie.dead
+        self.distance[i] = 0.0
+        self.attacking[i] = False
+        self.anim_phase[i] = (self.spawned * _PHASE_STEP) % 1.0
+        self.spawned += 1
+        self.sprites.append(zombie)
+        self.count += 1
+        zombie.horde = self
+        zombie.slot = i
+
+    def remove(self, zombie):
+        """Quita el zombie moviendo el último slot a su hueco (O(1))."""
+        i = zombie.slot
+        if zombie.horde is not self or i < 0:
+            return
+        # Conservar la última posición conocida en el sprite
+        zombie._pos = pygame.Vector2(self.pos[i, 0], self.pos[i, 1])
+        zombie.horde = None
+        zombie.slot = -1
+
+        last = self.count - 1
+        if i != last:
+            for arr in (self.pos, self.prev_pos, self.speed, self.radius, self.half_size, self.damage,
+                        self.dir, self.alive, self.distance, self.attacking, self.anim_phase):
+                arr[i] = arr[last]
+            moved = self.sprites[last]
+            self.sprites[i] = moved
+            moved.slot = i
+        self.sprites.pop()
+        self.count = last
+
+    # ==========================================================
+    # Simulación
+    # ==========================================================
+    def step(self, dt, player, player_radius, flow=None):
+        """
+        Avanza todos los zombies vivos hacia el jugador.
+        Con `flow` (core/flowfield.FlowField) los que no lo ven en línea recta
+        siguen la dirección del campo; el resto, y todos si no hay campo, van
+        directos hacia él.
+        Devuelve el daño por segundo total de los zombies en contacto con él.
+        """
+        n = self.count
+        if n == 0:
+            return 0.0
+        pos = self.pos[:n]
+        alive = self.alive[:n]
+        self.prev_pos[:n] = pos
+        self.ticks += 1
+        self.clock += dt
+        target = np.array((player.pos.x, player.pos.y))
+
+        delta = target - pos
+        dist = np.hypot(delta[:, 0], delta[:, 1])
+        moving = alive & (dist > 0)
+        inv = np.zeros(n)
+        np.divide(1.0, dist, out=inv, where=moving)
+        d = delta * inv[:, None]
+        if flow is not None and flow.valid:
+            ux, uy, use = flow.sample(pos[:, 0], pos[:, 1])
+            use &= moving
+            d[use, 0], d[use, 1] = ux[use], uy[use]
+        step = self.speed[:n] * dt
+
+        idx = np.flatnonzero(alive)
+        if CROWD_SEPARATION and idx.size > 1:
+            # Ya en contacto: dejan de empujar hacia el centro del jugador (siguen haciendo daño)
+            seek = d[idx]
+            seek[dist[idx] <= self.radius[idx] + player_radius] = 0.0
+            steer, push = self._separation(idx)
+            # Dirección deseada = hacia el jugador + separación (renormalizada)
+            want = seek + CROWD_SEPARATION_WEIGHT * steer
+            norm = np.hypot(want[:, 0], want[:, 1])
+            ok = norm > 1e-9
+            want[ok] /= norm[ok, None]
+            want[~ok] = seek[~ok]
+            # Corrección de solape limitada a CROWD_PUSH_LIMIT * speed * dt
+            limit = step[idx] * CROWD_PUSH_LIMIT
+            plen = np.hypot(push[:, 0], push[:, 1])
+            scale = np.minimum(1.0, limit / np.maximum(plen, 1e-9))
+            pos[idx] += want * step[idx, None] + push * scale[:, None]
+        else:
+            pos += d * step[:, None]
+
+        # Dirección (abs(dx) > abs(dy) -> lateral, si no frente/espalda)
+        dx, dy = d[:, 0], d[:, 1]
+        code = np.where(np.abs(dx) > np.abs(dy),
+                        np.where(dx > 0, DIR_RIGHT, DIR_LEFT),
+                        np.where(dy > 0, DIR_FRONT, DIR_BACK))
+        self.dir[:n] = np.where(moving, code, self.dir[:n])
+
+        # Contacto con el jugador (después de moverse, como antes)
+        delta = target - pos
+        dist = np.hypot(delta[:, 0], delta[:, 1])
+        self.distance[:n] = dist
+        contact = alive & (dist <= self.radius[:n] + player_radius)
+        self.attacking[:n] = contact
+        return float(self.damage[:n][contact].sum())
+
+    def _separation(self, idx):
+        """
+        Separación entre los zombies `idx` (vivos) con una rejilla por cubos en NumPy.
+
+        Los zombies se ordenan por celda de CROWD_CELL_SIZE px. Para los normales
+        basta con las 8 celdas vecinas. Los grandes (tank, boss) buscan en un
+        anillo más ancho y generan el par en los dos sentidos. Así una sola
+        criatura grande no obliga a agrandar todas las celdas. Los pares
+        candidatos se generan de golpe con np.repeat. Para cada par solapado, i
+        se aparta de j en proporción al peso de j (radio²): un tank o un boss
+        aparta a los pequeños y apenas se mueve. Si hay más de CROWD_MAX_PAIRS
+        candidatos, en cada tick solo se procesa una parte de los normales
+        (reparto rotatorio).
+
+        Devuelve (steer, push) por zombie de `idx`: dirección de separación
+        (adimensional) y corrección de posición en px.
+        """
+        m = idx.size
+        p = self.pos[idx]
+        r = self.radius[idx]
+        space = CROWD_PERSONAL_SPACE
+        cs = float(CROWD_CELL_SIZE)
+        steer = np.zeros((m, 2))
+        push = np.zeros((m, 2))
+
+        # Alcance en celdas: 1 para los normales, más para los grandes
+        reach_cells = np.ceil((r + r.max()) * space / cs).astype(np.int64)
+        large = 2.0 * space * r > cs
+
+        # Clave de celda con margen para que las vecinas no se salgan de rango
+        pad = int(reach_cells.max())
+        cell = np.floor(p / cs).astype(np.int64)
+        cell -= cell.min(axis=0) - pad
+        rows = int(cell[:, 1].max()) + pad + 1
+        key = cell[:, 0] * rows + cell[:, 1]
+        order = np.argsort(key, kind="stable")
+        skey = key[order]
+        first = np.flatnonzero(np.r_[True, skey[1:] != skey[:-1]])
+        ukey = skey[first]
+        count = np.diff(np.r_[first, m])
+
+        def candidates(owners, k):
+            """(owner, j) de las celdas a <= k de cada owner."""
+            span = np.arange(-k, k + 1)
+            offsets = (span[:, None] * rows + span[None, :]).ravel()
+            target = key[owners][:, None] + offsets[None, :]
+            loc = np.minimum(np.searchsorted(ukey, target), ukey.size - 1)
+            hit = ukey[loc] == target
+            cnt = np.where(hit, count[loc], 0).ravel()
+            st = np.where(hit, first[loc], 0).ravel()
+            total = int(cnt.sum())
+            if total == 0:
+                return np.empty(0, np.int64), np.empty(0, np.int64)
+            own = np.repeat(np.repeat(owners, offsets.size), cnt)
+            base = np.cumsum(cnt) - cnt
+            return own, order[np.repeat(st - base, cnt) + np.arange(total)]
+
+        # Normales contra normales (±1 celda), con presupuesto de pares
+        small = np.flatnonzero(~large)
+        if small.size > 1:
+            estimate = int(count.max()) * 9 * small.size
+            if estimate > CROWD_MAX_PAIRS:
+                groups = -(-estimate // CROWD_MAX_PAIRS)
+                small = small[small % groups == self.ticks % groups]
+        own_s, j_s = candidates(small, 1)
+        own, j, valid = [own_s], [j_s], [~large[j_s]]
+
+        # Grandes contra todos, en su anillo; el par se añade también al revés si j es normal
+        for k in np.unique(reach_cells[large]).tolist():
+            own_b, j_b = candidates(np.flatnonzero(large & (reach_cells == k)), k)
+            mirror = np.flatnonzero(~large[j_b])
+            own += [own_b, j_b[mirror]]
+            j += [j_b, own_b[mirror]]
+            valid += [np.ones(own_b.size, dtype=bool), np.ones(mirror.size, dtype=bool)]
+        owner, j, valid = np.concatenate(own), np.concatenate(j), np.concatenate(valid)
+        self.crowd_pairs = owner.size
+        if owner.size == 0:
+            return steer, push
+
+        # Filtro por distancia² antes de la raíz (la mayoría de candidatos están lejos)
+        px, py = p[:, 0].copy(), p[:, 1].copy()
+        dx = px[owner] - px[j]
+        dy = py[owner] - py[j]
+        reach = (r[owner] + r[j]) * space
+        close = np.flatnonzero(valid & (owner != j) & (dx * dx + dy * dy < reach * reach))
+        if close.size == 0:
+            return steer, push
+        owner, j, dx, dy, reach = owner[close], j[close], dx[close], dy[close], reach[close]
+        dist = np.sqrt(dx * dx + dy * dy)
+
+        # Misma posición: dirección fija por índice (determinista, sin aleatorio)
+        same = dist < 1e-6
+        if same.any():
+            a, b = owner[same], j[same]
+            angle = np.minimum(a, b) * 2.399963
+            sign = np.where(a < b, 1.0, -1.0)
+            dx[same], dy[same], dist[same] = sign * np.cos(angle), sign * np.sin(angle), 1.0
+        ux, uy = dx / dist, dy / dist
+        overlap = reach - dist
+        w = r * r
+        share = w[j] / (w[owner] + w[j])
+        f = overlap / reach * share
+        g = overlap * share * 0.5
+        steer[:, 0] = np.bincount(owner, ux * f, minlength=m)
+        steer[:, 1] = np.bincount(owner, uy * f, minlength=m)
+        push[:, 0] = np.bincount(owner, ux * g, minlength=m)
+        push[:, 1] = np.bincount(owner, uy * g, minlength=m)
+        return steer, push
+
+    # ==========================================================
+    # Escritura a sprites
+    # ==========================================================
+    def _frames(self, slots):
+        """(clip, fotograma) de los slots `slots`: ataque en contacto, si no caminar en su dirección."""
+        clips = np.where(self.attacking[slots], CLIP_ATTACK, self.dir[slots])
+        return clips.tolist(), frame_indices(clips, self.clock, self.anim_phase[slots]).tolist()
+
+    def sync_sprite(self, i):
+        z = self.sprites[i]
+        z.rect.center = (round(self.pos[i, 0]), round(self.pos[i, 1]))
+        if self.alive[i]:
+            z.direction = DIR_NAMES[self.dir[i]]
+            if z.anim is not None:
+                (clip,), (frame,) = self._frames(np.array([i]))
+                z.image = z.anim.clips[clip][frame]
+
+    def sync_visible(self, view_x, view_y, view_w, view_h, alpha=1.0):
+        """
+        Actualiza rect/imagen solo de los zombies que tocan la vista y los devuelve.
+        Con alpha < 1 el rect se coloca entre la posición del tick anterior y la actual.
+        Clip y fotograma se calculan para todos los visibles a la vez; cada
+        sprite solo indexa la tabla de su atlas.
+        """
+        n = self.count
+        if n == 0:
+            return []
+        x, y = self.pos[:n, 0], self.pos[:n, 1]
+        e = self.half_size[:n]
+        visible = np.flatnonzero((x + e >= view_x) & (x - e <= view_x + view_w) &
+                                 (y + e >= view_y) & (y - e <= view_y + view_h))
+        sprites = self.sprites
+        if alpha < 1.0:
+            drawn = self.prev_pos[visible] + (self.pos[visible] - self.prev_pos[visible]) * alpha
+            xs = np.rint(drawn[:, 0]).astype(int).tolist()
+            ys = np.rint(drawn[:, 1]).astype(int).tolist()
+        else:
+            xs = np.rint(x[visible]).astype(int).tolist()
+            ys = np.rint(y[visible]).astype(int).tolist()
+        alive = self.alive[visible].tolist()
+        codes = self.dir[visible].tolist()
+        clips, frames = self._frames(visible)
+        out = []
+        for i, cx, cy, is_alive, code, clip, frame in zip(visible.tolist(), xs, ys, alive, codes, clips, frames):
+            z = sprites[i]
+            z.rect.center = (cx, cy)
+            if is_alive:
+                z.direction = DIR_NAMES[code]
+                if z.anim is not None:
+                    z.image = z.anim.clips[clip][frame]
+            out.append(z)
+        return out
+
+    # ==========================================================
+    # Consultas
+    # ==========================================================
+    def alive_indices(self):
+        return np.flatnonzero(self.alive[:self.count])
+
+
+class ZombieGroup(pygame.sprite.Group):
+    """Grupo de sprites que registra/quita automáticamente sus zombies en la horda."""
+
+    def __init__(self, horde, *sprites):
+        self.horde = horde
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite)
+        self.horde.add(sprite)
+
+    def remove_internal(self, sprite):
+        self.horde.remove(sprite)
+        super().remove_internal(sprite)
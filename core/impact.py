@@ -1,33 +1,58 @@
 import pygame
-from utils.helpers import load_image_safe, clean_image_background, load_sound
+from settings import POOL_IMPACTS
+from utils.helpers import get_sprite, get_alpha_steps
+from core.pool import ObjectPool, PooledSprite
 
-class Impact(pygame.sprite.Sprite):
-    def __init__(self,pos,size=(50,50)):
+IMPACT_PATH = "weapons/impact.png"
+IMPACT_ALPHA_STEPS = 16  # Niveles de transparencia precalculados para el desvanecido
+IMPACT_SIZE = (50, 50)
+
+
+class Impact(PooledSprite):
+    def __init__(self,pos=(0,0),size=IMPACT_SIZE):
         super().__init__()
-        image = load_image_safe("weapons/impact.png")
-        if image:
-            image = clean_image_background(pygame.transform.scale(image,size))
-            self.image=image
-        else:
-            print("[DEBUG] Placeholder para impacto")
-            self.image=pygame.Surface(size,pygame.SRCALPHA)
-            pygame.draw.circle(self.image,(255,180,50),(size[0]//2,size[1]//2),size[0]//2)
-        self.rect=self.image.get_rect(center=pos)
-        self.timer=0.0
+        self.rect=pygame.Rect(0,0,0,0)
         self.duration=0.25
+        self.reset(pos,size)
+
+    @classmethod
+    def acquire(cls,pos,size=IMPACT_SIZE):
+        """Impacto del pool (reutilizado si hay alguno libre)."""
+        return cls.pool.acquire(pos,size)
+
+    def reset(self,pos,size=IMPACT_SIZE):
+        self.size=tuple(size)
+        self.frames=self._alpha_frames(self.size)
+        self.image=self.frames[0]
+        self.rect.size=self.image.get_size()
+        self.rect.center=pos
+        self.timer=0.0
         self.alpha=255
 
-        # Sonido de impacto
-        self.sound = load_sound("impact.mp3", volume=0.4)
-        if self.sound:
-            try:
-                ch = pygame.mixer.find_channel(True)
-                ch.play(self.sound, maxtime=int(0.5*1000))
-            except Exception: pass
+    @classmethod
+    def preload(cls):
+        """Construye los pasos de alpha del tamaño por defecto (pantalla de carga)."""
+        cls._alpha_frames(IMPACT_SIZE)
+
+    @staticmethod
+    def _alpha_frames(size):
+        """Lista compartida de superficies de 255 a 0 de alpha (índice 0 = opaco)."""
+        def base():
+            image = get_sprite(IMPACT_PATH, size)
+            if image is None:
+                print("[DEBUG] Placeholder para impacto")
+                image = pygame.Surface(size, pygame.SRCALPHA)
+                pygame.draw.circle(image, (255,180,50), (size[0]//2,size[1]//2), size[0]//2)
+            return image
+        return get_alpha_steps((IMPACT_PATH, size), base, IMPACT_ALPHA_STEPS)
 
     def update(self, dt):
         self.timer+=dt
         if self.timer>self.duration: self.kill()
         else:
             self.alpha=max(0,255*(1-self.timer/self.duration))
-            self.image.set_alpha(self.alpha)
+            step=min(IMPACT_ALPHA_STEPS-1, int(self.timer/self.duration*IMPACT_ALPHA_STEPS))
+            self.image=self.frames[step]
+
+
+Impact.pool = ObjectPool(Impact, POOL_IMPACTS, "impacts")
@@ -0,0 +1,88 @@
+# core/input.py
+import pygame
+
+
+class LiveInput:
+    """Fuente de entrada real: teclado, ratón y cola de eventos de pygame."""
+
+    def get_pressed(self):
+        return pygame.key.get_pressed()
+
+    def get_mouse_pos(self):
+        return pygame.mouse.get_pos()
+
+    def events(self):
+        return pygame.event.get()
+
+
+class KeyState:
+    """Imita el resultado de pygame.key.get_pressed() a partir de un set de teclas."""
+
+    def __init__(self, keys=()):
+        self.keys = set(keys)
+
+    def __getitem__(self, key):
+        return key in self.keys
+
+
+class ScriptedInput:
+    """
+    Fuente de entrada programable (modo headless, benchmarks, pruebas).
+
+    `script(game, tick, inp)` se llama una vez por tick antes de leer la entrada y
+    puede modificar `inp.keys`, `inp.mouse_pos` o llamar a `inp.click()`.
+    """
+
+    def __init__(self, script=None, mouse_pos=(0, 0)):
+        self.script = script
+        self.keys = set()
+        self.mouse_pos = tuple(mouse_pos)
+        self._pending = []
+        self.tick = 0
+
+    def click(self, pos=None, button=1):
+        if pos is not None:
+            self.mouse_pos = tuple(pos)
+        self._pending.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=button, pos=self.mouse_pos))
+
+    def press(self, key):
+        self._pending.append(pygame.event.Event(pygame.KEYDOWN, key=key))
+
+    def advance(self, game):
+        if self.script:
+            self.script(game, self.tick, self)
+        self.tick += 1
+
+    def get_pressed(self):
+        return KeyState(self.keys)
+
+    def get_mouse_pos(self):
+        return self.mouse_pos
+
+    def events(self):
+        events, self._pending = self._pending, []
+        return events
+
+
+class AutoAimInput(ScriptedInput):
+    """Piloto automático: apunta al zombie vivo más cercano, dispara y recarga."""
+
+    def __init__(self, fire_every=1):
+        super().__init__(script=self._aim)
+        self.fire_every = max(1, int(fire_every))
+
+    def _aim(self, game, tick, inp):
+        inp.keys.discard(pygame.K_r)
+        weapon = game.player.weapon
+        if weapon.current_ammo <= 0:
+            inp.keys.add(pygame.K_r)
+            return
+
+        horde = game.horde
+        alive = horde.alive_indices()
+        if alive.size == 0 or tick % self.fire_every:
+            return
+        d = horde.distance[alive]
+        i = alive[d.argmin()]
+        x, y = horde.pos[i]
+        self.click((x - game.camera.offset.x, y - game.camera.offset.y))
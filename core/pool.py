@@ -0,0 +1,105 @@
+# core/pool.py
+import abc
+import pygame
+
+# Pools registrados por nombre (para estadísticas)
+POOLS = {}
+
+
+class ObjectPool:
+    """
+    Pool de instancias reutilizables: acquire() -> reset() -> release().
+
+    `factory()` crea una instancia nueva (sin argumentos) cuando no queda ninguna
+    libre; acquire() llama a `obj.reset(*args)` antes de devolverla. Se guardan
+    como máximo `size` instancias libres, el resto se descarta al liberarse.
+    Estadísticas: hits (reutilizadas), misses (creadas), high_water (máximo en uso).
+    """
+
+    def __init__(self, factory, size, name):
+        self.factory = factory
+        self.size = int(size)
+        self.name = name
+        self.free = []
+        self.in_use = 0
+        self.hits = 0
+        self.misses = 0
+        self.high_water = 0
+        self.discarded = 0
+        POOLS[name] = self
+
+    def _create(self):
+        obj = self.factory()
+        obj._pool = self
+        obj._pooled = True
+        return obj
+
+    def prewarm(self, count=None):
+        """Crea instancias libres hasta `count` (por defecto el tamaño del pool)."""
+        count = self.size if count is None else min(count, self.size)
+        while len(self.free) < count:
+            self.free.append(self._create())
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            obj = self.free.pop()
+            self.hits += 1
+        else:
+            obj = self._create()
+            self.misses += 1
+        obj._pooled = False
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        obj.reset(*args, **kwargs)
+        return obj
+
+    def release(self, obj):
+        if obj._pooled:
+            return  # ya liberada (p.ej. kill() repetido)
+        obj._pooled = True
+        self.in_use -= 1
+        if len(self.free) < self.size:
+            self.free.append(obj)
+        else:
+            self.discarded += 1
+
+    def reset_stats(self):
+        self.hits = self.misses = self.discarded = 0
+        self.high_water = self.in_use
+
+    def stats(self):
+        return {
+            "size": self.size,
+            "free": len(self.free),
+            "in_use": self.in_use,
+            "hits": self.hits,
+            "misses": self.misses,
+            "high_water": self.high_water,
+            "discarded": self.discarded,
+        }
+
+
+class PooledSprite(pygame.sprite.Sprite, metaclass=abc.ABCMeta):
+    """Sprite que vuelve a su pool al hacer kill(). Las subclases implementan reset()."""
+
+    _pool = None
+    _pooled = False
+
+    @abc.abstractmethod
+    def reset(self, *args, **kwargs):
+        """Deja la instancia lista para reutilizarse con los argumentos de acquire()."""
+
+    def kill(self):
+        super().kill()
+        if self._pool is not None:
+            self._pool.release(self)
+
+
+def pool_stats():
+    return {name: pool.stats() for name, pool in POOLS.items()}
+
+
+def reset_pool_stats():
+    for pool in POOLS.values():
+        pool.reset_stats()
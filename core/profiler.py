@@ -0,0 +1,159 @@
+# core/profiler.py
+import csv
+import time
+import numpy as np
+import pygame
+from settings import PROFILER_HISTORY
+
+# Fases medidas en Game.update / Game.draw (en orden de ejecución)
+UPDATE_STAGES = ("input", "player", "bullets", "flow", "horde", "audio", "corpses", "upgrades", "effects", "grids", "spawner")
+DRAW_STAGES = ("background", "zombies", "bullets_draw", "upgrades_draw", "effects_draw", "player_draw",
+               "hud", "minimap", "menus", "overlay", "flip")
+STAGES = UPDATE_STAGES + DRAW_STAGES
+
+
+class FrameProfiler:
+    """
+    Temporizadores por fase con buffer circular de tamaño fijo.
+
+    Uso: begin_frame() al inicio del frame, lap("fase", n_entidades) al terminar
+    cada fase y end_frame() al final. Cada lap() mide desde el lap anterior.
+    Desactivado (por defecto) cada llamada solo comprueba `enabled` y retorna.
+    """
+
+    def __init__(self, stages=STAGES, capacity=PROFILER_HISTORY):
+        self.stages = tuple(stages)
+        self._index = {name: i for i, name in enumerate(self.stages)}
+        self.capacity = int(capacity)
+        self.times = np.zeros((self.capacity, len(self.stages)), dtype=np.float32)
+        self.counts = np.zeros((self.capacity, len(self.stages)), dtype=np.int32)
+        self.totals = np.zeros(self.capacity, dtype=np.float32)
+        self.frames = 0  # frames registrados (puede superar capacity)
+        self.enabled = False
+        self._row = 0
+        self._last = 0.0
+        self._start = 0.0
+
+    # ==========================================================
+    # Registro
+    # ==========================================================
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self._row = self.frames % self.capacity
+        self.times[self._row] = 0.0
+        self.counts[self._row] = 0
+        self._start = self._last = time.perf_counter()
+
+    def lap(self, stage, count=0):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        i = self._index[stage]
+        self.times[self._row, i] += now - self._last
+        self.counts[self._row, i] = count
+        self._last = now
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        self.totals[self._row] = time.perf_counter() - self._start
+        self.frames += 1
+
+    def reset(self):
+        self.frames = 0
+        self.totals[:] = 0.0
+
+    # ==========================================================
+    # Consultas
+    # ==========================================================
+    def _ordered(self, arr):
+        """Filas del buffer en orden cronológico."""
+        n = min(self.frames, self.capacity)
+        if self.frames <= self.capacity:
+            return arr[:n]
+        start = self.frames % self.capacity
+        return np.concatenate((arr[start:], arr[:start]))
+
+    def recent_totals_ms(self):
+        return self._ordered(self.totals) * 1000.0
+
+    def percentiles(self, q=(50, 95, 99)):
+        """Percentiles (ms) del frame total y de cada fase."""
+        n = min(self.frames, self.capacity)
+        if n == 0:
+            return {}
+        result = {"total": np.percentile(self.totals[:n] * 1000.0, q)}
+        times = self.times[:n] * 1000.0
+        for name, i in self._index.items():
+            result[name] = np.percentile(times[:, i], q)
+        return result
+
+    def dump_csv(self, path):
+        """Escribe el buffer (orden cronológico) en CSV: ms por fase y entidades por fase."""
+        times = self._ordered(self.times) * 1000.0
+        counts = self._ordered(self.counts)
+        totals = self.recent_totals_ms()
+        first = self.frames - len(totals)
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "total_ms"] + [f"{s}_ms" for s in self.stages] + [f"{s}_count" for s in self.stages])
+            for k in range(len(totals)):
+                writer.writerow([first + k, f"{totals[k]:.4f}"] + [f"{v:.4f}" for v in times[k]] + counts[k].tolist())
+        return path
+
+
+class ProfilerOverlay:
+    """Gráfica de tiempos de frame y percentiles por fase sobre la pantalla."""
+
+    def __init__(self, profiler, font, width=360, height=90, budget_ms=1000.0 / 60, refresh_frames=30):
+        self.profiler = profiler
+        self.font = font
+        self.width = width
+        self.height = height
+        self.budget_ms = budget_ms
+        self.visible = False
+        # Los percentiles y sus textos se recalculan cada `refresh_frames` frames
+        self.refresh_frames = refresh_frames
+        self._text_frame = -refresh_frames
+        self._text_surfaces = []
+
+    def toggle(self):
+        """Muestra/oculta el overlay; el profiler solo mide mientras está visible."""
+        self.visible = not self.visible
+        self.profiler.enabled = self.visible
+
+    def draw(self, surface, x=12, y=None):
+        if not self.visible:
+            return
+        if y is None:
+            y = surface.get_height() - self.height - 120
+        panel = pygame.Rect(x, y, self.width, self.height)
+        pygame.draw.rect(surface, (0, 0, 0), panel.inflate(8, 8))
+
+        # Gráfica: una barra por frame, escala = 2x presupuesto
+        totals = self.profiler.recent_totals_ms()[-self.width:]
+        scale = self.height / (self.budget_ms * 2)
+        budget_y = panel.bottom - int(self.budget_ms * scale)
+        for k, ms in enumerate(totals.tolist()):
+            h = min(self.height, int(ms * scale))
+            color = (60, 220, 60) if ms <= self.budget_ms else (240, 200, 40) if ms <= self.budget_ms * 1.5 else (230, 50, 50)
+            pygame.draw.line(surface, color, (panel.x + k, panel.bottom), (panel.x + k, panel.bottom - h))
+        pygame.draw.line(surface, (200, 200, 200), (panel.x, budget_y), (panel.right, budget_y))
+
+        # Percentiles: total + 4 fases más caras
+        if self.profiler.frames - self._text_frame >= self.refresh_frames:
+            self._text_frame = self.profiler.frames
+            self._text_surfaces = self._render_stats()
+        n = len(self._text_surfaces)
+        for k, text_surf in enumerate(self._text_surfaces):
+            surface.blit(text_surf, (panel.x, panel.y - 16 * (n - k) - 6))
+
+    def _render_stats(self):
+        stats = self.profiler.percentiles()
+        if not stats:
+            return []
+        lines = ["frame p50 {:.1f} p95 {:.1f} p99 {:.1f} ms".format(*stats.pop("total"))]
+        top = sorted(stats.items(), key=lambda kv: kv[1][1], reverse=True)[:4]
+        lines += ["{:<12} p95 {:.2f} ms".format(name, p[1]) for name, p in top]
+        return [self.font.render(text, True, (255, 255, 255)) for text in lines]
@@ -0,0 +1,46 @@
+# core/render.py
+"""
+Construcción de secuencias (superficie, posición) para Surface.blits.
+
+Las posiciones se calculan en pantalla restando el desplazamiento entero de la
+cámara a rect.x/rect.y, sin crear un Rect por sprite (a diferencia de
+Camera.apply). Cada capa se envía luego con una sola llamada a blits().
+Con alpha < 1 (simulación a paso fijo) los sprites con `prev_pos` se dibujan
+entre la posición del tick anterior y la actual.
+"""
+
+
+def blit_list(sprites, ox, oy):
+    """Secuencia para sprites ya recortados a la vista (p.ej. Horde.sync_visible)."""
+    out = []
+    append = out.append
+    for s in sprites:
+        r = s.rect
+        append((s.image, (r.x - ox, r.y - oy)))
+    return out
+
+
+def interp_delta(prev, pos, alpha):
+    """Desplazamiento entero desde `pos` hasta prev + (pos - prev) * alpha."""
+    t = alpha - 1.0
+    return round((pos.x - prev.x) * t), round((pos.y - prev.y) * t)
+
+
+def visible_blits(sprites, ox, oy, view_w, view_h, alpha=1.0):
+    """Secuencia solo con los sprites cuyo rect toca la vista (ox, oy, view_w, view_h)."""
+    right, bottom = ox + view_w, oy + view_h
+    out = []
+    append = out.append
+    interpolate = alpha < 1.0
+    for s in sprites:
+        r = s.rect
+        x, y = r.x, r.y
+        if interpolate:
+            prev = getattr(s, "prev_pos", None)
+            if prev is not None:
+                dx, dy = interp_delta(prev, s.pos, alpha)
+                x += dx
+                y += dy
+        if x < right and y < bottom and x + r.w > ox and y + r.h > oy:
+            append((s.image, (x - ox, y - oy)))
+    return out
@@ -0,0 +1,272 @@
+# core/replay.py
+"""
+Grabación y reproducción de partidas.
+
+Una grabación guarda la semilla (core/rng.py), el tamaño de pantalla y, por
+cada frame, lo que Game.handle_events leyó de la entrada: teclas pulsadas,
+posición del ratón y clics/teclas/QUIT, junto con cuántos ticks de simulación
+se ejecutaron después. Teclas y ratón solo se escriben cuando cambian. Cada
+REPLAY_CHECKSUM_INTERVAL ticks se guarda además un checksum del estado
+(state_checksum) para detectar la primera divergencia al reproducir.
+
+Uso:
+    python -m core.headless --waves 5 --god --seed 7 --record replays/w5.json.gz
+    python -m core.replay replays/w5.json.gz
+    python -m core.replay replays/w5.json.gz --profile-csv replay.csv
+"""
+import os
+import io
+import sys
+import gzip
+import json
+import time
+import zlib
+import struct
+import argparse
+import contextlib
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from core.input import KeyState
+from settings import REPLAY_DIR, REPLAY_CHECKSUM_INTERVAL
+
+REPLAY_VERSION = 1
+
+# Todas las teclas que pygame conoce (por keycode, no scancode)
+KEYCODES = tuple(sorted({getattr(pygame, n) for n in dir(pygame) if n.startswith("K_")}))
+
+# Códigos compactos de evento: [QUIT], [KEYDOWN, key], [MOUSEBUTTONDOWN, button, x, y]
+EV_QUIT, EV_KEY, EV_CLICK = 0, 1, 2
+
+
+def state_checksum(game):
+    """CRC32 del estado que decide la partida (reloj, jugador, horda, balas, mejoras)."""
+    p = game.player
+    w = p.weapon
+    header = struct.pack(
+        "<8d", game.time, p.pos.x, p.pos.y, p.health, p.score,
+        w.current_ammo, w.reserve_ammo, game.spawner.current_wave,
+    )
+    crc = zlib.crc32(header)
+    horde = game.horde
+    n = horde.count
+    crc = zlib.crc32(horde.pos[:n].tobytes(), crc)
+    crc = zlib.crc32(horde.alive[:n].tobytes(), crc)
+    coords = [c for b in game.bullets for c in (b.pos.x, b.pos.y)]
+    coords += [c for u in game.upgrades for c in (u.pos.x, u.pos.y)]
+    return zlib.crc32(struct.pack(f"<{len(coords)}d", *coords), crc)
+
+
+def _encode_events(events):
+    out = []
+    for e in events:
+        if e.type == pygame.QUIT:
+            out.append([EV_QUIT])
+        elif e.type == pygame.KEYDOWN:
+            out.append([EV_KEY, e.key])
+        elif e.type == pygame.MOUSEBUTTONDOWN:
+            out.append([EV_CLICK, e.button, *e.pos])
+    return out
+
+
+def _decode_events(codes):
+    events = []
+    for c in codes:
+        if c[0] == EV_QUIT:
+            events.append(pygame.event.Event(pygame.QUIT))
+        elif c[0] == EV_KEY:
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=c[1]))
+        else:
+            events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=c[1], pos=(c[2], c[3])))
+    return events
+
+
+class InputRecorder:
+    """
+    Graba una sesión de `game` desde su estado inicial (Game.start_recording).
+
+    Game.handle_events llama a record_frame() con lo leído de la entrada y
+    Game.update a record_tick() al final de cada tick.
+    """
+
+    def __init__(self, game, god_mode=False):
+        self.header = {
+            "version": REPLAY_VERSION,
+            "seed": game.seed,
+            "screen": [game.screen_width, game.screen_height],
+            "dt": None,
+            "god": god_mode,
+            "checksum_interval": REPLAY_CHECKSUM_INTERVAL,
+        }
+        self.frames = []      # [ticks, teclas | None, ratón | None, eventos]
+        self.checksums = []
+        self.ticks = 0
+        self._keys = None
+        self._mouse = None
+
+    def record_frame(self, keys, mouse_pos, events):
+        pressed = [k for k in KEYCODES if keys[k]]
+        mouse = list(mouse_pos)
+        frame = [0,
+                 pressed if pressed != self._keys else None,
+                 mouse if mouse != self._mouse else None,
+                 _encode_events(events)]
+        self._keys, self._mouse = pressed, mouse
+        self.frames.append(frame)
+
+    def record_tick(self, game, dt):
+        if self.header["dt"] is None:
+            self.header["dt"] = dt
+        if not self.frames:
+            self.frames.append([0, [], list(self._mouse or (0, 0)), []])
+        self.frames[-1][0] += 1
+        self.ticks += 1
+        if self.ticks % self.header["checksum_interval"] == 0:
+            self.checksums.append(state_checksum(game))
+
+    def save(self, path=None):
+        """Escribe la grabación (JSON comprimido con gzip) y devuelve la ruta."""
+        if path is None:
+            stamp = time.strftime("%Y%m%d_%H%M%S")
+            path = os.path.join(REPLAY_DIR, f"replay_{stamp}_{self.header['seed']}.json.gz")
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        data = dict(self.header, ticks=self.ticks, frames=self.frames, checksums=self.checksums)
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        print(f"[INFO] Partida grabada en {path} ({self.ticks} ticks, {len(self.frames)} frames)")
+        return path
+
+
+def load_replay(path):
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != REPLAY_VERSION:
+        raise ValueError(f"Versión de grabación no soportada: {data.get('version')}")
+    return data
+
+
+class ReplayInput:
+    """Fuente de entrada que devuelve, frame a frame, lo grabado por InputRecorder."""
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.index = -1
+        self.keys = KeyState()
+        self.mouse_pos = (0, 0)
+        self._pending = []
+
+    def advance(self, game=None):
+        """Pasa al siguiente frame; devuelve cuántos ticks hay que simular después."""
+        self.index += 1
+        ticks, keys, mouse, events = self.frames[self.index]
+        if keys is not None:
+            self.keys = KeyState(keys)
+        if mouse is not None:
+            self.mouse_pos = tuple(mouse)
+        self._pending = _decode_events(events)
+        return ticks
+
+    def get_pressed(self):
+        return self.keys
+
+    def get_mouse_pos(self):
+        return self.mouse_pos
+
+    def events(self):
+        events, self._pending = self._pending, []
+        return events
+
+
+def run_replay(path, draw=False, quiet=True, profile_csv=None, stop_on_divergence=True):
+    """
+    Reproduce una grabación en modo headless y compara los checksums.
+
+    Devuelve un dict con ticks simulados, tiempos y `diverged_at` (primer tick
+    cuyo checksum no coincide, o None si la reproducción es exacta).
+    """
+    from core.game import Game
+
+    data = load_replay(path)
+    dt = data["dt"] or 0.0
+    interval = data["checksum_interval"]
+    expected = data["checksums"]
+    god = data["god"]
+
+    out = io.StringIO() if quiet else sys.stdout
+    with contextlib.redirect_stdout(out):
+        inp = ReplayInput(data["frames"])
+        game = Game(headless=True, input_source=inp, seed=data["seed"], screen_size=tuple(data["screen"]))
+        prof = game.profiler
+        prof.enabled = profile_csv is not None
+
+        tick = 0
+        checked = 0
+        diverged_at = None
+        update_time = 0.0
+        start = time.perf_counter()
+        for _ in range(len(data["frames"])):
+            prof.begin_frame()
+            ticks = inp.advance(game)
+            game.handle_events()
+            prof.lap("input")
+            if god:
+                game.player.health = game.player.max_health
+                game.player.weapon.reserve_ammo = max(game.player.weapon.reserve_ammo, game.player.weapon.max_ammo)
+
+            t0 = time.perf_counter()
+            for _ in range(ticks):
+                game.update(dt)
+                tick += 1
+                if tick % interval == 0 and checked < len(expected):
+                    if diverged_at is None and state_checksum(game) != expected[checked]:
+                        diverged_at = tick
+                    checked += 1
+            update_time += time.perf_counter() - t0
+            if draw:
+                game.draw()
+            prof.end_frame()
+            if diverged_at is not None and stop_on_divergence:
+                break
+        elapsed = time.perf_counter() - start
+        if profile_csv:
+            game.dump_profile(profile_csv)
+
+    return {
+        "ticks": tick,
+        "recorded_ticks": data["ticks"],
+        "checksums_compared": checked,
+        "diverged_at": diverged_at,
+        "elapsed_s": elapsed,
+        "update_ms_mean": update_time / max(1, tick) * 1000,
+        "wave": game.spawner.current_wave,
+        "score": game.player.score,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reproduce una partida grabada y verifica sus checksums")
+    parser.add_argument("path", help="Grabación .json.gz")
+    parser.add_argument("--draw", action="store_true", help="Incluir Game.draw en cada frame")
+    parser.add_argument("--profile-csv", default=None, help="Volcar tiempos por fase a este CSV")
+    parser.add_argument("--keep-going", action="store_true", help="No parar en la primera divergencia")
+    parser.add_argument("--verbose", action="store_true", help="No silenciar los prints del juego")
+    args = parser.parse_args(argv)
+
+    stats = run_replay(args.path, draw=args.draw, quiet=not args.verbose,
+                       profile_csv=args.profile_csv, stop_on_divergence=not args.keep_going)
+    for key, value in stats.items():
+        print(f"{key:>18}: {value:.3f}" if isinstance(value, float) else f"{key:>18}: {value}")
+    if stats["diverged_at"] is not None:
+        print(f"[ERROR] La reproducción diverge en el tick {stats['diverged_at']}")
+        return 1
+    print("[INFO] Reproducción idéntica a la grabación")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+# core/rng.py
+"""
+Flujos de números aleatorios con semilla, uno por subsistema.
+
+Cada subsistema (spawner, zombies, drops, world) tiene su propio random.Random
+derivado de la semilla de la partida, de modo que añadir una tirada en uno no
+desplaza la secuencia de los demás. Sustituye al módulo global `random`: con la
+misma semilla y la misma entrada, una partida se repite exactamente (ver
+core/replay.py).
+"""
+import random
+
+# Subsistemas con flujo propio (el orden no importa: cada uno se deriva por nombre)
+STREAMS = ("spawner", "zombies", "drops", "world")
+
+_streams = {name: random.Random() for name in STREAMS}
+_seed = None
+
+
+def seed_streams(seed=None):
+    """
+    Re-siembra todos los flujos a partir de `seed` (entero). Sin semilla se
+    elige una al azar. Devuelve la semilla usada, para poder grabarla.
+    """
+    global _seed
+    if seed is None:
+        seed = random.SystemRandom().randrange(1 << 32)
+    _seed = int(seed)
+    for name, stream in _streams.items():
+        stream.seed(f"{_seed}:{name}")
+    return _seed
+
+
+def rng(name):
+    """Flujo del subsistema `name` (KeyError si no está en STREAMS)."""
+    return _streams[name]
+
+
+def current_seed():
+    return _seed
@@ -0,0 +1,121 @@
+# core/spatial_hash.py
+import math
+import numpy as np
+from settings import SPATIAL_CELL_SIZE
+
+
+class SpatialHash:
+    """
+    Índice espacial de rejilla uniforme para consultas por radio y por segmento.
+
+    Cada entrada es (item, x, y, radius) y se guarda en la celda de su centro.
+    Las consultas amplían su área con el radio máximo registrado, así solo
+    revisan las celdas cercanas y el coste depende de la densidad local, no del
+    total de entidades. Se reconstruye en cada tick con `rebuild()` o
+    `rebuild_arrays()` (más barato que mover entradas).
+    """
+
+    def __init__(self, cell_size=SPATIAL_CELL_SIZE):
+        self.cell_size = float(cell_size)
+        self.cells = {}
+        self.count = 0
+        self.max_radius = 0.0
+
+    # ==========================================================
+    # Construcción
+    # ==========================================================
+    def clear(self):
+        self.cells.clear()
+        self.count = 0
+        self.max_radius = 0.0
+
+    def insert(self, item, x, y, radius=0.0):
+        cs = self.cell_size
+        key = (int(math.floor(x / cs)), int(math.floor(y / cs)))
+        bucket = self.cells.get(key)
+        if bucket is None:
+            self.cells[key] = [(item, x, y, radius)]
+        else:
+            bucket.append((item, x, y, radius))
+        if radius > self.max_radius:
+            self.max_radius = radius
+        self.count += 1
+
+    def rebuild(self, items, key):
+        """Vacía el índice y vuelve a insertar `items`; `key(item)` devuelve (x, y, radius)."""
+        self.clear()
+        for item in items:
+            x, y, r = key(item)
+            self.insert(item, x, y, r)
+
+    def rebuild_arrays(self, items, xs, ys, radii):
+        """Igual que rebuild() pero con coordenadas en arrays NumPy (p.ej. la horda)."""
+        self.clear()
+        n = len(items)
+        if n == 0:
+            return
+        cs = self.cell_size
+        cx = np.floor(xs / cs).astype(np.int64)
+        cy = np.floor(ys / cs).astype(np.int64)
+        # Agrupar por celda ordenando una clave combinada (evita un insert por item)
+        order = np.lexsort((cy, cx))
+        cx, cy = cx[order], cy[order]
+        breaks = np.flatnonzero((np.diff(cx) != 0) | (np.diff(cy) != 0)) + 1
+        starts = [0] + breaks.tolist()
+        ends = breaks.tolist() + [n]
+
+        order_list = order.tolist()
+        entries = list(zip([items[i] for i in order_list], xs[order].tolist(),
+                           ys[order].tolist(), radii[order].tolist()))
+        cells = self.cells
+        for s, e, kx, ky in zip(starts, ends, cx[starts].tolist(), cy[starts].tolist()):
+            cells[(kx, ky)] = entries[s:e]
+        self.count = n
+        self.max_radius = float(radii.max())
+
+    # ==========================================================
+    # Consultas
+    # ==========================================================
+    def _candidates(self, min_x, min_y, max_x, max_y):
+        cs = self.cell_size
+        cells = self.cells
+        for cx in range(int(math.floor(min_x / cs)), int(math.floor(max_x / cs)) + 1):
+            for cy in range(int(math.floor(min_y / cs)), int(math.floor(max_y / cs)) + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield from bucket
+
+    def query_radius(self, x, y, radius, scale=1.0):
+        """Items cuyo círculo (radio * scale) toca el círculo (x, y, radius)."""
+        found = []
+        pad = radius + self.max_radius * scale
+        for item, ix, iy, ir in self._candidates(x - pad, y - pad, x + pad, y + pad):
+            reach = ir * scale + radius
+            dx, dy = ix - x, iy - y
+            if dx * dx + dy * dy <= reach * reach:
+                found.append(item)
+        return found
+
+    def query_segment(self, x0, y0, x1, y1, radius=0.0, scale=1.0):
+        """
+        Items cuyo círculo (radio * scale) toca el segmento (x0,y0)-(x1,y1) engrosado
+        en `radius`. Devuelve una lista de (t, item, x, y) ordenada por t ∈ [0, 1]
+        (el primero es el impacto más cercano al origen).
+        """
+        sx, sy = x1 - x0, y1 - y0
+        seg_len2 = sx * sx + sy * sy
+        pad = radius + self.max_radius * scale
+        hits = []
+        for item, ix, iy, ir in self._candidates(min(x0, x1) - pad, min(y0, y1) - pad,
+                                                 max(x0, x1) + pad, max(y0, y1) + pad):
+            reach = ir * scale + radius
+            if seg_len2 > 0:
+                t = ((ix - x0) * sx + (iy - y0) * sy) / seg_len2
+                t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+            else:
+                t = 0.0
+            dx, dy = x0 + sx * t - ix, y0 + sy * t - iy
+            if dx * dx + dy * dy <= reach * reach:
+                hits.append((t, item, ix, iy))
+        hits.sort(key=lambda h: h[0])
+        return hits
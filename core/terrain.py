@@ -0,0 +1,164 @@
+# core/terrain.py
+from collections import OrderedDict
+import numpy as np
+import pygame
+from settings import (
+    TERRAIN_TYPES, TERRAIN_TILE_SIZE, TERRAIN_CHUNK_SIZE, TERRAIN_MAX_MB,
+    TERRAIN_PREFETCH_MARGIN, TERRAIN_PREFETCH_PER_FRAME,
+)
+from utils.helpers import load_image_safe, sprite_registry
+
+
+def hash2d(x, y, seed):
+    """Hash entero 32 bits de (x, y, seed), vectorizado sobre arrays de enteros."""
+    h = (np.asarray(x, dtype=np.int64) * 374761393
+         + np.asarray(y, dtype=np.int64) * 668265263
+         + (int(seed) * 2246822519 & 0xFFFFFFFF)) & 0xFFFFFFFF
+    h = ((h ^ (h >> 13)) * 1274126177) & 0xFFFFFFFF
+    return h ^ (h >> 16)
+
+
+def _build_tile(name, size):
+    image = load_image_safe(f"terrain/{name}.png")
+    if image is None:
+        tile = pygame.Surface((size, size))
+        tile.fill((30, 30, 30))
+        return tile
+    return pygame.transform.smoothscale(image, (size, size)).convert()
+
+
+def get_tile(name, size=TERRAIN_TILE_SIZE):
+    """Textura de terreno escalada a `size` y opaca (compartida en el registro de sprites)."""
+    return sprite_registry.get(("terrain", name, size), lambda: _build_tile(name, size))
+
+
+class TerrainLayer:
+    """
+    Suelo del mundo hecho de tiles, pre-renderizado en chunks opacos.
+
+    `source(tx, ty, nx, ny)` devuelve un array (nx, ny) de índices de
+    TERRAIN_TYPES para los tiles desde (tx, ty); `decorate(surface, x0, y0)`,
+    opcional, pinta encima lo que no es suelo (objetos). Cada chunk de
+    TERRAIN_CHUNK_SIZE px se dibuja una vez con un blits de sus tiles y queda en
+    un LRU limitado a TERRAIN_MAX_MB.
+
+    Los chunks visibles se componen, alineados a la rejilla, en una superficie
+    de vista (un chunk más grande que la pantalla) que solo se rehace cuando la
+    cámara cruza un borde de chunk; cada frame es un único blit de su zona
+    visible. Blitear chunks a desplazamientos arbitrarios es más del doble de
+    lento en SDL. Tras dibujar se construyen por adelantado hasta
+    TERRAIN_PREFETCH_PER_FRAME chunks del anillo que rodea la vista.
+    """
+
+    def __init__(self, source, world_width, world_height, decorate=None,
+                 chunk_size=TERRAIN_CHUNK_SIZE, tile_size=TERRAIN_TILE_SIZE, max_mb=TERRAIN_MAX_MB):
+        if chunk_size % tile_size:
+            raise ValueError("TERRAIN_CHUNK_SIZE debe ser múltiplo de TERRAIN_TILE_SIZE")
+        self.source = source
+        self.decorate = decorate
+        self.world_width = world_width
+        self.world_height = world_height
+        self.chunk_size = chunk_size
+        self.tile_size = tile_size
+        self.max_chunks = max(16, int(max_mb * 1024 * 1024) // (chunk_size * chunk_size * 4))
+        self.chunks = OrderedDict()  # (cx, cy) -> Surface; orden = último frame en que se vio
+        self.tiles = [get_tile(name, tile_size) for name in TERRAIN_TYPES]
+        self._view = None         # chunks visibles compuestos
+        self._view_anchor = None  # chunk (cx, cy) de su esquina superior izquierda
+        self.built = 0
+        self.composed = 0
+        self.prefetched = 0
+        self.evicted = 0
+
+    # ==========================================================
+    # Chunks
+    # ==========================================================
+    def _in_world(self, cx, cy):
+        cs = self.chunk_size
+        return 0 <= cx * cs < self.world_width and 0 <= cy * cs < self.world_height
+
+    def _build(self, cx, cy):
+        cs, ts = self.chunk_size, self.tile_size
+        x0, y0 = cx * cs, cy * cs
+        w, h = min(cs, self.world_width - x0), min(cs, self.world_height - y0)
+        nx, ny = -(-w // ts), -(-h // ts)
+        codes = self.source(x0 // ts, y0 // ts, nx, ny)
+
+        chunk = pygame.Surface((w, h)).convert()
+        tiles = self.tiles
+        chunk.blits([(tiles[codes[i, j]], (i * ts, j * ts)) for i in range(nx) for j in range(ny)], False)
+        if self.decorate is not None:
+            self.decorate(chunk, x0, y0)
+        self.chunks[(cx, cy)] = chunk
+        self.built += 1
+        while len(self.chunks) > self.max_chunks:
+            self.chunks.popitem(last=False)
+            self.evicted += 1
+        return chunk
+
+    def prefetch(self, view_x, view_y, view_w, view_h, budget=TERRAIN_PREFETCH_PER_FRAME):
+        """Construye los chunks que faltan en el anillo alrededor de la vista, los más cercanos primero."""
+        cs, m = self.chunk_size, TERRAIN_PREFETCH_MARGIN
+        x0, y0 = view_x // cs - m, view_y // cs - m
+        x1, y1 = (view_x + view_w) // cs + m, (view_y + view_h) // cs + m
+        missing = [(cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)
+                   if (cx, cy) not in self.chunks and self._in_world(cx, cy)]
+        if not missing:
+            return 0
+        mx, my = (view_x + view_w / 2) / cs - 0.5, (view_y + view_h / 2) / cs - 0.5
+        missing.sort(key=lambda c: (c[0] - mx) ** 2 + (c[1] - my) ** 2)
+        for cx, cy in missing[:budget]:
+            self._build(cx, cy)
+        self.prefetched += min(budget, len(missing))
+        return min(budget, len(missing))
+
+    def _compose(self, ax, ay, view_w, view_h):
+        """Rehace la superficie de vista con los chunks desde (ax, ay); fuera del mundo queda el fondo."""
+        cs = self.chunk_size
+        cols, rows = view_w // cs + 2, view_h // cs + 2
+        view = self._view
+        if view is None or view.get_size() != (cols * cs, rows * cs):
+            view = self._view = pygame.Surface((cols * cs, rows * cs)).convert()
+        if ax < 0 or ay < 0 or (ax + cols) * cs > self.world_width or (ay + rows) * cs > self.world_height:
+            view.fill((30, 30, 30))
+        chunks = self.chunks
+        batch = []
+        for cx in range(ax, ax + cols):
+            for cy in range(ay, ay + rows):
+                if not self._in_world(cx, cy):
+                    continue
+                chunk = chunks.get((cx, cy))
+                if chunk is None:
+                    chunk = self._build(cx, cy)
+                else:
+                    chunks.move_to_end((cx, cy))
+                batch.append((chunk, ((cx - ax) * cs, (cy - ay) * cs)))
+        view.blits(batch, False)
+        self._view_anchor = (ax, ay)
+        self.composed += 1
+
+    def draw(self, surface, view_x, view_y, view_w, view_h):
+        """Dibuja el terreno de la vista (ocupa toda la pantalla: sustituye al fill del fondo)."""
+        cs = self.chunk_size
+        ox, oy = int(view_x), int(view_y)
+        ax, ay = ox // cs, oy // cs
+        view = self._view
+        if (self._view_anchor != (ax, ay) or view is None
+                or view.get_width() < view_w + cs or view.get_height() < view_h + cs):
+            self._compose(ax, ay, view_w, view_h)
+        surface.blit(self._view, (0, 0), (ox - ax * cs, oy - ay * cs, view_w, view_h))
+        self.prefetch(ox, oy, view_w, view_h)
+
+    def clear(self):
+        self.chunks.clear()
+        self._view_anchor = None
+
+    def stats(self):
+        return {
+            "chunks": len(self.chunks),
+            "max_chunks": self.max_chunks,
+            "built": self.built,
+            "composed": self.composed,
+            "prefetched": self.prefetched,
+            "evicted": self.evicted,
+        }
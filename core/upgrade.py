@@ -1,6 +1,5 @@
 import pygame
 import os
-import random
 import math
 from settings import (
     ASSETS_IMAGES,
@@ -10,19 +9,39 @@ from settings import (
     UPGRADE_FALL_DECAY,
     UPGRADE_FALL_DURATION,
     ZOMBIE_UPGRADE_DROP_SYSTEM,
+    POOL_UPGRADES,
 )
-from utils.helpers import load_image_safe, clean_image_background
+from utils.helpers import get_sprite
+from core.pool import ObjectPool, PooledSprite
+from core.rng import rng
 
+# Drops y selección de mejora (flujo compartido con Zombie.take_damage)
+_random = rng("drops")
 
-class Upgrade(pygame.sprite.Sprite):
+
+class Upgrade(PooledSprite):
     """Clase de mejoras (upgrades) que caen de zombies."""
 
-    def __init__(self, upgrade_type, pos):
+    def __init__(self, upgrade_type=None, pos=(0, 0)):
         super().__init__()
+        self.pos = pygame.Vector2(pos)
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.type = None
+        self.image = None
+        if upgrade_type is not None:
+            self.reset(upgrade_type, pos)
+
+    @classmethod
+    def acquire(cls, upgrade_type, pos):
+        """Mejora del pool (reutilizada si hay alguna libre)."""
+        return cls.pool.acquire(upgrade_type, pos)
+
+    def reset(self, upgrade_type, pos):
         self.type = upgrade_type
         self.image = self.load_icon(upgrade_type)
-        self.rect = self.image.get_rect(center=pos)
-        self.pos = pygame.Vector2(pos)
+        self.rect.size = self.image.get_size()
+        self.rect.center = pos
+        self.pos.update(pos)
 
         # Animación de caída
         self.fall_timer = 0.0
@@ -42,14 +61,13 @@ class Upgrade(pygame.sprite.Sprite):
     # ==========================================================
     # 🔹 Cargar ícono usando helpers
     # ==========================================================
-    def load_icon(self, upgrade_type):
-        """Carga la imagen de la mejora, la escala y limpia fondo claro."""
+    @staticmethod
+    def load_icon(upgrade_type):
+        """Obtiene la imagen de la mejora (escalada y limpia) del registro compartido."""
         path = os.path.join("upgrades", f"{upgrade_type}.png")
-        img = load_image_safe(path)  # ✅ usa helpers
+        img = get_sprite(path, (UPGRADE_ICON_SIZE, UPGRADE_ICON_SIZE))  # ✅ compartida entre instancias
 
         if img:
-            img = pygame.transform.scale(img, (UPGRADE_ICON_SIZE, UPGRADE_ICON_SIZE))
-            img = clean_image_background(img)  # ✅ limpieza uniforme
             return img
         else:
             print(f"[WARN] Icono '{upgrade_type}' no encontrado, usando superficie básica.")
@@ -57,6 +75,12 @@ class Upgrade(pygame.sprite.Sprite):
             pygame.draw.rect(surf, (255, 255, 255), surf.get_rect(), border_radius=12)
             return surf
 
+    @classmethod
+    def preload(cls):
+        """Construye los iconos de todas las mejoras que pueden caer (pantalla de carga)."""
+        for upgrade_type in UPGRADE_SPAWN_CHANCE:
+            cls.load_icon(upgrade_type)
+
     # ==========================================================
     # 🔹 Animación de caída
     # ==========================================================
@@ -105,17 +129,17 @@ class Upgrade(pygame.sprite.Sprite):
         
         # Intentar dropear cartas adicionales
         for _ in range(max_drops - min_drops):
-            if random.random() * 100 < multi_chance:
+            if _random.random() * 100 < multi_chance:
                 total_drops += 1
         
         # ✅ Generar cada upgrade
         for i in range(total_drops):
             upgrade_type = Upgrade.select_random_upgrade()
             if upgrade_type:
-                u = Upgrade(upgrade_type, origin)
-                angle = random.uniform(0, 2 * math.pi) + (i * (2 * math.pi / max(1, total_drops)))
-                speed = random.uniform(UPGRADE_FALL_SPEED * 0.5, UPGRADE_FALL_SPEED * 0.9)
-                distance = random.uniform(40, 75)
+                u = Upgrade.acquire(upgrade_type, origin)
+                angle = _random.uniform(0, 2 * math.pi) + (i * (2 * math.pi / max(1, total_drops)))
+                speed = _random.uniform(UPGRADE_FALL_SPEED * 0.5, UPGRADE_FALL_SPEED * 0.9)
+                distance = _random.uniform(40, 75)
                 u.start_fall(angle_rad=angle, speed=speed, max_distance=distance)
                 group.add(u)
                 print(f"[Upgrade] Dropped '{upgrade_type}' from {zombie.rarity.upper()} {zombie.type} (card {i+1}/{total_drops})")
@@ -127,10 +151,13 @@ class Upgrade(pygame.sprite.Sprite):
     def select_random_upgrade():
         """Selecciona un upgrade según probabilidades definidas en settings."""
         total = sum(UPGRADE_SPAWN_CHANCE.values())
-        roll = random.uniform(0, total)
+        roll = _random.uniform(0, total)
         current = 0.0
         for name, chance in UPGRADE_SPAWN_CHANCE.items():
             current += chance
             if roll <= current:
                 return name
-        return None
\ No newline at end of file
+        return None
+
+
+Upgrade.pool = ObjectPool(Upgrade, POOL_UPGRADES, "upgrades")
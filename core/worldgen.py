@@ -0,0 +1,277 @@
+# core/worldgen.py
+"""
+Generación procedural del mundo por chunks, determinista a partir de la semilla.
+
+Todo se calcula con hashes de coordenadas enteras (core/terrain.hash2d), sin
+estado acumulado: cualquier chunk se puede generar, descartar y volver a
+generar en cualquier orden con el mismo resultado. Nada se calcula por
+adelantado; el coste por chunk está acotado (4 x 4 tiles y las celdas Poisson
+que lo tocan).
+
+- Terreno: ruido de valor por capas (fBm) en el centro de cada tile, mapeado a
+  tipos de terreno por umbrales de elevación del bioma (WORLD_BIOMES).
+- Objetos: Poisson-disk por prioridades con hash. Cada celda de
+  WORLDGEN_PROP_SPACING px tiene un candidato con una prioridad aleatoria, y se
+  acepta si ningún vecino a menos de esa distancia tiene prioridad mayor. Es
+  decidible celda a celda, por eso no hay costuras entre chunks.
+- Obstáculos: celdas con terreno de FLOW_BLOCKING_TERRAIN o con el centro de
+  un objeto de FLOW_BLOCKING_PROPS; es la fuente de core/flowfield.FlowField.
+"""
+from collections import namedtuple
+import numpy as np
+from settings import (
+    TERRAIN_TYPES, TERRAIN_TILE_SIZE, TERRAIN_CHUNK_SIZE,
+    WORLD_BIOMES, WORLD_PROP_SIZES, WORLDGEN_NOISE_SCALE, WORLDGEN_OCTAVES,
+    WORLDGEN_PROP_SPACING, WORLDGEN_KEEP_RADIUS, FLOW_BLOCKING_TERRAIN, FLOW_BLOCKING_PROPS,
+)
+from core.terrain import hash2d
+from utils.helpers import get_sprite
+
+_HASH_MAX = float(0xFFFFFFFF)
+
+# Objetos de un chunk: arrays paralelos (centro en el mundo y código de objeto)
+WorldChunk = namedtuple("WorldChunk", "x y kind")
+
+
+def value_noise(x, y, seed):
+    """Ruido de valor en [0, 1] sobre coordenadas de retícula (arrays float)."""
+    xi, yi = np.floor(x), np.floor(y)
+    fx, fy = x - xi, y - yi
+    fx, fy = fx * fx * (3 - 2 * fx), fy * fy * (3 - 2 * fy)
+    xi, yi = xi.astype(np.int64), yi.astype(np.int64)
+    v00 = hash2d(xi, yi, seed) / _HASH_MAX
+    v10 = hash2d(xi + 1, yi, seed) / _HASH_MAX
+    v01 = hash2d(xi, yi + 1, seed) / _HASH_MAX
+    v11 = hash2d(xi + 1, yi + 1, seed) / _HASH_MAX
+    top = v00 + (v10 - v00) * fx
+    bottom = v01 + (v11 - v01) * fx
+    return top + (bottom - top) * fy
+
+
+def fbm(x, y, seed, octaves=WORLDGEN_OCTAVES):
+    """Suma de `octaves` capas de value_noise (frecuencia x2, amplitud /2), normalizada a [0, 1]."""
+    total = np.zeros(np.shape(x))
+    amp, norm, freq = 1.0, 0.0, 1.0
+    for o in range(octaves):
+        total += amp * value_noise(x * freq, y * freq, seed + o * 1013)
+        norm += amp
+        amp *= 0.5
+        freq *= 2.0
+    return total / norm
+
+
+class WorldGenerator:
+    """
+    Mundo de un bioma de WORLD_BIOMES generado por chunks.
+
+    tiles() es la fuente de TerrainLayer y decorate() pinta en cada chunk de
+    terreno los objetos que lo tocan. Los objetos por chunk se guardan en
+    `chunks` y trim() descarta los que quedan a más de WORLDGEN_KEEP_RADIUS
+    chunks de la cámara.
+    """
+
+    def __init__(self, seed, biome, world_width, world_height,
+                 chunk_size=TERRAIN_CHUNK_SIZE, tile_size=TERRAIN_TILE_SIZE):
+        self.seed = int(seed) & 0xFFFFFFFF
+        self.biome_name = biome
+        self.world_width = world_width
+        self.world_height = world_height
+        self.chunk_size = chunk_size
+        self.tile_size = tile_size
+        self.chunks = {}  # (cx, cy) -> WorldChunk
+        self.generated = 0
+        self.dropped = 0
+        self._center = None
+
+        config = WORLD_BIOMES[biome]
+        self._thresholds = np.array([t for t, _ in config["terrain"]])
+        self._terrain_codes = np.array([TERRAIN_TYPES.index(name) for _, name in config["terrain"]], dtype=np.uint8)
+        # objetos: código -> nombre; por terreno: (densidad, códigos posibles)
+        self.prop_names = tuple(WORLD_PROP_SIZES)
+        self._density = np.zeros(len(TERRAIN_TYPES))
+        self._choices = {}
+        for terrain, (density, names) in config["props"].items():
+            code = TERRAIN_TYPES.index(terrain)
+            self._density[code] = density
+            self._choices[code] = np.array([self.prop_names.index(n) for n in names], dtype=np.int64)
+        self._max_prop = max(WORLD_PROP_SIZES.values())
+        self._blocking_terrain = np.array([TERRAIN_TYPES.index(t) for t in FLOW_BLOCKING_TERRAIN], dtype=np.uint8)
+        self._blocking_props = np.array([self.prop_names.index(n) for n in FLOW_BLOCKING_PROPS], dtype=np.int64)
+        self._blocked = {}  # (cx, cy, cell) -> bool array del chunk (pocos bytes: no se descarta)
+
+    # ==========================================================
+    # Terreno
+    # ==========================================================
+    def terrain_at(self, wx, wy):
+        """Código de terreno en puntos del mundo (arrays); se evalúa en el centro del tile."""
+        ts = self.tile_size
+        cx = (np.floor_divide(wx, ts) + 0.5) * ts / WORLDGEN_NOISE_SCALE
+        cy = (np.floor_divide(wy, ts) + 0.5) * ts / WORLDGEN_NOISE_SCALE
+        elevation = fbm(cx, cy, self.seed)
+        idx = np.searchsorted(self._thresholds, elevation, side="right")
+        return self._terrain_codes[np.minimum(idx, len(self._terrain_codes) - 1)]
+
+    def tiles(self, tx, ty, nx, ny):
+        """Fuente de TerrainLayer: array (nx, ny) de códigos de TERRAIN_TYPES."""
+        ts = self.tile_size
+        gx, gy = np.meshgrid(np.arange(tx, tx + nx) * ts, np.arange(ty, ty + ny) * ts, indexing="ij")
+        return self.terrain_at(gx, gy)
+
+    # ==========================================================
+    # Objetos
+    # ==========================================================
+    def _poisson(self, x0, y0, x1, y1):
+        """Puntos Poisson-disk con centro en [x0, x1) x [y0, y1), sin costuras entre llamadas."""
+        r = WORLDGEN_PROP_SPACING
+        seed = self.seed ^ 0x5F3759DF
+        i0, j0 = int(x0 // r) - 1, int(y0 // r) - 1
+        i1, j1 = int(x1 // r) + 2, int(y1 // r) + 2
+        gi, gj = np.meshgrid(np.arange(i0, i1), np.arange(j0, j1), indexing="ij")
+        px = (gi + hash2d(gi, gj, seed) / _HASH_MAX) * r
+        py = (gj + hash2d(gi, gj, seed + 1) / _HASH_MAX) * r
+        prio = hash2d(gi, gj, seed + 2)
+
+        # Celdas interiores contra sus 8 vecinas (a distancia < r solo puede haber vecinas inmediatas)
+        inner = (slice(1, -1), slice(1, -1))
+        cx, cy, cp = px[inner], py[inner], prio[inner]
+        keep = np.ones(cx.shape, dtype=bool)
+        w, h = px.shape
+        for di in (-1, 0, 1):
+            for dj in (-1, 0, 1):
+                if di == 0 and dj == 0:
+                    continue
+                nb = (slice(1 + di, w - 1 + di), slice(1 + dj, h - 1 + dj))
+                close = (px[nb] - cx) ** 2 + (py[nb] - cy) ** 2 < r * r
+                stronger = (prio[nb] > cp) | ((prio[nb] == cp) & ((di, dj) > (0, 0)))
+                keep &= ~(close & stronger)
+        keep &= (cx >= x0) & (cx < x1) & (cy >= y0) & (cy < y1)
+        return cx[keep], cy[keep]
+
+    def _generate(self, cx, cy):
+        cs = self.chunk_size
+        x0, y0 = cx * cs, cy * cs
+        x1, y1 = min(x0 + cs, self.world_width), min(y0 + cs, self.world_height)
+        px, py = self._poisson(x0, y0, x1, y1)
+        kind = np.full(px.shape, -1, dtype=np.int64)
+        if px.size:
+            terrain = self.terrain_at(px, py)
+            gx, gy = np.floor(px).astype(np.int64), np.floor(py).astype(np.int64)
+            roll = hash2d(gx, gy, self.seed + 7) / _HASH_MAX
+            pick = hash2d(gx, gy, self.seed + 11)
+            for code, choices in self._choices.items():
+                sel = (terrain == code) & (roll < self._density[code])
+                kind[sel] = choices[pick[sel] % len(choices)]
+        keep = kind >= 0
+        self.generated += 1
+        return WorldChunk(px[keep], py[keep], kind[keep])
+
+    def chunk(self, cx, cy):
+        """Objetos cuyo centro cae en el chunk (cx, cy); se generan la primera vez."""
+        data = self.chunks.get((cx, cy))
+        if data is None:
+            data = self.chunks[(cx, cy)] = self._generate(cx, cy)
+        return data
+
+    def props_in(self, x0, y0, x1, y1):
+        """Objetos (x, y, nombre) cuyo sprite toca el rectángulo [x0, x1) x [y0, y1)."""
+        cs, pad = self.chunk_size, self._max_prop / 2
+        out = []
+        for cx in range(max(0, int((x0 - pad) // cs)), int((x1 + pad) // cs) + 1):
+            for cy in range(max(0, int((y0 - pad) // cs)), int((y1 + pad) // cs) + 1):
+                if cx * cs >= self.world_width or cy * cs >= self.world_height:
+                    continue
+                data = self.chunk(cx, cy)
+                for x, y, k in zip(data.x.tolist(), data.y.tolist(), data.kind.tolist()):
+                    name = self.prop_names[k]
+                    half = WORLD_PROP_SIZES[name] / 2
+                    if x + half > x0 and x - half < x1 and y + half > y0 and y - half < y1:
+                        out.append((x, y, name))
+        return out
+
+    def preload(self):
+        """Carga los sprites de objetos del bioma (limpiar el fondo es caro para hacerlo al generar)."""
+        for codes in self._choices.values():
+            for k in codes.tolist():
+                name = self.prop_names[k]
+                get_sprite(f"objects/{name}.png", (WORLD_PROP_SIZES[name],) * 2)
+
+    def decorate(self, surface, x0, y0):
+        """Pinta en `surface` (chunk de terreno con esquina en x0, y0) los objetos que lo tocan."""
+        w, h = surface.get_size()
+        batch = []
+        for x, y, name in sorted(self.props_in(x0, y0, x0 + w, y0 + h), key=lambda p: (p[1], p[0])):
+            size = WORLD_PROP_SIZES[name]
+            image = get_sprite(f"objects/{name}.png", (size,) * 2)
+            if image is not None:
+                batch.append((image, (round(x - size / 2 - x0), round(y - size / 2 - y0))))
+        surface.blits(batch, False)
+
+    # ==========================================================
+    # Obstáculos
+    # ==========================================================
+    def _blocked_chunk(self, cx, cy, cell):
+        key = (cx, cy, cell)
+        grid = self._blocked.get(key)
+        if grid is None:
+            n = self.chunk_size // cell
+            x0, y0 = cx * self.chunk_size, cy * self.chunk_size
+            gx, gy = np.meshgrid(x0 + (np.arange(n) + 0.5) * cell, y0 + (np.arange(n) + 0.5) * cell, indexing="ij")
+            grid = np.isin(self.terrain_at(gx, gy), self._blocking_terrain)
+            data = self.chunk(cx, cy)
+            solid = np.isin(data.kind, self._blocking_props)
+            if solid.any():
+                ix = ((data.x[solid] - x0) // cell).astype(np.int64)
+                iy = ((data.y[solid] - y0) // cell).astype(np.int64)
+                grid[ix, iy] = True
+            self._blocked[key] = grid
+        return grid
+
+    def blocked(self, x0, y0, nx, ny, cell):
+        """
+        Fuente de FlowField: array bool (nx, ny) de celdas de `cell` px desde la
+        celda (x0, y0) que no se pueden cruzar. Se calcula por chunks y se guarda.
+        """
+        per = self.chunk_size // cell
+        out = np.zeros((nx, ny), dtype=bool)
+        for cx in range(x0 // per, (x0 + nx - 1) // per + 1):
+            for cy in range(y0 // per, (y0 + ny - 1) // per + 1):
+                grid = self._blocked_chunk(cx, cy, cell)
+                ax, ay = cx * per - x0, cy * per - y0
+                sx, sy = max(0, -ax), max(0, -ay)
+                ex, ey = min(per, nx - ax), min(per, ny - ay)
+                out[ax + sx:ax + ex, ay + sy:ay + ey] = grid[sx:ex, sy:ey]
+        return out
+
+    def prefetch_blocked(self, x0, y0, nx, ny, cell, budget):
+        """
+        Calcula hasta `budget` chunks de obstáculos que falten para las celdas
+        (x0, y0, nx, ny), los más cercanos al centro primero. Devuelve cuántos
+        faltaban antes de llamar: 0 si la ventana ya está completa.
+        """
+        per = self.chunk_size // cell
+        cols, rows = -(-self.world_width // self.chunk_size), -(-self.world_height // self.chunk_size)
+        missing = [(cx, cy)
+                   for cx in range(max(0, x0 // per), min(cols, (x0 + nx - 1) // per + 1))
+                   for cy in range(max(0, y0 // per), min(rows, (y0 + ny - 1) // per + 1))
+                   if (cx, cy, cell) not in self._blocked]
+        if missing:
+            mx, my = (x0 + nx / 2) / per - 0.5, (y0 + ny / 2) / per - 0.5
+            missing.sort(key=lambda c: (c[0] - mx) ** 2 + (c[1] - my) ** 2)
+            for cx, cy in missing[:budget]:
+                self._blocked_chunk(cx, cy, cell)
+        return len(missing)
+
+    def trim(self, center_x, center_y):
+        """Descarta los objetos generados de chunks lejos de (center_x, center_y)."""
+        cs, keep = self.chunk_size, WORLDGEN_KEEP_RADIUS
+        center = (int(center_x // cs), int(center_y // cs))
+        if center == self._center:
+            return
+        self._center = center
+        far = [c for c in self.chunks if max(abs(c[0] - center[0]), abs(c[1] - center[1])) > keep]
+        for c in far:
+            del self.chunks[c]
+        self.dropped += len(far)
+
+    def stats(self):
+        return {"chunks": len(self.chunks), "generated": self.generated, "dropped": self.dropped}
@@ -1,72 +1,99 @@
 import pygame
 import math
 import os
-from settings import WEAPON_BULLET_SPEED, BULLET_BASE_LIFETIME
-from utils.helpers import load_image_safe
+from settings import WEAPON_BULLET_SPEED, BULLET_BASE_LIFETIME, POOL_BULLETS
+from utils.helpers import load_image_safe, key_background, get_rotations, rotation_index
 from core.impact import Impact
+from core.pool import ObjectPool, PooledSprite
 
 SPRITE_ANGLE_OFFSET = 45.0
+BULLET_SPRITE_KEY = (os.path.join("weapons", "bullet.png"), (24, 24), "bullet")
 
-class Bullet(pygame.sprite.Sprite):
+class Bullet(PooledSprite):
     """Bala disparada por el jugador, con colisión contra zombies y vida limitada."""
-    
-    def __init__(self, pos, direction, damage=None, lifetime=None):
+
+    def __init__(self, pos=(0, 0), direction=(1, 0), damage=None, lifetime=None):
         super().__init__()
-        self.pos = pygame.math.Vector2(pos)
-        self.direction = self._normalize_vector(direction)
-        self.image, self.rect = self._load_bullet_image()
-        self.velocity = self.direction * WEAPON_BULLET_SPEED
+        self.pos = pygame.math.Vector2()
+        self.prev_pos = pygame.math.Vector2()
+        self.direction = pygame.math.Vector2(1, 0)
+        self.velocity = pygame.math.Vector2()
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(pos, direction, damage, lifetime)
+
+    @classmethod
+    def acquire(cls, pos, direction, damage=None, lifetime=None):
+        """Bala del pool (reutilizada si hay alguna libre)."""
+        return cls.pool.acquire(pos, direction, damage, lifetime)
+
+    def reset(self, pos, direction, damage=None, lifetime=None):
+        """Reinicia la bala en sitio para reutilizarla desde el pool."""
+        self.pos.update(pos)
+        self.prev_pos.update(pos)
+        self.direction.update(direction)
+        if self.direction.length_squared() > 0:
+            self.direction.normalize_ip()
+        else:
+            self.direction.update(1, 0)
+        self.velocity.update(self.direction.x * WEAPON_BULLET_SPEED, self.direction.y * WEAPON_BULLET_SPEED)
+        self.image = self._load_bullet_image()
+        self.rect.size = self.image.get_size()
+        self.rect.center = (round(self.pos.x), round(self.pos.y))
         self.damage = damage if damage is not None else 0
         self.lifetime = lifetime if lifetime is not None else BULLET_BASE_LIFETIME
         self.alive_time = 0.0
         self.radius = max(1, self.rect.width // 2)
 
-    def _normalize_vector(self, vec):
-        v = pygame.math.Vector2(vec)
-        return v.normalize() if v.length_squared() > 0 else pygame.math.Vector2(1, 0)
-
     def _load_bullet_image(self):
-        path = os.path.join("weapons", "bullet.png")
-        base_img = load_image_safe(path)
-        if not base_img:
+        frames = get_rotations(BULLET_SPRITE_KEY, self._build_base_image)
+        if not frames:
             surf = pygame.Surface((12, 12), pygame.SRCALPHA)
             pygame.draw.circle(surf, (255, 230, 100), (6, 6), 6)
-            return surf, surf.get_rect(center=(round(self.pos.x), round(self.pos.y)))
-
-        base_img = pygame.transform.scale(base_img, (24, 24))
-        base_img = self._clean_image(base_img)
+            return surf
 
+        # Rotación ajustada al paso precalculado más cercano (sin transform.rotate al disparar)
         angle = math.degrees(math.atan2(self.direction.y, self.direction.x))
-        rotation = -angle - SPRITE_ANGLE_OFFSET
-        rotated = pygame.transform.rotate(base_img, rotation)
-        return rotated, rotated.get_rect(center=(round(self.pos.x), round(self.pos.y)))
+        return frames[rotation_index(-angle - SPRITE_ANGLE_OFFSET)]
 
-    def _clean_image(self, img):
-        img = img.convert_alpha()
-        clean = pygame.Surface(img.get_size(), pygame.SRCALPHA)
-        img.lock()
-        for x in range(img.get_width()):
-            for y in range(img.get_height()):
-                r, g, b, a = img.get_at((x, y))
-                if (r + g + b)/3 > 200 or a < 80:
-                    img.set_at((x, y), (0, 0, 0, 0))
-        img.unlock()
-        clean.blit(img, (0, 0))
-        return clean
+    @classmethod
+    def preload(cls):
+        """Construye las rotaciones compartidas de la bala (pantalla de carga)."""
+        get_rotations(BULLET_SPRITE_KEY, cls._build_base_image)
+
+    @classmethod
+    def _build_base_image(cls):
+        """Imagen base escalada y limpia; solo se usa para construir las rotaciones."""
+        base_img = load_image_safe(os.path.join("weapons", "bullet.png"))
+        if not base_img:
+            return None
+        return cls._clean_image(pygame.transform.scale(base_img, (24, 24)))
+
+    @staticmethod
+    def _clean_image(img):
+        return key_background(img, threshold=200, alpha_cutoff=80)
 
     def update(self, dt, game):
-        self.pos += self.velocity * dt
+        prev_x, prev_y = self.pos.x, self.pos.y
+        self.prev_pos.update(prev_x, prev_y)
+        self.pos.x += self.velocity.x * dt
+        self.pos.y += self.velocity.y * dt
         self.rect.center = (round(self.pos.x), round(self.pos.y))
         self.alive_time += dt
 
-        for zombie in game.zombies:
-            if self.pos.distance_to(pygame.math.Vector2(zombie.rect.center)) <= (getattr(zombie, "radius", zombie.rect.width//2) * 0.6):
-                try: zombie.take_damage(self.damage, game)
-                except TypeError: zombie.take_damage(self.damage)
-                try: game.effects.add(Impact(zombie.rect.center))
-                except Exception: pass
-                self.kill()
-                return
+        # Barrido del tramo recorrido en este tick (evita atravesar zombies)
+        hits = game.zombie_grid.query_segment(prev_x, prev_y, self.pos.x, self.pos.y, scale=0.6)
+        for _, zombie, zx, zy in hits:
+            if getattr(zombie, "dead", False):
+                continue
+            try: zombie.take_damage(self.damage, game)
+            except TypeError: zombie.take_damage(self.damage)
+            game.effects.add(Impact.acquire((zx, zy)))
+            game.audio.play_oneshot("impact")
+            self.kill()
+            return
 
         if self.alive_time >= self.lifetime:
             self.kill()
+
+
+Bullet.pool = ObjectPool(Bullet, POOL_BULLETS, "bullets")
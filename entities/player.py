@@ -6,13 +6,35 @@ from settings import (
     PLAYER_BASE_FIRE_RATE, PLAYER_BASE_MAGAZINE, PLAYER_BASE_RESERVE_AMMO,
     UPGRADE_VALUES, WORLD_WIDTH, WORLD_HEIGHT, PLAYER_MAX_ARMOR
 )
-from utils.helpers import load_image_safe, clean_image_background
+from utils.helpers import get_sprite
 from entities.weapon import Weapon
 
 class Player(pygame.sprite.Sprite):
+    @staticmethod
+    def _load_sprites(size):
+        """Frames por dirección (compartidos en el registro); {} si falta alguna imagen."""
+        size = (size, size)
+        front_img = get_sprite(os.path.join("player", "player_frente.png"), size)
+        back_img = get_sprite(os.path.join("player", "player_espalda.png"), size)
+        side_img = get_sprite(os.path.join("player", "player_lateral.png"), size)
+        if not (front_img and back_img and side_img):
+            return {}
+        return {
+            "front": front_img,
+            "back": back_img,
+            "right": side_img,
+            "left": get_sprite(os.path.join("player", "player_lateral.png"), size, "flip_x"),
+        }
+
+    @classmethod
+    def preload(cls):
+        """Construye los sprites del jugador (pantalla de carga)."""
+        cls._load_sprites(PLAYER_SIZE)
+
     def __init__(self, pos):
         super().__init__()
         self.pos = pygame.math.Vector2(pos)
+        self.prev_pos = pygame.math.Vector2(pos)  # posición del tick anterior (interpolación)
         self.speed = PLAYER_SPEED
 
         # Estadísticas
@@ -31,16 +53,8 @@ class Player(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(center=(round(self.pos.x), round(self.pos.y)))
 
         # Sprites jugador
-        front_img = load_image_safe(os.path.join("player", "player_frente.png"))
-        back_img = load_image_safe(os.path.join("player", "player_espalda.png"))
-        side_img = load_image_safe(os.path.join("player", "player_lateral.png"))
-
-        self.frames = {}
-        if front_img and back_img and side_img:
-            self.frames["front"] = clean_image_background(pygame.transform.scale(front_img, (self.size, self.size)))
-            self.frames["back"] = clean_image_background(pygame.transform.scale(back_img, (self.size, self.size)))
-            self.frames["right"] = clean_image_background(pygame.transform.scale(side_img, (self.size, self.size)))
-            self.frames["left"] = pygame.transform.flip(self.frames["right"], True, False)
+        self.frames = self._load_sprites(self.size)
+        if self.frames:
             self.image = self.frames["front"]
             self.rect = self.image.get_rect(center=(round(self.pos.x), round(self.pos.y)))
 
@@ -63,9 +77,10 @@ class Player(pygame.sprite.Sprite):
     @property
     def y(self): return self.pos.y
 
-    def handle_input(self, dt, mouse_pos, camera):
+    def handle_input(self, dt, mouse_pos, camera, keys=None):
         move = pygame.math.Vector2(0, 0)
-        keys = pygame.key.get_pressed()
+        if keys is None:
+            keys = pygame.key.get_pressed()
         if keys[pygame.K_w] or keys[pygame.K_UP]: move.y -= 1
         if keys[pygame.K_s] or keys[pygame.K_DOWN]: move.y += 1
         if keys[pygame.K_a] or keys[pygame.K_LEFT]: move.x -= 1
@@ -95,7 +110,8 @@ class Player(pygame.sprite.Sprite):
             self.direction = "front" if dy > 0 else "back"
 
     def update(self, dt, game):
-        self.handle_input(dt, pygame.mouse.get_pos(), game.camera)
+        self.prev_pos.update(self.pos)
+        self.handle_input(dt, game.input.get_mouse_pos(), game.camera, game.input.get_pressed())
         self.weapon.update(dt)
 
     def shoot(self, target, game):
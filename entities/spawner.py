@@ -1,6 +1,6 @@
-import random
 import pygame
 
+from core.rng import rng
 from entities.zombie import Zombie
 from settings import (
     ZOMBIE_LEVEL_MIN_VARIATION,
@@ -11,6 +11,8 @@ from settings import (
     ZOMBIE_LEVEL_INCREMENT_PER_WAVE
 )
 
+_random = rng("spawner")
+
 
 class Spawner:
     def __init__(self, game):
@@ -65,7 +67,7 @@ class Spawner:
     def _choose_level_for_wave(self):
         """Nivel de zombie escalonado según ola y variación pequeña."""
         base_level = ZOMBIE_LEVEL_BASE_PER_WAVE + self.current_wave * ZOMBIE_LEVEL_INCREMENT_PER_WAVE
-        variation = random.randint(ZOMBIE_LEVEL_MIN_VARIATION, ZOMBIE_LEVEL_MAX_VARIATION)
+        variation = _random.randint(ZOMBIE_LEVEL_MIN_VARIATION, ZOMBIE_LEVEL_MAX_VARIATION)
         lvl = int(base_level + variation)
         return max(1, lvl)
 
@@ -75,7 +77,7 @@ class Spawner:
     # ============================================================
     def choose_rarity(self):
         """Calcula rareza progresiva según ola."""
-        r = random.random() * 100
+        r = _random.random() * 100
         cumulative = 0
 
         # Escalar probabilidades según la ola
@@ -125,18 +127,18 @@ class Spawner:
     def _generate_spawn_pos(self):
         sw, sh = WORLD_WIDTH, WORLD_HEIGHT
         margin = 80
-        side = random.choice(["top", "bottom", "left", "right"])
+        side = _random.choice(["top", "bottom", "left", "right"])
         player_pos = pygame.Vector2(self.game.player.pos)
 
         for _ in range(20):
             if side == "top":
-                pos = pygame.Vector2(random.randint(0, sw), -margin)
+                pos = pygame.Vector2(_random.randint(0, sw), -margin)
             elif side == "bottom":
-                pos = pygame.Vector2(random.randint(0, sw), sh + margin)
+                pos = pygame.Vector2(_random.randint(0, sw), sh + margin)
             elif side == "left":
-                pos = pygame.Vector2(-margin, random.randint(0, sh))
+                pos = pygame.Vector2(-margin, _random.randint(0, sh))
             else:
-                pos = pygame.Vector2(sw + margin, random.randint(0, sh))
+                pos = pygame.Vector2(sw + margin, _random.randint(0, sh))
 
             if pos.distance_to(player_pos) >= self.min_spawn_distance:
                 return pos
@@ -149,10 +151,10 @@ class Spawner:
     # ============================================================
     def _choose_type(self):
         t = "common"
-        if self.current_wave >= 5 and random.random() < 0.15:
+        if self.current_wave >= 5 and _random.random() < 0.15:
             t = "fast"
-        if self.current_wave >= 8 and random.random() < 0.10:
+        if self.current_wave >= 8 and _random.random() < 0.10:
             t = "tank"
-        if self.current_wave % 10 == 0 and random.random() < 0.35:
+        if self.current_wave % 10 == 0 and _random.random() < 0.35:
             t = "boss"
         return t
\ No newline at end of file
@@ -1,6 +1,5 @@
 import pygame
 import math
-import time
 import os
 from settings import (
     WEAPON_BASE_DAMAGE,
@@ -11,7 +10,6 @@ from settings import (
     BULLET_BASE_LIFETIME,
 )
 from entities.bullet import Bullet
-from utils.helpers import load_sound
 
 class Weapon:
     def __init__(self, owner, damage=None, rpm=None, ammo=None, reserve=None, level=1, reload_time=None):
@@ -23,17 +21,14 @@ class Weapon:
         self.reload_time=reload_time if reload_time is not None else WEAPON_BASE_RELOAD_TIME
         self.level=level
         self.current_ammo=int(self.max_ammo)
-        self.last_shot_time=0.0
+        self.last_shot_time=float("-inf")
         self.is_reloading=False
         self.reload_timer=0.0
         self.cooldown=60.0/max(1.0,float(self.rpm))
 
-        # Sonido
-        self.shot_sound=load_sound("shot.mp3", volume=0.2)
-
     def fire(self,pos,target,game):
         if self.is_reloading: return None
-        now=time.time()
+        now=game.time  # reloj de juego, no tiempo real
         if now-self.last_shot_time<self.cooldown: return None
         if self.current_ammo<=0:
             self.start_reload()
@@ -43,15 +38,11 @@ class Weapon:
         dir_vec = target_v-pos_v
         if dir_vec.length_squared()==0: dir_vec=pygame.math.Vector2(1,0)
         else: dir_vec=dir_vec.normalize()
-        bullet = Bullet(pos_v,dir_vec,damage=self.damage,lifetime=BULLET_BASE_LIFETIME)
+        bullet = Bullet.acquire(pos_v,dir_vec,damage=self.damage,lifetime=BULLET_BASE_LIFETIME)
         game.bullets.add(bullet)
         self.current_ammo-=1
         self.last_shot_time=now
-        if self.shot_sound:
-            try:
-                ch=pygame.mixer.find_channel(True)
-                ch.play(self.shot_sound,maxtime=int(0.5*1000))
-            except Exception: pass
+        game.audio.play_oneshot("shot")
         return bullet
 
     def start_reload(self):
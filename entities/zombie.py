@@ -1,6 +1,4 @@
 import pygame
-import os
-import random
 from settings import (
     ZOMBIE_COMMON_HP, ZOMBIE_COMMON_SPEED, ZOMBIE_COMMON_SIZE, ZOMBIE_COMMON_DAMAGE,
     ZOMBIE_FAST_HP, ZOMBIE_FAST_SPEED, ZOMBIE_FAST_SIZE, ZOMBIE_FAST_DAMAGE,
@@ -9,9 +7,19 @@ from settings import (
     ZOMBIE_RARITY_CHANCE, ZOMBIE_RARITY_MULT, ZOMBIE_RARITY_UPGRADE_COUNT,
     ZOMBIE_RARITY_SCORE_MULT, ZOMBIE_RARITY_DROP_BONUS,
     ZOMBIE_SCORE_VALUES,
-    WORLD_WIDTH, WORLD_HEIGHT
+    CORPSE_ROTATION_STEPS, ZOMBIE_ARCHETYPES,
 )
-from utils.helpers import load_image_safe, clean_image_background, load_sound
+from core.rng import rng
+from core.animation import get_animation
+from core.decals import DecalLayer
+from utils.helpers import get_rotations, rotation_index
+
+# Giro del cadáver según la dirección en la que caminaba
+CORPSE_ANGLES = {"front": 0, "back": 180, "left": -90, "right": 90}
+
+# Stats/rareza y drops tiran de flujos separados (ver core/rng.py)
+_stats_random = rng("zombies")
+_drop_random = rng("drops")
 
 
 class Zombie(pygame.sprite.Sprite):
@@ -51,12 +59,11 @@ class Zombie(pygame.sprite.Sprite):
         stats = self.TYPE_STATS.get(ztype, self.TYPE_STATS["common"])
         self.type = ztype
         self.level = level
+        self.horde = None  # Horde que simula este zombie (ver core/horde.py)
+        self.slot = -1
         self.pos = pygame.Vector2(pos)
         self.direction = "front"
         self.dead = False
-        self.dead_timer = 0.0
-        self.fade = 0.0
-        self.dead_image = None
 
         # ===============================
         # APLICAR RAREZA
@@ -65,7 +72,7 @@ class Zombie(pygame.sprite.Sprite):
         rarity_mult = ZOMBIE_RARITY_MULT[self.rarity]
         possible_stats = ["hp", "speed", "damage"]
         num_stats_to_upgrade = ZOMBIE_RARITY_UPGRADE_COUNT[self.rarity]
-        stats_to_upgrade = random.sample(possible_stats, num_stats_to_upgrade)
+        stats_to_upgrade = _stats_random.sample(possible_stats, num_stats_to_upgrade)
 
         # Stats base
         self.hp = stats["hp"]
@@ -99,32 +106,19 @@ class Zombie(pygame.sprite.Sprite):
         pygame.draw.circle(self.image, (150,180,40), (self.radius,self.radius), self.radius)
         self.rect = self.image.get_rect(center=(round(self.pos.x), round(self.pos.y)))
 
-        base = os.path.join("zombie", "common")
-        f = load_image_safe(os.path.join(base, "common_frente.png"))
-        b = load_image_safe(os.path.join(base, "common_espalda.png"))
-        s = load_image_safe(os.path.join(base, "common_lateral.png"))
-
-        self.frames = {}
-        if f and b and s:
-            self.frames["front"] = clean_image_background(pygame.transform.scale(f, (self.radius*2,self.radius*2)))
-            self.frames["back"] = clean_image_background(pygame.transform.scale(b, (self.radius*2,self.radius*2)))
-            self.frames["left"] = clean_image_background(pygame.transform.scale(s, (self.radius*2,self.radius*2)))
-            self.frames["right"] = pygame.transform.flip(self.frames["left"], True, False)
+        self.anim, self.frames, self.dead_key, self.dead_frames = self._load_sprites(
+            self.radius, ZOMBIE_ARCHETYPES.get(self.type, "common"))
+        self.anim_clock = 0.0  # solo fuera de la horda (dentro usa Horde.clock)
+        if self.frames:
             self.image = self.frames["front"]
 
-        raw_dead = load_image_safe(os.path.join(base, "dead.png"))
-        self.dead_sprite = clean_image_background(pygame.transform.scale(raw_dead, (self.radius*2, self.radius*2))) if raw_dead else None
-
-        # Sonido
-        self.sound = load_sound("zombie_common.mp3", volume=0.0)
-        if self.sound: self.sound.play(loops=-1)
-        self.max_sound_distance = max(600, (WORLD_WIDTH+WORLD_HEIGHT)/10)
+        # El sonido de la horda lo gestiona core/audio.py (voces limitadas)
 
     # =======================================================
     # ROLL RAREZA
     # =======================================================
     def roll_rarity(self):
-        r = random.random()*100
+        r = _stats_random.random()*100
         cumulative = 0
         for rarity, chance in self.RARITY_TABLE:
             cumulative += chance
@@ -135,47 +129,87 @@ class Zombie(pygame.sprite.Sprite):
     # =======================================================
     # PROPIEDADES
     # =======================================================
+    @property
+    def pos(self):
+        """Posición actual; si está en una horda se lee de sus arrays (copia, no se muta)."""
+        if self.horde is not None:
+            x, y = self.horde.pos[self.slot]
+            return pygame.Vector2(x, y)
+        return self._pos
+
+    @pos.setter
+    def pos(self, value):
+        self._pos = pygame.Vector2(value)
+        if self.horde is not None:
+            self.horde.pos[self.slot] = (self._pos.x, self._pos.y)
+
     @property
     def x(self): return self.pos.x
     @property
     def y(self): return self.pos.y
 
+    # =======================================================
+    # SPRITES COMPARTIDOS
+    # =======================================================
+    @staticmethod
+    def _load_sprites(radius, archetype="common"):
+        """
+        Animaciones (atlas del arquetipo, core/animation.py), primer fotograma
+        de cada dirección y orientaciones del cadáver para un radio; todo
+        compartido en el registro.
+        """
+        size = (radius*2, radius*2)
+        anim = get_animation(archetype, size)
+        if anim is None:
+            return None, {}, None, None
+        frames = {name: anim.clip("walk_" + name)[0] for name in ("front", "back", "left", "right")}
+
+        dead_key, dead_frames = Zombie._corpse_rotations(anim)
+        return anim, frames, dead_key, dead_frames
+
+    @staticmethod
+    def _corpse_rotations(anim):
+        """Orientaciones del cadáver (último fotograma del clip "death") precalculadas: nada de rotate al morir."""
+        dead_key = anim.key + ("death",)
+        return dead_key, get_rotations(dead_key, lambda: anim.shared_frame("death", -1), CORPSE_ROTATION_STEPS)
+
+    @classmethod
+    def preload(cls):
+        """
+        Construye los atlas de todos los tipos y los pasos de alpha de sus
+        cadáveres (pantalla de carga): ni un spawn ni una muerte los crean en partida.
+        """
+        for ztype, stats in cls.TYPE_STATS.items():
+            anim, _, dead_key, dead_frames = cls._load_sprites(stats["radius"], ZOMBIE_ARCHETYPES.get(ztype, "common"))
+            for idx in range(len(dead_frames or ())):
+                DecalLayer.corpse_steps(dead_key + (idx,), lambda idx=idx: cls._corpse_rotations(anim)[1][idx])
+
     # =======================================================
     # UPDATE
     # =======================================================
     def update(self, dt, game):
-        if self.dead:
-            self.dead_timer += dt
-            self._show_death_sprite(dt)
-            if self.sound: self.sound.set_volume(0.0)
-            if self.dead_timer >= 4.0: self.kill()
-            return
+        if self.dead: return
+
+        # Dentro de una horda el movimiento lo hace Horde.step (vectorizado)
+        if self.horde is not None: return
 
         if not game.player: return
         if getattr(game, "paused", False):
-            if self.sound: self.sound.stop()
             return
 
-        # Movimiento
+        # Movimiento: campo de flujo compartido si lo hay; si no, directo hacia el jugador
         dir_vec = game.player.pos - self.pos
         if dir_vec.length_squared() > 0:
-            d = dir_vec.normalize()
+            flow = getattr(game, "flow", None)
+            field = flow.direction_at(self.pos.x, self.pos.y) if flow is not None else None
+            d = pygame.Vector2(field) if field is not None else dir_vec.normalize()
             self.pos += d * self.speed * dt
             self.rect.center = (round(self.pos.x), round(self.pos.y))
             self._set_dir(d)
 
-        if self.frames:
-            self.image = self.frames.get(self.direction, self.image)
-
-        # Colisión jugador
-        if pygame.sprite.collide_circle(self, game.player):
-            game.player.take_damage(self.damage * dt)
-
-        # Sonido
-        if self.sound:
-            dist = self.pos.distance_to(game.player.pos)
-            vol = max(0.0, min(1.0, (1-(dist/self.max_sound_distance))**2)) if dist<self.max_sound_distance else 0.0
-            self.sound.set_volume(vol)
+        self.anim_clock += dt
+        if self.anim is not None:
+            self.image = self.anim.frame_at("walk_" + self.direction, self.anim_clock)
 
     # =======================================================
     # RECIBIR DAÑO (MÉTODO COMPLETO CORREGIDO)
@@ -187,10 +221,8 @@ class Zombie(pygame.sprite.Sprite):
         if self.hp > 0: return
 
         self.dead = True
-        self.dead_timer = 0.0
-        if self.sound:
-            try: self.sound.stop()
-            except Exception: pass
+        if self.horde is not None:
+            self.horde.sync_sprite(self.slot)  # rect y dirección finales
 
         # ✅ DROP Y SCORE CON SISTEMA UNIFICADO
         if game:
@@ -204,23 +236,22 @@ class Zombie(pygame.sprite.Sprite):
                 drop_chance = drop_config["base_chance"] + self.drop_bonus
                 
                 # Check si dropea algo
-                if random.random() * 100 < drop_chance:
+                if _drop_random.random() * 100 < drop_chance:
                     Upgrade.spawn_from_zombie(game.upgrades, self)
             
             game.player.score += self.score_value
 
-        # Mostrar sprite muerto
-        if self.dead_sprite:
-            rotated = self.dead_sprite
-            if self.direction=="back": rotated = pygame.transform.rotate(self.dead_sprite, 180)
-            elif self.direction=="left": rotated = pygame.transform.rotate(self.dead_sprite, -90)
-            elif self.direction=="right": rotated = pygame.transform.rotate(self.dead_sprite, 90)
+        # Cadáver: pasa a la capa de suelo y el zombie sale del grupo (y de la horda)
+        if self.dead_frames:
+            idx = rotation_index(CORPSE_ANGLES.get(self.direction, 0), CORPSE_ROTATION_STEPS)
+            key, corpse = self.dead_key + (idx,), self.dead_frames[idx]
         else:
-            rotated = self.image.copy()
-
-        self.dead_image = rotated
+            key, corpse = (self.type, self.direction, self.rect.size), self.image
+        if game is not None and hasattr(game, "decals"):
+            game.decals.add_corpse(key, corpse, self.rect.center)
         self.damage = 0
         self.radius = 0 # Evitar más colisiones
+        self.kill()
 
     # =======================================================
     # AUXILIARES
@@ -229,12 +260,3 @@ class Zombie(pygame.sprite.Sprite):
         dx, dy = v.x, v.y
         if abs(dx)>abs(dy): self.direction = "right" if dx>0 else "left"
         else: self.direction = "front" if dy>0 else "back"
-
-    def _show_death_sprite(self, dt):
-        if not self.dead_image: return
-        if self.fade<255: self.fade += 400*dt
-        if self.fade>255: self.fade=255
-        corpse = self.dead_image.copy()
-        corpse.set_alpha(int(self.fade))
-        self.image = corpse
-        self.rect = self.image.get_rect(center=(round(self.pos.x), round(self.pos.y)))
\ No newline at end of file
@@ -13,6 +13,21 @@ SCREEN_HEIGHT = 720
 # Frames por segundo (rendimiento del juego)
 FPS = 60
 
+# Simulación a paso fijo, independiente de FPS (p.ej. 30 en equipos lentos, 120 para colisiones finas)
+SIM_TICK_RATE = 60
+# Máximo de ticks de recuperación por frame tras un tirón (el resto del retraso se descarta)
+SIM_MAX_CATCHUP_STEPS = 5
+
+# Profiler de frames: tamaño del buffer circular, teclas del overlay y del volcado CSV
+PROFILER_HISTORY = 600
+PROFILER_TOGGLE_KEY = "F3"
+PROFILER_DUMP_KEY = "F4"
+
+# Grabación de partidas (core/replay.py): activar en juego normal, carpeta y cada cuántos ticks un checksum
+REPLAY_RECORD = False
+REPLAY_DIR = "replays"
+REPLAY_CHECKSUM_INTERVAL = 1
+
 # ===================================================
 # MUNDO
 # ===================================================
@@ -21,6 +36,85 @@ FPS = 60
 WORLD_WIDTH = 4000
 WORLD_HEIGHT = 4000
 
+# Tamaño de celda del índice espacial (colisiones balas/mejoras/contacto)
+SPATIAL_CELL_SIZE = 128
+
+# Separación de la horda (Horde.step): los zombies se apartan entre sí, los grandes empujan a los pequeños
+CROWD_SEPARATION = True
+CROWD_PERSONAL_SPACE = 0.75       # fracción de (radio_i + radio_j) a la que empiezan a separarse
+CROWD_SEPARATION_WEIGHT = 1.5     # peso de la separación frente a ir hacia el jugador
+CROWD_PUSH_LIMIT = 2.0            # corrección máxima por tick, en múltiplos de speed * dt
+CROWD_CELL_SIZE = 96              # celda de la rejilla de vecinos; los zombies grandes buscan en un anillo mayor
+CROWD_MAX_PAIRS = 60000           # pares candidatos por tick; por encima se reparte la horda entre ticks
+
+# Campo de flujo compartido hacia el jugador (core/flowfield.py): rodea obstáculos sin pathfinding por zombie.
+# Desactivado mientras los obstáculos no sean sólidos para el jugador ni para la horda (hoy solo los lee el
+# campo): activarlo haría que los zombies rodeen árboles y agua que el jugador cruza sin más.
+FLOW_FIELD = False
+FLOW_CELL_SIZE = 64               # px por celda (divisor de TERRAIN_CHUNK_SIZE)
+FLOW_RADIUS = 32                  # celdas alrededor del jugador que cubre el campo; fuera, persecución directa
+FLOW_PREFETCH_MARGIN = 8          # celdas más allá de la ventana cuyos obstáculos se preparan por adelantado
+FLOW_PREFETCH_PER_TICK = 1        # chunks de obstáculos preparados como máximo por tick
+FLOW_BLOCKING_TERRAIN = ("water", "lava")
+FLOW_BLOCKING_PROPS = ("tree_oak", "tree_pine", "tree_dead", "cactus", "rock_small")
+
+# Terreno por tiles (assets/images/terrain/<nombre>.png), pre-renderizado en chunks
+TERRAIN_TYPES = ("grass", "dirt", "sand", "snow", "mud", "ice", "lava", "rock", "forest_ground", "water")
+TERRAIN_TILE_SIZE = 128           # px por tile en el mundo
+TERRAIN_CHUNK_SIZE = 512          # px por chunk (múltiplo de TERRAIN_TILE_SIZE)
+TERRAIN_MAX_MB = 48               # memoria máxima de chunks (se descartan los menos vistos)
+TERRAIN_PREFETCH_MARGIN = 1       # anillo de chunks alrededor de la vista que se construye por adelantado
+TERRAIN_PREFETCH_PER_FRAME = 1    # chunks fuera de la vista construidos como máximo por frame
+
+# Generación procedural del mundo (core/worldgen.py): un bioma por nivel narrativo.
+# "terrain": (umbral de elevación, tipo) en orden creciente; "props": tipo de terreno ->
+# (probabilidad de que un punto Poisson tenga objeto, objetos posibles)
+WORLD_BIOME = "meadow"
+WORLD_BIOMES = {
+    "meadow": {
+        "terrain": ((0.32, "water"), (0.38, "mud"), (0.60, "grass"), (0.72, "forest_ground"), (1.01, "rock")),
+        "props": {
+            "grass": (0.20, ("flower", "bush", "tree_oak")),
+            "forest_ground": (0.75, ("tree_pine", "tree_oak", "tree_pine", "bush")),
+            "mud": (0.10, ("tree_dead",)),
+            "rock": (0.35, ("rock_small",)),
+        },
+    },
+    "desert": {
+        "terrain": ((0.34, "dirt"), (0.62, "sand"), (0.70, "dirt"), (1.01, "rock")),
+        "props": {
+            "sand": (0.12, ("cactus", "cactus", "rock_small")),
+            "dirt": (0.10, ("tree_dead", "bush")),
+            "rock": (0.40, ("rock_small",)),
+        },
+    },
+    "tundra": {
+        "terrain": ((0.34, "ice"), (0.60, "snow"), (0.72, "forest_ground"), (1.01, "rock")),
+        "props": {
+            "snow": (0.12, ("tree_pine", "tree_dead", "rock_small")),
+            "forest_ground": (0.70, ("tree_pine",)),
+            "rock": (0.35, ("rock_small",)),
+        },
+    },
+    "volcanic": {
+        "terrain": ((0.32, "lava"), (0.40, "rock"), (0.60, "dirt"), (0.70, "mud"), (1.01, "rock")),
+        "props": {
+            "dirt": (0.10, ("tree_dead", "rock_small")),
+            "mud": (0.15, ("tree_dead",)),
+            "rock": (0.30, ("rock_small",)),
+        },
+    },
+}
+# Objetos (assets/images/objects/<nombre>.png): tamaño en px
+WORLD_PROP_SIZES = {
+    "tree_oak": 150, "tree_pine": 150, "tree_dead": 120, "cactus": 90,
+    "bush": 64, "rock_small": 56, "flower": 40,
+}
+WORLDGEN_NOISE_SCALE = 2400       # px del octavo más grande del ruido de elevación
+WORLDGEN_OCTAVES = 4
+WORLDGEN_PROP_SPACING = 110       # distancia mínima entre objetos (Poisson-disk)
+WORLDGEN_KEEP_RADIUS = 4          # chunks generados que se conservan alrededor de la cámara
+
 # Player
 PLAYER_SPEED = 200
 PLAYER_SIZE = 100
@@ -101,6 +195,25 @@ ZOMBIE_BOSS_SIZE = 300            # Enorme
 ZOMBIE_BOSS_HP = 400              # Vida extrema (20+ balas)
 ZOMBIE_BOSS_DAMAGE = 40           # Daño devastador
 
+# ===================================================
+# ZOMBIES - ANIMACIÓN (core/animation.py)
+# ===================================================
+
+# Carpeta de fotogramas de cada tipo (assets/images/zombie/<arquetipo>/); un atlas por arquetipo y tamaño
+ZOMBIE_ARCHETYPES = {"common": "common", "fast": "common", "tank": "common", "boss": "common"}
+
+# Clips: fotogramas (en orden), fotogramas por segundo, si se repiten y si van volteados en horizontal.
+# Los walk_* tienen que estar todos: se eligen con la dirección de la horda.
+ZOMBIE_ANIM_CLIPS = {
+    "walk_front": {"frames": ("common_frente.png", "front.png"), "fps": 4, "loop": True, "flip": False},
+    "walk_back":  {"frames": ("common_espalda.png", "espalda.png", "common_espalda.png", "espalda2.png"),
+                   "fps": 6, "loop": True, "flip": False},
+    "walk_left":  {"frames": ("lado.png", "lado2.png"), "fps": 4, "loop": True, "flip": True},
+    "walk_right": {"frames": ("lado.png", "lado2.png"), "fps": 4, "loop": True, "flip": False},
+    "attack":     {"frames": ("attack_front.png", "front.png"), "fps": 6, "loop": True, "flip": False},
+    "death":      {"frames": ("dead.png",), "fps": 1, "loop": False, "flip": False},
+}
+
 # ===================================================
 # SISTEMA DE NIVELES DE ZOMBIES (PROGRESIÓN POR OLA)
 # ===================================================
@@ -276,6 +389,74 @@ ASSETS_IMAGES = "assets/images"
 # Carpeta principal de sonidos y música
 ASSETS_SOUNDS = "assets/sounds"
 
+# Fuentes
+ASSETS_FONTS = "assets/fonts"
+
+# Carga de recursos (core/assets.py): hilos que decodifican y música que no se decodifica (va en streaming)
+ASSET_LOADER_THREADS = 4
+ASSET_STREAMED_SOUNDS = ("ambient.mp3",)
+
+# Paquete horneado (python -m core.assetpack): si existe se abre con mmap al arrancar
+ASSET_PACK = True
+ASSET_PACK_PATH = "build/assets.pack"
+
+# ===================================================
+# AUDIO
+# ===================================================
+
+# Voces con canal propio para los zombies más audibles (el resto va a la "cama" de horda)
+AUDIO_ZOMBIE_VOICES = 8
+# Canales reservados para efectos puntuales (disparos, impactos)
+AUDIO_ONESHOT_CHANNELS = 12
+# Cada cuánto se reasignan voces y volúmenes (segundos de juego)
+AUDIO_UPDATE_INTERVAL = 0.05
+# Distancia a partir de la cual un zombie no se oye
+AUDIO_MAX_DISTANCE = max(600, (WORLD_WIDTH + WORLD_HEIGHT) / 10)
+# Ganancia mínima para considerar audible a un zombie
+AUDIO_MIN_GAIN = 0.01
+# Volumen de la cama de horda por unidad de intensidad acumulada
+AUDIO_HORDE_BED_GAIN = 0.15
+# Efectos puntuales: nombre -> (archivo, volumen, duración máx. ms, intervalo mínimo s)
+AUDIO_ONESHOTS = {
+    "shot": ("shot.mp3", 0.2, 500, 0.04),
+    "impact": ("impact.mp3", 0.4, 500, 0.05),
+}
+
+# ===================================================
+# MEMORIA Y POOLS
+# ===================================================
+
+# Memoria máxima del registro de sprites compartidos (MB, se descarta LRU)
+SPRITE_CACHE_MAX_MB = 64
+
+# Imágenes originales ya decodificadas (load_image_safe) que se conservan (MB, se descarta LRU)
+IMAGE_CACHE_MAX_MB = 256
+
+# Textos renderizados de menús y botones que se guardan (LRU)
+LABEL_CACHE_SIZE = 512
+
+# Rotaciones precalculadas por sprite (balas); los cadáveres solo usan 4 orientaciones
+ROTATION_STEPS = 64
+CORPSE_ROTATION_STEPS = 4
+
+# Cadáveres: aparición con pasos de alpha y luego horneado en la capa de suelo
+CORPSE_FADE_TIME = 255 / 400      # segundos (antes: +400 de alpha por segundo)
+CORPSE_ALPHA_STEPS = 16
+DECAL_CHUNK_SIZE = 512            # px por chunk de suelo
+DECAL_MAX_MB = 32                 # memoria máxima de chunks (se descartan los más antiguos)
+
+# Minimapa: a partir de este número de zombies se dibuja densidad por celdas
+MINIMAP_HEATMAP_THRESHOLD = 300
+MINIMAP_HEATMAP_CELL = 6          # px del minimapa por celda
+
+# Pasos de relleno precalculados por barra de vida de zombie
+ZOMBIE_BAR_STEPS = 32
+
+# Instancias libres que guarda cada pool (se precrean al iniciar el juego)
+POOL_BULLETS = 256
+POOL_IMPACTS = 64
+POOL_UPGRADES = 64
+
 # ===================================================
 # NOTAS DE BALANCEO
 # ===================================================
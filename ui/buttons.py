@@ -1,4 +1,5 @@
 import pygame
+from utils.helpers import get_font, render_label
 
 class ButtonWithBackground:
     """Botón con fondo coloreable y borde."""
@@ -22,8 +23,7 @@ class ButtonWithBackground:
         pygame.draw.rect(screen, bg_color, self.rect)
         pygame.draw.rect(screen, self.border_color, self.rect, 3)
         font_size = self.hover_size if hovered else self.base_size
-        font = pygame.font.Font(self.font_path, font_size)
-        label = font.render(self.text, True, self.text_color)
+        label = render_label(get_font(self.font_path, font_size), self.text, self.text_color)
         screen.blit(label, label.get_rect(center=self.rect.center))
 
     def is_clicked(self, mouse_pos):
@@ -48,8 +48,7 @@ class ButtonTextOnly:
         hovered = self.rect.collidepoint(mouse_pos) if self.rect else False
         color = self.hover_color if hovered else self.text_color
         font_size = self.hover_size if hovered else self.base_size
-        font = pygame.font.Font(self.font_path, font_size)
-        label = font.render(self.text, True, color)
+        label = render_label(get_font(self.font_path, font_size), self.text, color)
         self.rect = label.get_rect(center=self.center_pos)
         screen.blit(label, self.rect)
 
@@ -1,6 +1,40 @@
 import pygame
 import math
 from ui.map import MiniMap
+from ui.overlays import ZombieOverlays
+
+BAR_X, BAR_Y = 30, 30
+BAR_WIDTH, BAR_HEIGHT = 250, 18
+SHIELD_Y = BAR_Y + 32
+AMMO_RADIUS = 18
+RELOAD_ARC_STEPS = 64  # Pasos del arco de recarga (solo se redibuja al cambiar de paso)
+
+_UNSET = object()
+
+
+class HudWidget:
+    """
+    Elemento retenido del HUD: guarda la superficie del último valor enlazado.
+
+    `bind(player, wave_manager)` devuelve un valor comparable (ya cuantizado) y
+    `render(value)` construye su superficie (o None si no hay nada que dibujar).
+    Solo se vuelve a renderizar cuando el valor cambia.
+    """
+
+    def __init__(self, pos, bind, render):
+        self.pos = pos
+        self.bind = bind
+        self.render = render
+        self.value = _UNSET
+        self.surface = None
+
+    def update(self, player, wave_manager):
+        value = self.bind(player, wave_manager)
+        if value != self.value:
+            self.value = value
+            self.surface = self.render(value)
+        return self.surface
+
 
 class HUD:
     """HUD principal con barra de vida, shield, ammo y minimapa."""
@@ -8,6 +42,11 @@ class HUD:
     def __init__(self, font):
         self.font = font
         self.minimap = None
+        self._static_key = None
+        self._static = []
+        self._ammo_y = None
+        self.widgets = []
+        self.overlays = ZombieOverlays(font)
 
     def _ensure_minimap(self, wave_manager):
         if self.minimap is None:
@@ -16,106 +55,144 @@ class HUD:
                 self.minimap = MiniMap(game=game, width=180, height=180, margin=8,
                                        position="topright", update_interval_ms=100)
 
-    def draw(self, surface, player, wave_manager):
-        # Barra de vida del jugador
+    # ==========================================================
+    # Construcción de widgets
+    # ==========================================================
+    def _text(self, fmt, color):
+        return lambda value: self.font.render(fmt.format(*value), True, color)
+
+    @staticmethod
+    def _bar(value):
+        fill, color = value
+        if fill <= 0:
+            return None
+        surf = pygame.Surface((fill, BAR_HEIGHT))
+        surf.fill(color)
+        return surf
+
+    @staticmethod
+    def _hp_bar_value(player, _):
         max_hp = getattr(player, "max_health", 100)
-        bar_width, bar_height = 250, 18
-        x, y = 30, 30
-        hp_ratio = max(0, player.health / max_hp)
-        pygame.draw.rect(surface, (0, 0, 0), (x-3, y-3, bar_width+6, bar_height+6))
-        pygame.draw.rect(surface, (40, 40, 40), (x, y, bar_width, bar_height))
-        hp_color = (200, 50, 50) if hp_ratio < 0.3 else (255, 180, 50) if hp_ratio < 0.6 else (50, 200, 80)
-        pygame.draw.rect(surface, hp_color, (x, y, int(bar_width*hp_ratio), bar_height))
-        hp_text = self.font.render(f"HP {int(player.health)}/{int(max_hp)}", True, (255, 255, 255))
-        surface.blit(hp_text, (x + 260, y-2))
-
-        # Barra de shield
+        ratio = max(0, player.health / max_hp)
+        color = (200, 50, 50) if ratio < 0.3 else (255, 180, 50) if ratio < 0.6 else (50, 200, 80)
+        return int(BAR_WIDTH * ratio), color
+
+    @staticmethod
+    def _shield_bar_value(player, _):
         max_shield = getattr(player, "max_shield", 0)
-        if max_shield > 0:
-            shield_ratio = max(0, player.shield / max_shield)
-            shield_y = y + 32
-            pygame.draw.rect(surface, (0, 0, 0), (x-3, shield_y-3, bar_width+6, bar_height+6))
-            pygame.draw.rect(surface, (40, 40, 60), (x, shield_y, bar_width, bar_height))
-            shield_color = (80, 80, 255) if shield_ratio > 0.3 else (120, 120, 255)
-            pygame.draw.rect(surface, shield_color, (x, shield_y, int(bar_width*shield_ratio), bar_height))
-            shield_text = self.font.render(f"SHIELD {int(player.shield)}/{int(max_shield)}", True, (180, 180, 255))
-            surface.blit(shield_text, (x + 260, shield_y))
-
-        # Score, wave y zombies left
-        surface.blit(self.font.render(f"SCORE: {player.score}", True, (255,255,255)), (30,100))
-        surface.blit(self.font.render(f"WAVE: {wave_manager.current_wave}", True, (255,255,100)), (30,140))
-        alive = sum(1 for z in wave_manager.game.zombies if not getattr(z, "dead", False))
-        total_left = wave_manager.enemies_to_spawn + alive
-        surface.blit(self.font.render(f"ZOMBIES LEFT: {total_left}", True, (255,120,120)), (30,180))
-
-        # Ammo HUD
-        sw, sh = surface.get_size()
-        ammo_x, ammo_y = 30, sh-60
-        circle_center = (ammo_x+24, ammo_y+6)
-        circle_radius = 18
-        pygame.draw.circle(surface, (30,30,30), circle_center, circle_radius)
-        pygame.draw.circle(surface, (0,0,0), circle_center, circle_radius,2)
-        if getattr(player,"weapon",None) and player.weapon.is_reloading:
-            progress = max(0.0, min(1.0, player.weapon.reload_timer/max(0.0001, player.weapon.reload_time)))
-            start_angle = -math.pi/2
-            end_angle = start_angle + progress*2*math.pi
-            rect = pygame.Rect(circle_center[0]-circle_radius, circle_center[1]-circle_radius, circle_radius*2, circle_radius*2)
-            pygame.draw.arc(surface,(200,200,255),rect,start_angle,end_angle,6)
+        if max_shield <= 0:
+            return 0, None
+        ratio = max(0, player.shield / max_shield)
+        return int(BAR_WIDTH * ratio), (80, 80, 255) if ratio > 0.3 else (120, 120, 255)
+
+    @staticmethod
+    def _reload_indicator(value):
+        """Arco de progreso de recarga o punto verde, sobre el círculo estático."""
+        reloading, step = value
+        size = AMMO_RADIUS * 2
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        center = (AMMO_RADIUS, AMMO_RADIUS)
+        if reloading:
+            start_angle = -math.pi / 2
+            end_angle = start_angle + step / RELOAD_ARC_STEPS * 2 * math.pi
+            pygame.draw.arc(surf, (200, 200, 255), surf.get_rect(), start_angle, end_angle, 6)
         else:
-            pygame.draw.circle(surface,(80,220,80),circle_center,6)
-
-        if getattr(player,"weapon",None):
-            ammo_text = self.font.render(f"AMMO: {player.weapon.current_ammo}/{player.weapon.max_ammo} | {player.weapon.reserve_ammo}", True, (255,255,255))
-            surface.blit(ammo_text, (ammo_x+60, ammo_y-4))
-            if player.weapon.is_reloading:
-                reload_text = self.font.render("RELOADING...", True, (200,200,255))
-                surface.blit(reload_text, (ammo_x+110, ammo_y-30))
-
-        # ===============================
-        # Health bars y nivel de zombies
-        # ===============================
-        camera = getattr(wave_manager.game,"camera",None)
-        screen_rect = surface.get_rect()
-        for z in wave_manager.game.zombies:
-            if getattr(z,"dead",False): 
-                continue
-            if not hasattr(z,"hp") or not hasattr(z,"rect"): 
-                continue
-
-            try: 
-                z_screen_rect = camera.apply(z.rect) if camera else z.rect
-            except Exception: 
-                z_screen_rect = z.rect
-
-            if not screen_rect.colliderect(z_screen_rect): 
-                continue
-
-            # Barra de vida
-            zx, zy = z_screen_rect.centerx, z_screen_rect.bottom+4
-            max_z_hp = z.TYPE_STATS.get(z.type,{}).get("hp", getattr(z,"hp",1))
-            hp_ratio = max(0.0, min(1.0, (z.hp/max_z_hp) if max_z_hp else 0.0))
-            bar_w = max(24, z_screen_rect.width//2)
-            bar_h = 6
-            pygame.draw.rect(surface,(0,0,0),(zx-bar_w//2-1, zy-1, bar_w+2, bar_h+2))
-            pygame.draw.rect(surface,(60,60,60),(zx-bar_w//2, zy, bar_w, bar_h))
-            col = (220,40,40) if hp_ratio<0.3 else (255,180,40) if hp_ratio<0.6 else (60,220,60)
-            pygame.draw.rect(surface,col,(zx-bar_w//2, zy, int(bar_w*hp_ratio), bar_h))
-
-            # Nivel sobre la cabeza
-            level_text = f"Lv {getattr(z,'level',1)}"
-            rarity_color_map = {
-                "common": (255,255,255),
-                "uncommon": (50,220,50),
-                "rare": (50,150,255),
-                "epic": (180,50,255),
-                "legendary": (255,180,50)
-            }
-            txt_color = rarity_color_map.get(getattr(z,'rarity','common'), (255,255,255))
-            txt_surf = self.font.render(level_text, True, txt_color)
-            txt_rect = txt_surf.get_rect(center=(z_screen_rect.centerx, z_screen_rect.top - 10))
-            surface.blit(txt_surf, txt_rect)
+            pygame.draw.circle(surf, (80, 220, 80), center, 6)
+        return surf
+
+    @staticmethod
+    def _reload_value(player, _):
+        weapon = getattr(player, "weapon", None)
+        if not weapon or not weapon.is_reloading:
+            return False, 0
+        progress = max(0.0, min(1.0, weapon.reload_timer / max(0.0001, weapon.reload_time)))
+        return True, int(progress * RELOAD_ARC_STEPS)
+
+    def _build_widgets(self, sh):
+        ammo_x, ammo_y = 30, sh - 60
+        cx, cy = ammo_x + 24, ammo_y + 6
+
+        def shield_text(value):
+            return None if value[1] <= 0 else self.font.render(
+                "SHIELD {}/{}".format(*value), True, (180, 180, 255))
+
+        def ammo_text(value):
+            return None if value is None else self.font.render(
+                "AMMO: {}/{} | {}".format(*value), True, (255, 255, 255))
+
+        self.widgets = [
+            HudWidget((BAR_X, BAR_Y), self._hp_bar_value, self._bar),
+            HudWidget((BAR_X + 260, BAR_Y - 2),
+                      lambda p, _: (int(p.health), int(getattr(p, "max_health", 100))),
+                      self._text("HP {}/{}", (255, 255, 255))),
+            HudWidget((BAR_X, SHIELD_Y), self._shield_bar_value, self._bar),
+            HudWidget((BAR_X + 260, SHIELD_Y),
+                      lambda p, _: (int(getattr(p, "shield", 0)), int(getattr(p, "max_shield", 0))),
+                      shield_text),
+            HudWidget((30, 100), lambda p, _: (p.score,), self._text("SCORE: {}", (255, 255, 255))),
+            HudWidget((30, 140), lambda p, w: (w.current_wave,), self._text("WAVE: {}", (255, 255, 100))),
+            # Conteo mantenido por la horda al añadir/quitar zombies (los muertos salen del grupo)
+            HudWidget((30, 180), lambda p, w: (w.enemies_to_spawn + w.game.horde.count,),
+                      self._text("ZOMBIES LEFT: {}", (255, 120, 120))),
+            HudWidget((cx - AMMO_RADIUS, cy - AMMO_RADIUS), self._reload_value, self._reload_indicator),
+            HudWidget((ammo_x + 60, ammo_y - 4),
+                      lambda p, _: (p.weapon.current_ammo, p.weapon.max_ammo, p.weapon.reserve_ammo)
+                      if getattr(p, "weapon", None) else None,
+                      ammo_text),
+            HudWidget((ammo_x + 110, ammo_y - 30),
+                      lambda p, _: bool(getattr(p, "weapon", None) and p.weapon.is_reloading),
+                      lambda reloading: self.font.render("RELOADING...", True, (200, 200, 255)) if reloading else None),
+        ]
+
+    def _static_layer(self, sh, has_shield):
+        """Marcos de barras y fondo del indicador de munición (solo cambian con el shield o la pantalla)."""
+        key = (sh, has_shield)
+        if key == self._static_key:
+            return self._static
+        self._static_key = key
+
+        height = (SHIELD_Y - BAR_Y if has_shield else 0) + BAR_HEIGHT + 6
+        frames = pygame.Surface((BAR_WIDTH + 6, height), pygame.SRCALPHA)
+        for y in ((0, SHIELD_Y - BAR_Y) if has_shield else (0,)):
+            pygame.draw.rect(frames, (0, 0, 0), (0, y, BAR_WIDTH + 6, BAR_HEIGHT + 6))
+            bg = (40, 40, 60) if y else (40, 40, 40)
+            pygame.draw.rect(frames, bg, (3, y + 3, BAR_WIDTH, BAR_HEIGHT))
+
+        size = AMMO_RADIUS * 2 + 1
+        circle = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(circle, (30, 30, 30), (AMMO_RADIUS, AMMO_RADIUS), AMMO_RADIUS)
+        pygame.draw.circle(circle, (0, 0, 0), (AMMO_RADIUS, AMMO_RADIUS), AMMO_RADIUS, 2)
+
+        self._static = [(frames, (BAR_X - 3, BAR_Y - 3)),
+                        (circle, (30 + 24 - AMMO_RADIUS, sh - 60 + 6 - AMMO_RADIUS))]
+        return self._static
+
+    # ==========================================================
+    # Dibujo
+    # ==========================================================
+    def draw(self, surface, player, wave_manager):
+        sh = surface.get_height()
+        if self._ammo_y != sh:
+            self._ammo_y = sh
+            self._build_widgets(sh)
+
+        surface.blits(self._static_layer(sh, getattr(player, "max_shield", 0) > 0), False)
+        batch = []
+        for widget in self.widgets:
+            surf = widget.update(player, wave_manager)
+            if surf is not None:
+                batch.append((surf, widget.pos))
+        surface.blits(batch, False)
+
+        # Barras de vida y nivel de zombies (solo los visibles, ver Horde.sync_visible)
+        game = wave_manager.game
+        self.overlays.draw(surface, game.visible_zombies, *game.view_offset)
+
+        prof = getattr(wave_manager.game, "profiler", None)
+        if prof: prof.lap("hud")
 
         # Minimapa
         self._ensure_minimap(wave_manager)
         if self.minimap: 
-            self.minimap.draw(surface)
\ No newline at end of file
+            self.minimap.draw(surface)
+        if prof: prof.lap("minimap")
\ No newline at end of file
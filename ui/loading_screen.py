@@ -1,5 +1,5 @@
 import pygame
-from utils.helpers import load_image_safe
+from utils.helpers import load_image_safe, get_font, render_label
 
 class LoadingScreen:
     """Pantalla de carga con imagen escalada horizontalmente y barra de progreso."""
@@ -32,14 +32,25 @@ class LoadingScreen:
 
         self.bar_color = (0, 255, 0)
         self.bar_bg_color = (50, 50, 50)
-        self.clock = pygame.time.Clock()
+        self.detail = ""  # texto bajo la barra (archivos / MB cargados)
+        self.font = get_font("assets/fonts/PressStart2P-Regular.ttf", 10)
+        self._last_draw = 0
 
-    def update_progress(self, value):
-        """Actualiza el progreso de la barra (0 a 1)."""
+    def update_progress(self, value, detail=None):
+        """
+        Actualiza el progreso de la barra (0 a 1). Redibuja como mucho a 60 fps y
+        nunca espera: la carga dura lo que dura el trabajo real.
+        """
         self.progress = max(0.0, min(1.0, value))
+        if detail is not None:
+            self.detail = detail
+        now = pygame.time.get_ticks()
+        if now - self._last_draw < 16 and self.progress < 1.0:
+            return
+        self._last_draw = now
+        pygame.event.pump()  # la ventana sigue respondiendo durante la carga
         self.draw()
         pygame.display.flip()
-        self.clock.tick(60)
 
     def draw(self):
         self.screen.fill((0, 0, 0))
@@ -48,3 +59,6 @@ class LoadingScreen:
         pygame.draw.rect(self.screen, self.bar_bg_color, (self.bar_x, self.bar_y, self.bar_width, self.bar_height))
         # Barra de progreso
         pygame.draw.rect(self.screen, self.bar_color, (self.bar_x, self.bar_y, self.bar_width * self.progress, self.bar_height))
+        if self.detail:
+            label = render_label(self.font, self.detail, (200, 200, 200))
+            self.screen.blit(label, (self.bar_x, self.bar_y - label.get_height() - 6))
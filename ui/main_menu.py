@@ -1,6 +1,6 @@
 import pygame
 import sys
-from utils.helpers import load_image_safe
+from utils.helpers import load_image_safe, load_cursor, get_font
 from core.game import Game
 from ui.buttons import ButtonTextOnly, Buttons
 
@@ -33,29 +33,11 @@ else:
 font_path = "assets/fonts/PressStart2P-Regular.ttf"
 if not pygame.font.get_init():
     pygame.font.init()
-try:
-    base_font = pygame.font.Font(font_path, 28)
-except:
-    print("[WARN] No se encontró la fuente Press Start 2P, usando fuente por defecto.")
-    base_font = pygame.font.Font(None, 28)
+base_font = get_font(font_path, 28)
 
 # --- Cursor ---
-def load_cursor(path, size=(32, 32)):
-    img = load_image_safe(path)
-    if not img:
-        return None
-    img = pygame.transform.scale(img, size)
-    img.lock()
-    for x in range(img.get_width()):
-        for y in range(img.get_height()):
-            r, g, b, a = img.get_at((x, y))
-            if a > 0 and (r + g + b) / 3 > 210:
-                img.set_at((x, y), (0, 0, 0, 0))
-    img.unlock()
-    return img
-
 pygame.mouse.set_visible(False)
-cursor_menu = load_cursor("ui/cursor_menu.png", (20, 20))
+cursor_menu = load_cursor("ui/cursor_menu.png", (20, 20), threshold=210, alpha_cutoff=0)
 
 # --- Botones del menú ---
 menu_items = ["START GAME", "SETTINGS", "HIGH SCORES", "EXIT"]
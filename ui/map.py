@@ -1,15 +1,28 @@
 # ui/map.py
+import numpy as np
 import pygame
-from settings import WORLD_WIDTH, WORLD_HEIGHT
+from settings import WORLD_WIDTH, WORLD_HEIGHT, MINIMAP_HEATMAP_THRESHOLD, MINIMAP_HEATMAP_CELL
+
+
+def _disk_offsets(radius):
+    """Desplazamientos (dx, dy) de un círculo relleno de radio `radius` (sello de marcador)."""
+    r = int(radius)
+    d = np.arange(-r, r + 1)
+    dx, dy = np.meshgrid(d, d, indexing="ij")
+    inside = dx * dx + dy * dy <= r * r + r
+    return dx[inside], dy[inside]
 
 
 class MiniMap:
     """
     Minimap estático (no sigue cámara). Recibe referencia a game para leer:
       - game.player (debe tener .pos: Vector2)
-      - game.zombies (iterable de zombies con .pos: Vector2 y .dead flag)
+      - game.horde (posiciones de los zombies vivos en arrays NumPy)
       - game.upgrades (iterable de upgrades con .pos: Vector2)
-    Actualiza los arrays de posiciones cada `update_interval_ms` para ahorrar CPU.
+    Fondo y bordes se construyen una vez. Cada `update_interval_ms` (reloj de
+    juego) se recompone la superficie: posiciones transformadas en bloque y
+    marcadores estampados en un pixel array. Por encima de
+    MINIMAP_HEATMAP_THRESHOLD zombies se dibuja un mapa de densidad por celdas.
     """
 
     def __init__(
@@ -35,17 +48,29 @@ class MiniMap:
         self.scale_x = self.width / float(max(1, WORLD_WIDTH))
         self.scale_y = self.height / float(max(1, WORLD_HEIGHT))
 
-        # cache de posiciones (listas de tuplas (x,y) en coordenadas del minimapa)
-        self._player_pos = (0, 0)
-        self._zombie_positions = []  # lista de (x,y)
-        self._upgrade_positions = []
-
-        # temporizador para actualizar caches (ms)
+        # temporizador para recomponer el minimapa (ms)
         self.update_interval_ms = int(update_interval_ms)
-        self._last_update_ms = 0
+        self._last_update_ms = None
+        self.heatmap = False
+        self._heat_cells = None
+
+        # capa estática (fondo + bordes) y superficie compuesta (con alpha)
+        size = (self.width + 2 * self.margin, self.height + 2 * self.margin)
+        self._static = self._build_static(size)
+        self.surface = self._static
+        self._zombie_stamp = _disk_offsets(3)
+        self._upgrade_stamp = self._zombie_stamp
+
+    def _build_static(self, size):
+        static = pygame.Surface(size, pygame.SRCALPHA)
+        bg_color = self.bg_color
+        static.fill(bg_color if len(bg_color) == 4 else (*bg_color, 200))
 
-        # superficie del minimapa (con alpha)
-        self.surface = pygame.Surface((self.width + 2 * self.margin, self.height + 2 * self.margin), pygame.SRCALPHA)
+        # borde
+        pygame.draw.rect(static, self.border_color, (0, 0, *size), width=2, border_radius=6)
+        # borde interior sutil (zona de puntos)
+        pygame.draw.rect(static, (40, 40, 40), (self.margin, self.margin, self.width, self.height), width=1)
+        return static
 
     def world_to_map(self, wx: float, wy: float):
         """Convierte coordenadas del mundo (wx,wy) a coordenadas en la superficie del minimapa."""
@@ -56,46 +81,97 @@ class MiniMap:
         my = max(self.margin, min(self.margin + self.height, my))
         return mx, my
 
-    def _recompute_positions(self):
-        """Recalcula y cachea posiciones de player, zombies y upgrades."""
+    def _map_coords(self, wx, wy):
+        """Versión vectorizada de world_to_map para arrays de coordenadas."""
+        m = self.margin
+        mx = np.clip((wx * self.scale_x).astype(np.int32) + m, m, m + self.width)
+        my = np.clip((wy * self.scale_y).astype(np.int32) + m, m, m + self.height)
+        return mx, my
+
+    @staticmethod
+    def _stamp(rgb, alpha, mx, my, offsets, color):
+        """Estampa el mismo disco en todas las posiciones (mx, my) con una sola asignación."""
+        if mx.size == 0:
+            return
+        w, h = alpha.shape
+        dx, dy = offsets
+        x = np.clip((mx[:, None] + dx).ravel(), 0, w - 1)
+        y = np.clip((my[:, None] + dy).ravel(), 0, h - 1)
+        rgb[x, y] = color
+        alpha[x, y] = 255
+
+    def _draw_heatmap(self, wx, wy):
+        """Densidad de zombies por celdas de MINIMAP_HEATMAP_CELL px, de rojo oscuro a amarillo."""
+        cell = MINIMAP_HEATMAP_CELL
+        nx, ny = max(1, self.width // cell), max(1, self.height // cell)
+        cx = np.clip((wx * (nx / WORLD_WIDTH)).astype(np.int32), 0, nx - 1)
+        cy = np.clip((wy * (ny / WORLD_HEIGHT)).astype(np.int32), 0, ny - 1)
+        counts = np.bincount(cx * ny + cy, minlength=nx * ny).reshape(nx, ny)
+        if not counts.any():
+            return
+
+        # Una superficie de nx x ny (un píxel por celda) escalada sin filtrado
+        level = np.log1p(counts) / np.log1p(counts.max())
+        heat = self._heat_cells
+        if heat is None or heat.get_size() != (nx, ny):
+            heat = self._heat_cells = pygame.Surface((nx, ny), pygame.SRCALPHA)
+        rgb = pygame.surfarray.pixels3d(heat)
+        alpha = pygame.surfarray.pixels_alpha(heat)
+        rgb[:, :, 0] = 255
+        rgb[:, :, 1] = (40 + 200 * level).astype(np.uint8)
+        rgb[:, :, 2] = (20 * level).astype(np.uint8)
+        alpha[:] = np.where(counts > 0, (90 + 165 * level), 0).astype(np.uint8)
+        del rgb, alpha
+        scaled = pygame.transform.scale(heat, (nx * cell, ny * cell))
+        self.surface.blit(scaled, (self.margin, self.margin))
+
+    def _recompose(self):
+        """Rehace la superficie del minimapa a partir de la capa estática."""
         game = self.game
+        self.surface = self._static.copy()  # copia exacta (con alpha) de fondo y bordes
 
-        # player
-        player = getattr(game, "player", None)
-        if player is not None and hasattr(player, "pos"):
-            self._player_pos = self.world_to_map(player.pos.x, player.pos.y)
+        horde = getattr(game, "horde", None)
+        n = horde.count if horde is not None else 0
+        if n:
+            alive = horde.alive[:n]
+            wx, wy = horde.pos[:n, 0][alive], horde.pos[:n, 1][alive]
         else:
-            self._player_pos = (self.margin + self.width // 2, self.margin + self.height // 2)
+            wx = wy = np.empty(0)
+        upgrades = getattr(game, "upgrades", ())
+        ups = np.array([(u.pos.x, u.pos.y) for u in upgrades], dtype=np.float64).reshape(-1, 2)
 
-        # zombies
-        zs = []
+        self.heatmap = wx.size > MINIMAP_HEATMAP_THRESHOLD
+        rgb = pygame.surfarray.pixels3d(self.surface)
+        alpha = pygame.surfarray.pixels_alpha(self.surface)
         try:
-            for z in getattr(game, "zombies", []):
-                # ignorar si no tiene pos
-                if getattr(z, "dead", False):
-                    continue
-                if hasattr(z, "pos"):
-                    zs.append(self.world_to_map(z.pos.x, z.pos.y))
-        except Exception:
-            zs = []
-        self._zombie_positions = zs
-
-        # upgrades (no recogidos)
-        ups = []
-        try:
-            for u in getattr(game, "upgrades", []):
-                # asumo que las upgrades en group son las no recogidas
-                if hasattr(u, "pos"):
-                    ups.append(self.world_to_map(u.pos.x, u.pos.y))
-        except Exception:
-            ups = []
-        self._upgrade_positions = ups
+            # upgrades (azul) debajo de los zombies, como antes
+            ux, uy = self._map_coords(ups[:, 0], ups[:, 1])
+            self._stamp(rgb, alpha, ux, uy, self._upgrade_stamp, (60, 140, 255))
+            if not self.heatmap:
+                zx, zy = self._map_coords(wx, wy)
+                self._stamp(rgb, alpha, zx, zy, self._zombie_stamp, (220, 50, 50))
+        finally:
+            del rgb, alpha  # libera el bloqueo de la superficie
+        if self.heatmap:
+            self._draw_heatmap(wx, wy)
+
+        # jugador (verde, un poco más grande) con pequeña cruz
+        player = getattr(game, "player", None)
+        if player is not None and hasattr(player, "pos"):
+            px, py = self.world_to_map(player.pos.x, player.pos.y)
+        else:
+            px, py = (self.margin + self.width // 2, self.margin + self.height // 2)
+        pygame.draw.circle(self.surface, (80, 220, 80), (px, py), 4)
+        pygame.draw.line(self.surface, (0, 0, 0), (px - 3, py), (px + 3, py), 1)
+        pygame.draw.line(self.surface, (0, 0, 0), (px, py - 3), (px, py + 3), 1)
 
     def update_if_needed(self):
-        """Llama a recompute solo si pasó el intervalo."""
-        now = pygame.time.get_ticks()
-        if now - self._last_update_ms >= self.update_interval_ms:
-            self._recompute_positions()
+        """Recompone solo si pasó el intervalo (reloj de juego si existe)."""
+        game_time = getattr(self.game, "time", None)
+        now = game_time * 1000.0 if game_time is not None else pygame.time.get_ticks()
+        last = self._last_update_ms
+        if last is None or now < last or now - last >= self.update_interval_ms:
+            self._recompose()
             self._last_update_ms = now
 
     def draw(self, surface):
@@ -106,7 +182,6 @@ class MiniMap:
         self.update_if_needed()
 
         sw = surface.get_width()
-        sh = surface.get_height()
 
         # coordenadas de la esquina (posición final)
         if self.position == "topright":
@@ -117,53 +192,6 @@ class MiniMap:
             map_x = 12
             map_y = 12
 
-        # limpiar surface local
-        self.surface.fill((0, 0, 0, 0))
-
-        # fondo con ligero alpha
-        bg_surf = pygame.Surface((self.width + 2 * self.margin, self.height + 2 * self.margin), pygame.SRCALPHA)
-        bg_color = self.bg_color
-        if len(bg_color) == 4:
-            bg_surf.fill(bg_color)
-        else:
-            bg_surf.fill((*bg_color, 200))
-        self.surface.blit(bg_surf, (0, 0))
-
-        # borde
-        pygame.draw.rect(
-            self.surface,
-            self.border_color,
-            (0, 0, self.width + 2 * self.margin, self.height + 2 * self.margin),
-            width=2,
-            border_radius=6,
-        )
-
-        # inner rect (donde están los puntos)
-        inner_rect = pygame.Rect(self.margin, self.margin, self.width, self.height)
-        # opcional borde interior sutil
-        pygame.draw.rect(self.surface, (40, 40, 40), inner_rect, width=1)
-
-        # dibujar upgrades (azul pequeños)
-        for ux, uy in self._upgrade_positions:
-            # pequeños puntos azules
-            pygame.draw.circle(self.surface, (60, 140, 255), (ux, uy), 3)
-
-        # dibujar zombies (rojo)
-        for zx, zy in self._zombie_positions:
-            pygame.draw.circle(self.surface, (220, 50, 50), (zx, zy), 3)
-
-        # dibujar jugador (verde, un poco más grande)
-        px, py = self._player_pos
-        pygame.draw.circle(self.surface, (80, 220, 80), (px, py), 4)
-
-        # Opcional: pequeña cruz en el jugador
-        try:
-            pygame.draw.line(self.surface, (0, 0, 0), (px - 3, py), (px + 3, py), 1)
-            pygame.draw.line(self.surface, (0, 0, 0), (px, py - 3), (px, py + 3), 1)
-        except Exception:
-            pass
-
-        # Blit final en la pantalla
         surface.blit(self.surface, (map_x, map_y))
 
         # guardar último rect si es necesario para debugging o clicks
@@ -0,0 +1,76 @@
+import pygame
+from settings import ZOMBIE_BAR_STEPS
+
+# Color del nivel según rareza
+RARITY_COLORS = {
+    "common": (255, 255, 255),
+    "uncommon": (50, 220, 50),
+    "rare": (50, 150, 255),
+    "epic": (180, 50, 255),
+    "legendary": (255, 180, 50),
+}
+BAR_HEIGHT = 6
+
+
+class ZombieOverlays:
+    """
+    Barras de vida y etiquetas de nivel de los zombies como blits cacheados.
+
+    - Etiquetas "Lv N" renderizadas una vez por (nivel, rareza).
+    - Por cada ancho de barra, una tira de ZOMBIE_BAR_STEPS + 1 superficies
+      (marco, fondo y relleno ya dibujados); la vida se ajusta al paso más cercano.
+    Todo el overlay de la vista se envía en un único Surface.blits.
+    """
+
+    def __init__(self, font):
+        self.font = font
+        self._labels = {}  # (level, rarity) -> (surface, dx, dy)
+        self._bars = {}    # ancho -> [superficie por paso]
+
+    def _label(self, level, rarity):
+        key = (level, rarity)
+        entry = self._labels.get(key)
+        if entry is None:
+            surf = self.font.render(f"Lv {level}", True, RARITY_COLORS.get(rarity, (255, 255, 255)))
+            entry = (surf, surf.get_width() // 2, surf.get_height() // 2)
+            self._labels[key] = entry
+        return entry
+
+    def _bar_strip(self, bar_w):
+        strip = self._bars.get(bar_w)
+        if strip is None:
+            strip = []
+            for step in range(ZOMBIE_BAR_STEPS + 1):
+                ratio = step / ZOMBIE_BAR_STEPS
+                surf = pygame.Surface((bar_w + 2, BAR_HEIGHT + 2))
+                surf.fill((0, 0, 0))
+                surf.fill((60, 60, 60), (1, 1, bar_w, BAR_HEIGHT))
+                col = (220, 40, 40) if ratio < 0.3 else (255, 180, 40) if ratio < 0.6 else (60, 220, 60)
+                surf.fill(col, (1, 1, int(bar_w * ratio), BAR_HEIGHT))
+                strip.append(surf)
+            self._bars[bar_w] = strip
+        return strip
+
+    def draw(self, surface, zombies, ox, oy):
+        """`zombies` ya recortados a la vista (Horde.sync_visible); (ox, oy) = offset entero de cámara."""
+        steps = ZOMBIE_BAR_STEPS
+        batch = []
+        append = batch.append
+        for z in zombies:
+            if z.dead:
+                continue
+            r = z.rect
+            cx = r.centerx - ox
+
+            # Barra de vida (vida máxima = la base del tipo, como antes)
+            max_hp = z.TYPE_STATS[z.type]["hp"]
+            ratio = z.hp / max_hp if max_hp else 0.0
+            step = 0 if ratio <= 0 else steps if ratio >= 1 else int(ratio * steps + 0.5)
+            bar_w = max(24, r.width // 2)
+            append((self._bar_strip(bar_w)[step], (cx - bar_w // 2 - 1, r.bottom - oy + 3)))
+
+            # Nivel sobre la cabeza
+            label, dx, dy = self._label(z.level, z.rarity)
+            append((label, (cx - dx, r.top - oy - 10 - dy)))
+        surface.blits(batch, False)
+        return len(batch) // 2
@@ -28,10 +28,12 @@ class PauseMenu:
         ]
         self.buttons = Buttons(screen, buttons_list)
 
+        # Oscurecido de fondo (se crea una vez)
+        self.overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+        self.overlay.fill((0,0,0,100))
+
     def draw(self):
-        overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        overlay.fill((0,0,0,100))
-        self.screen.blit(overlay, (0,0))
+        self.screen.blit(self.overlay, (0,0))
 
         if self.image:
             rect = self.image.get_rect(center=(self.screen_width//2, self.screen_height//2))
@@ -43,6 +45,7 @@ class PauseMenu:
         clicked = self.buttons.handle_click(mouse_pos)
         if clicked == "Resume Game":
             game_instance.paused = False
+            game_instance.audio.resume()
             game_instance.current_cursor = game_instance.cursor_game
         elif clicked == "Settings":
             print("[DEBUG] Abrir ajustes (pendiente)")
@@ -1,5 +1,5 @@
 import pygame
-from utils.helpers import load_image_safe
+from utils.helpers import load_image_safe, key_background, render_label
 
 class UIManager:
     """Controla las tarjetas de estadísticas del jugador (HUD extendido con imagen y barras)."""
@@ -7,6 +7,7 @@ class UIManager:
     def __init__(self, player):
         self.player = player
         self.visible = False  # Visibilidad de la tarjeta
+        self._overlay = None  # Fondo translúcido (se crea al primer dibujado)
 
         # Cargar fondo de tarjeta
         self.card_bg = load_image_safe("ui/card_bg.png")
@@ -29,15 +30,7 @@ class UIManager:
 
     def _clear_white_background(self):
         """Quita los pixeles blancos claros de la imagen del jugador."""
-        img = self.player_image
-        img.lock()
-        for x in range(img.get_width()):
-            for y in range(img.get_height()):
-                r, g, b, a = img.get_at((x, y))
-                if (r + g + b) / 3 > 200 and a > 0:
-                    img.set_at((x, y), (0, 0, 0, 0))
-        img.unlock()
-        self.player_image = img
+        self.player_image = key_background(self.player_image, threshold=200)
 
     # ==================================================
     # Mostrar / ocultar tarjeta
@@ -63,9 +56,10 @@ class UIManager:
             return
 
         # Fondo translúcido
-        overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 140))
-        screen.blit(overlay, (0, 0))
+        if self._overlay is None or self._overlay.get_size() != (screen_width, screen_height):
+            self._overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+            self._overlay.fill((0, 0, 0, 140))
+        screen.blit(self._overlay, (0, 0))
 
         # Fondo de la tarjeta
         card_rect = self.card_bg.get_rect(center=(screen_width // 2, screen_height // 2))
@@ -108,7 +102,7 @@ class UIManager:
         ]
 
         for i, (label, value) in enumerate(stats):
-            text = font.render(f"{label}: {value}", True, (255, 255, 255))
+            text = render_label(font, f"{label}: {value}", (255, 255, 255))
             screen.blit(text, (stats_x, stats_y + i * spacing))
 
         # Barras de vida y escudo
@@ -124,7 +118,7 @@ class UIManager:
         shield_ratio = shield / max(1, max_shield)
         pygame.draw.rect(screen, (100, 180, 255), (stats_x, bar_y_offset + 25, int(bar_width * shield_ratio), bar_height), border_radius=10)
 
-        hp_text = font.render("VIDA", True, (255, 255, 255))
-        shield_text = font.render("ESCUDO", True, (180, 220, 255))
+        hp_text = render_label(font, "VIDA", (255, 255, 255))
+        shield_text = render_label(font, "ESCUDO", (180, 220, 255))
         screen.blit(hp_text, (stats_x + bar_width + 20, bar_y_offset - 2))
         screen.blit(shield_text, (stats_x + bar_width + 20, bar_y_offset + 25))
@@ -1,10 +1,32 @@
 # utils/helpers.py
+import io
 import pygame
 import os
-from settings import ASSETS_IMAGES
+import numpy as np
+from collections import OrderedDict
+from settings import ASSETS_IMAGES, SPRITE_CACHE_MAX_MB, IMAGE_CACHE_MAX_MB, ROTATION_STEPS, LABEL_CACHE_SIZE
 
 def load_image_safe(path):
-    """Carga imágenes sin crashear si no existen"""
+    """
+    Carga imágenes sin crashear si no existen. Cada archivo se decodifica una
+    sola vez (image_cache, lo llena core/assets.py en la pantalla de carga); la
+    superficie es compartida: transformarla antes de modificarla.
+    """
+    key = os.path.normpath(path)
+    sprite_registry.note_source(key)
+    return image_cache.get(key, lambda: _decode_image(path))
+
+
+def cache_image(path, surface):
+    """Guarda en image_cache una imagen ya decodificada y convertida (core/assets.py)."""
+    image_cache.put(os.path.normpath(path), surface)
+
+
+def is_image_cached(path):
+    return os.path.normpath(path) in image_cache
+
+
+def _decode_image(path):
     full = os.path.join(ASSETS_IMAGES, path)
     if not os.path.exists(full):
         print(f"[DEBUG] No se encontró {full}")
@@ -17,24 +39,116 @@ def load_image_safe(path):
 
 
 def load_font(font_name, size, fallback_name="Arial"):
-    """Carga una fuente personalizada o usa fallback del sistema"""
-    font_path = os.path.join("assets", "fonts", font_name)
-    
-    if os.path.exists(font_path):
+    """Carga una fuente personalizada (cacheada) o usa fallback del sistema"""
+    return get_font(os.path.join("assets", "fonts", font_name), size, fallback_name)
+
+
+# Fuentes compartidas: el TTF se abre una sola vez por (ruta, tamaño)
+_fonts = {}       # (path, size) -> Font
+_font_keys = {}   # id(Font) -> (path, size), para la caché de etiquetas
+_font_files = {}  # ruta del TTF -> bytes ya leídos (core/assets.py); cada tamaño nuevo no toca el disco
+
+
+def cache_font_file(path, data):
+    _font_files[os.path.normpath(path)] = data
+
+
+def is_font_file_cached(path):
+    return os.path.normpath(path) in _font_files
+
+
+def get_font(path, size, fallback_name="Arial"):
+    """Fuente compartida por (ruta, tamaño); si no existe se usa `fallback_name` del sistema."""
+    key = (path, size)
+    font = _fonts.get(key)
+    if font is not None:
+        return font
+
+    data = _font_files.get(os.path.normpath(path)) if path else None
+    if data is not None or (path and os.path.exists(path)):
         try:
-            return pygame.font.Font(font_path, size)
+            font = pygame.font.Font(io.BytesIO(data) if data is not None else path, size)
         except Exception as e:
-            print(f"[WARN] Error al cargar fuente {font_name}: {e}. Usando {fallback_name}.")
-            return pygame.font.SysFont(fallback_name, size)
+            print(f"[WARN] Error al cargar fuente {path}: {e}. Usando {fallback_name}.")
     else:
-        print(f"[WARN] Fuente {font_name} no encontrada. Usando {fallback_name}.")
-        return pygame.font.SysFont(fallback_name, size)
+        print(f"[WARN] Fuente {path} no encontrada. Usando {fallback_name}.")
+    if font is None:
+        font = pygame.font.SysFont(fallback_name, size)
+
+    _fonts[key] = font
+    _font_keys[id(font)] = key  # las fuentes cacheadas no se liberan, el id es estable
+    return font
+
+
+class LabelCache:
+    """
+    Textos ya renderizados, clave (texto, fuente, tamaño, color), con descarte LRU.
+
+    Solo cachea fuentes obtenidas con get_font/load_font; con cualquier otra
+    fuente renderiza directamente. Las superficies devueltas son compartidas y
+    no deben modificarse.
+    """
+
+    def __init__(self, max_entries=LABEL_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        font_key = _font_keys.get(id(font))
+        if font_key is None:
+            return font.render(text, antialias, color)
+
+        key = (text, font_key, tuple(color), antialias)
+        surf = self._entries.get(key)
+        if surf is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self._entries[key] = surf
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self._entries.clear()
+
+
+label_cache = LabelCache()
+
+
+def render_label(font, text, color, antialias=True):
+    """Atajo a label_cache.render."""
+    return label_cache.render(font, text, color, antialias)
+
+
+# Sonidos ya decodificados por ruta; el objeto Sound es compartido (set_volume afecta a todos)
+_sounds = {}
+
+
+def cache_sound(path, sound):
+    _sounds[os.path.normpath(path)] = sound
+
+
+def is_sound_cached(path):
+    return os.path.normpath(path) in _sounds
 
 
 def load_sound(sound_path, volume=1.0):
     """Carga un efecto de sonido con volumen ajustable"""
+    if not pygame.mixer.get_init():
+        return None  # Sin audio (p.ej. modo headless)
+
     full_path = os.path.join("assets", "sounds", sound_path)
-    
+    sound = _sounds.get(os.path.normpath(full_path))
+    if sound is not None:
+        sound.set_volume(volume)
+        return sound
+
     if not os.path.exists(full_path):
         print(f"[WARN] Sonido no encontrado: {full_path}")
         return None
@@ -42,6 +156,7 @@ def load_sound(sound_path, volume=1.0):
     try:
         sound = pygame.mixer.Sound(full_path)
         sound.set_volume(volume)
+        cache_sound(full_path, sound)
         return sound
     except Exception as e:
         print(f"[ERROR] Error al cargar sonido {sound_path}: {e}")
@@ -82,7 +197,7 @@ def set_music_volume(volume):
         print(f"[ERROR] Error al ajustar volumen: {e}")
 
 
-def load_cursor(path, size=(32, 32), threshold=160):
+def load_cursor(path, size=(32, 32), threshold=160, alpha_cutoff=80):
     """Carga un cursor personalizado limpiando fondos claros"""
     full_path = os.path.join(ASSETS_IMAGES, path)
     
@@ -91,33 +206,217 @@ def load_cursor(path, size=(32, 32), threshold=160):
         return None
     
     try:
-        img = pygame.image.load(full_path).convert_alpha()
+        img = load_image_safe(path)
+        if img is None:
+            return None
         img = pygame.transform.scale(img, size)
-        clean = pygame.Surface(img.get_size(), pygame.SRCALPHA)
-        img.lock()
-        for x in range(img.get_width()):
-            for y in range(img.get_height()):
-                r, g, b, a = img.get_at((x, y))
-                if (r + g + b) / 3 > threshold or a < 80:
-                    img.set_at((x, y), (0, 0, 0, 0))
-        img.unlock()
-        clean.blit(img, (0, 0))
-        return clean
+        return key_background(img, threshold, alpha_cutoff)
     except Exception as e:
         print(f"[ERROR] Error al cargar cursor {full_path}: {e}")
         return None
 
 
+def key_background(image, threshold=200, alpha_cutoff=0):
+    """
+    Devuelve una copia SRCALPHA de `image` con los píxeles de fondo en transparente.
+
+    Un píxel se considera fondo si su brillo medio (r+g+b)/3 supera `threshold`
+    o si su alpha es menor que `alpha_cutoff`. Trabaja sobre la superficie
+    completa con vistas NumPy (surfarray) en lugar de recorrer píxel a píxel.
+    La imagen original no se modifica.
+    """
+    rgb = pygame.surfarray.array3d(image)
+    mask = rgb.sum(axis=2, dtype=np.uint16) > threshold * 3
+    if alpha_cutoff > 0:
+        mask |= pygame.surfarray.array_alpha(image) < alpha_cutoff
 
-def clean_image_background(image, threshold=200):
-    """Elimina fondos claros de una imagen (útil para sprites)"""
     clean = pygame.Surface(image.get_size(), pygame.SRCALPHA)
-    image.lock()
-    for x in range(image.get_width()):
-        for y in range(image.get_height()):
-            r, g, b, a = image.get_at((x, y))
-            if (r + g + b) / 3 > threshold and a > 0:
-                image.set_at((x, y), (0, 0, 0, 0))
-    image.unlock()
     clean.blit(image, (0, 0))
-    return clean
\ No newline at end of file
+    if mask.any():
+        pixels = pygame.surfarray.pixels3d(clean)
+        alpha = pygame.surfarray.pixels_alpha(clean)
+        pixels[mask] = 0
+        alpha[mask] = 0
+        del pixels, alpha  # libera el lock de la superficie
+    return clean
+
+
+def clean_image_background(image, threshold=200):
+    """Elimina fondos claros de una imagen (útil para sprites)"""
+    return key_background(image, threshold)
+
+
+# ===================================================
+# REGISTRO CENTRAL DE SPRITES
+# ===================================================
+
+class SpriteRegistry:
+    """
+    Caché global de superficies ya procesadas (escaladas, limpiadas, volteadas...).
+
+    Las claves son tuplas (path, size, variant). Las entidades solo guardan
+    referencias a las superficies devueltas y nunca deben modificarlas; si
+    necesitan una versión distinta (alpha, rotación) la piden como otra variante.
+    Cuando se supera el límite de memoria se descartan las entradas menos usadas (LRU).
+
+    Cada entrada recuerda de qué imágenes de ASSETS_IMAGES sale (load_image_safe
+    llamado durante su builder, también a través de otras entradas): es lo que
+    core/assetpack.py usa para saber si una entrada horneada está obsoleta.
+    """
+
+    def __init__(self, max_bytes=SPRITE_CACHE_MAX_MB * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (surface, bytes, rutas de origen)
+        self._building = []            # rutas de origen de los builders en curso (anidados)
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def _surface_bytes(cls, surface):
+        """Tamaño aproximado en memoria (admite listas de superficies, p.ej. frames)."""
+        if surface is None:
+            return 0
+        if isinstance(surface, (list, tuple)):
+            return sum(cls._surface_bytes(s) for s in surface)
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def get(self, key, builder):
+        """Devuelve la superficie (o lista de superficies) cacheada para `key` o la construye con `builder()`."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            if self._building:
+                self._building[-1].update(entry[2])
+            return entry[0]
+
+        self.misses += 1
+        sources = set()
+        self._building.append(sources)
+        try:
+            surface = builder()
+        finally:
+            self._building.pop()
+        self.put(key, surface, sources)
+        return surface
+
+    def put(self, key, surface, sources=()):
+        """Guarda una entrada ya construida (p.ej. leída de un paquete horneado)."""
+        sources = frozenset(sources)
+        if self._building:
+            self._building[-1].update(sources)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes_used -= old[1]
+        size = self._surface_bytes(surface)
+        self._entries[key] = (surface, size, sources)
+        self.bytes_used += size
+        self._evict()
+
+    def note_source(self, path):
+        """Apunta `path` como origen de las entradas que se están construyendo."""
+        if self._building:
+            self._building[-1].add(path)
+
+    def items(self):
+        """(key, superficie, rutas de origen) de todas las entradas, de la menos a la más usada."""
+        return [(key, surface, sources) for key, (surface, _, sources) in self._entries.items()]
+
+    def _evict(self):
+        while self.bytes_used > self.max_bytes and len(self._entries) > 1:
+            _, (_, size, _) = self._entries.popitem(last=False)
+            self.bytes_used -= size
+            self.evictions += 1
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes_used = 0
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes_used,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+sprite_registry = SpriteRegistry()
+
+# Imágenes originales decodificadas, clave = ruta relativa a ASSETS_IMAGES (ver load_image_safe)
+image_cache = SpriteRegistry(IMAGE_CACHE_MAX_MB * 1024 * 1024)
+
+
+def _build_sprite(path, size, variant):
+    if variant == "flip_x":
+        base = get_sprite(path, size, "clean")
+        return pygame.transform.flip(base, True, False) if base else None
+
+    image = load_image_safe(path)
+    if image is None:
+        return None
+    if size is not None:
+        image = pygame.transform.scale(image, size)
+    if variant == "clean":
+        image = clean_image_background(image)
+    elif variant != "raw":
+        raise ValueError(f"Variante de sprite desconocida: {variant}")
+    return image
+
+
+def get_sprite(path, size=None, variant="clean"):
+    """
+    Devuelve un sprite compartido del registro global.
+
+    variant:
+      - "raw":    solo escalado
+      - "clean":  escalado + fondo claro eliminado
+      - "flip_x": "clean" volteado horizontalmente
+    Devuelve None si la imagen no existe (el llamador decide el placeholder).
+    """
+    size = tuple(size) if size is not None else None
+    return sprite_registry.get((path, size, variant), lambda: _build_sprite(path, size, variant))
+
+
+def get_rotations(key, builder, steps=ROTATION_STEPS):
+    """
+    Lista compartida de `steps` rotaciones (0..360°, antihorario como transform.rotate)
+    de la imagen que devuelve `builder()`. Se construye una vez por clave y número
+    de pasos; None si la imagen no existe.
+    """
+    def build():
+        image = builder()
+        if image is None:
+            return None
+        return [pygame.transform.rotate(image, i * 360.0 / steps) for i in range(steps)]
+    return sprite_registry.get((key, steps, "rotations"), build)
+
+
+def rotation_index(angle, steps=ROTATION_STEPS):
+    """Índice de la rotación precalculada más cercana a `angle` (grados)."""
+    return int(round(angle * steps / 360.0)) % steps
+
+
+def get_alpha_steps(key, builder, steps):
+    """
+    Lista compartida de `steps` copias de la imagen de `builder()` con alpha
+    decreciente: índice 0 opaco, último casi transparente. None si no hay imagen.
+    """
+    def build():
+        image = builder()
+        if image is None:
+            return None
+        frames = []
+        for i in range(steps):
+            frame = image.copy()
+            frame.set_alpha(int(255 * (1 - i / steps)))
+            frames.append(frame)
+        return frames
+    return sprite_registry.get((key, steps, "alpha_steps"), build)